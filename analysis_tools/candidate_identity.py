@@ -0,0 +1,521 @@
+"""
+Candidate Identity Resolution
+
+Assigns one deterministic person_id to every record of the same politician across
+the house, senate and congressional race files, the statewide results and
+the TEC campaign finance table. The election files carry surnames only
+("Talarico"); the finance table carries "Last Suffix, First (Title)" and a
+TEC filer_id.
+
+Records are linked in four passes, each compared only within a block:
+1. Seat chains: same level, district, party and normalized surname
+2. Finance filers: every finance record of one TEC filer_id
+3. Finance -> election: same level, district (or statewide office) and
+   year, with a similar surname
+4. Cross-level moves (house -> senate -> congress -> statewide): same
+   party and surname prefix, similar surname, no two races in the same
+   year, compatible first names where the finance table gives them, and
+   overlapping geography when VTD plan assignments are available.
+   Without assignments, the pair must share a first name (from finance)
+   or have a surname no other candidate carries. Either way, a pair is
+   only linked when each side is the only candidate at the other's level.
+
+Surname similarity is the cosine of character-trigram vectors, computed
+for all candidate pairs of a pass at once with one sparse product.
+"""
+
+import sys
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+import hashlib
+import os
+import unicodedata
+
+import pandas as pd
+import numpy as np
+import scipy.sparse as sp
+
+from fact_paths import RACE_FILES, RACE_PLANS, statewide_file
+from instrumentation import instrumented, stage
+
+FINANCE_FILE = 'texas_election_data/campaign_finance/candidate_spending_2018_2024.csv'
+ASSIGNMENT_DIR = 'texas_election_data/vtd_data/assignments'
+
+LEVELS = ['house', 'senate', 'congressional', 'statewide']
+
+# TEC office codes -> (level, office as named in the results files)
+FINANCE_OFFICES = {
+    'STATEREP': ('house', 'State Representative'),
+    'STATESEN': ('senate', 'State Senator'),
+    'GOVERNOR': ('statewide', 'Governor'),
+    'LTGOVERNOR': ('statewide', 'Lieutenant Governor'),
+    'ATTYGEN': ('statewide', 'Attorney General'),
+    'COMPTROLLER': ('statewide', 'Comptroller')
+}
+
+NAME_SUFFIXES = r'\b(jr|sr|ii|iii|iv|esq)\b'
+
+
+def normalize_names(names):
+    """
+    Split raw names into a surname key and first-name tokens
+
+    "Crockett Esq., Jasmine F. (Ms.)" -> ('crockett', 'jasmine f')
+    "Gervin-Hawkins" -> ('gervinhawkins', '')
+    Accents, titles in parentheses, suffixes and punctuation are dropped.
+
+    Returns (surname Series, given-name Series of space-separated tokens).
+    """
+    text = names.fillna('').astype(str).map(
+        lambda name: unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode()
+    )
+    text = text.str.lower().str.replace(r'\(.*?\)', ' ', regex=True)
+
+    parts = text.str.split(',', n=1, expand=True).reindex(columns=[0, 1])
+    surname = (
+        parts[0].fillna('')
+        .str.replace(NAME_SUFFIXES, ' ', regex=True)
+        .str.replace(r'[^a-z]', '', regex=True)
+    )
+    given = (
+        parts[1].fillna('')
+        .str.replace(NAME_SUFFIXES, ' ', regex=True)
+        .str.replace(r'[^a-z\s]', ' ', regex=True)
+        .str.split()
+        .str.join(' ')
+    )
+    return surname, given
+
+
+def trigram_matrix(keys):
+    """L2-normalized sparse (keys x trigrams) matrix of padded character trigrams"""
+    vocabulary = {}
+    rows, cols = [], []
+    for i, key in enumerate(keys):
+        padded = f'  {key} '
+        for j in range(len(padded) - 2):
+            rows.append(i)
+            cols.append(vocabulary.setdefault(padded[j:j + 3], len(vocabulary)))
+
+    matrix = sp.csr_matrix(
+        (np.ones(len(rows)), (rows, cols)), shape=(len(keys), max(len(vocabulary), 1))
+    )
+    matrix.sum_duplicates()
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    return sp.diags(1 / np.where(norms > 0, norms, 1)) @ matrix
+
+
+def name_similarity(left, right):
+    """
+    Trigram cosine similarity of aligned surname arrays
+
+    All pairs are scored with one sparse element-wise product.
+    """
+    left, right = np.asarray(left, dtype=str), np.asarray(right, dtype=str)
+    if len(left) == 0:
+        return np.array([])
+
+    keys, codes = np.unique(np.concatenate([left, right]), return_inverse=True)
+    matrix = trigram_matrix(keys)
+    a, b = codes[:len(left)], codes[len(left):]
+    return np.asarray(matrix[a].multiply(matrix[b]).sum(axis=1)).ravel()
+
+
+def given_names_compatible(left, right):
+    """
+    True unless both sides have first names that conflict
+
+    Names conflict when they share no name or initial, or when both carry
+    middle initials and none match ("Andrew D." vs "Andrew P.").
+    """
+    if not left or not right:
+        return True
+    left, right = set(left.split()), set(right.split())
+    left_initials = {t for t in left if len(t) == 1}
+    right_initials = {t for t in right if len(t) == 1}
+    if left_initials and right_initials and not left_initials & right_initials:
+        return False
+    return bool(left & right) or bool({t[0] for t in left} & {t[0] for t in right})
+
+
+def share_first_name(left, right):
+    """True if two first-name strings share a full name (not just an initial)"""
+    return bool({t for t in left.split() if len(t) > 1} & {t for t in right.split() if len(t) > 1})
+
+
+def load_district_overlaps(assignment_dir=ASSIGNMENT_DIR):
+    """
+    (plan, district) pairs of different plans that share at least one VTD
+
+    Built from the VTD -> district assignment CSVs used by vtd_crosswalk.py
+    (columns cntyvtd, district). Returns None when they are not available.
+    """
+    plans = sorted({plan for years in RACE_PLANS.values() for plan in years.values()})
+    tables = []
+    for plan in plans:
+        path = os.path.join(assignment_dir, f'{plan}.csv')
+        if os.path.exists(path):
+            table = pd.read_csv(path, dtype={'cntyvtd': str, 'district': str}, usecols=['cntyvtd', 'district'])
+            tables.append(table.assign(plan=plan))
+
+    if len(tables) < 2:
+        return None
+
+    assignments = pd.concat(tables, ignore_index=True)
+    pairs = assignments.merge(assignments, on='cntyvtd', suffixes=('_a', '_b'))
+    pairs = pairs[pairs['plan_a'] != pairs['plan_b']]
+    return set(zip(pairs['plan_a'], pairs['district_a'], pairs['plan_b'], pairs['district_b']))
+
+
+class _UnionFind:
+    """Disjoint sets over record positions"""
+
+    def __init__(self, n):
+        self.parent = np.arange(n)
+
+    def find(self, i):
+        root = i
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[i] != root:
+            self.parent[i], i = root, self.parent[i]
+        return root
+
+    def union(self, i, j):
+        a, b = self.find(i), self.find(j)
+        if a != b:
+            self.parent[max(a, b)] = min(a, b)
+
+    def union_groups(self, codes):
+        """Union every position with the first position sharing its code (codes < 0 skipped)"""
+        first = {}
+        for i, code in enumerate(codes):
+            if code < 0:
+                continue
+            if code in first:
+                self.union(first[code], i)
+            else:
+                first[code] = i
+
+    def labels(self):
+        return np.array([self.find(i) for i in range(len(self.parent))])
+
+
+class CandidateIdentityIndex:
+    """Deterministic person_id for every candidate record across levels and sources"""
+
+    def __init__(self, include_finance=True, min_similarity=0.8, district_overlaps=None):
+        """
+        Load every source and resolve identities
+
+        Parameters:
+        - include_finance: Link TEC campaign finance records (adds first
+          names and filer_id, which connect a filer's races across offices)
+        - min_similarity: Minimum trigram cosine for two surnames to match
+        - district_overlaps: Set of (plan_a, district_a, plan_b, district_b)
+          geographic overlaps; default loads them from VTD assignments if present
+        """
+        self.min_similarity = min_similarity
+        self.district_overlaps = (
+            district_overlaps if district_overlaps is not None else load_district_overlaps()
+        )
+
+        self.records = self._load_records(include_finance)
+        with stage('aggregate', 'CandidateIdentityIndex', rows=len(self.records)):
+            self._resolve()
+
+        self._by_race = {
+            key: person_id for key, person_id in zip(
+                zip(self.records['level'], self.records['year'],
+                    self.records['district'], self.records['candidate']),
+                self.records['person_id']
+            )
+        }
+
+        n_cross = (self.persons()['n_levels'] > 1).sum()
+        print(f"Resolved {len(self.records):,} records into {self.records['person_id'].nunique():,} "
+              f"people ({n_cross} with races at more than one level)")
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    @instrumented('load', 'CandidateIdentityIndex')
+    def _load_records(include_finance):
+        """All candidate records in one frame (source, level, year, district, office, candidate, party)"""
+        frames = []
+        for level, paths in RACE_FILES.items():
+            races = pd.concat([pd.read_csv(path) for path in paths], ignore_index=True)
+            frames.append(races.assign(source=level, level=level))
+
+        path = statewide_file('house')
+        if path:
+            statewide = pd.read_csv(path)
+            statewide = statewide[statewide['district'].astype(str) == 'STATE']
+            frames.append(statewide.assign(source='statewide', level='statewide'))
+
+        records = pd.concat(frames, ignore_index=True)
+        records = records[records['candidate'].notna() & (records['candidate'] != 'Write-In')]
+        records['district'] = records['district'].astype(str)
+        records = records.drop_duplicates(['level', 'year', 'district', 'office', 'candidate', 'party'])
+        records = records[['source', 'level', 'year', 'district', 'office', 'candidate', 'party', 'votes', 'percentage']]
+        records['filer_id'] = pd.NA
+
+        if include_finance and os.path.exists(FINANCE_FILE):
+            finance = pd.read_csv(FINANCE_FILE, dtype={'district': str})
+            finance = finance[finance['office'].isin(FINANCE_OFFICES)]
+            mapped = finance['office'].map(FINANCE_OFFICES)
+            finance = pd.DataFrame({
+                'source': 'finance',
+                'level': mapped.str[0],
+                'year': finance['year'].astype(int),
+                'district': np.where(
+                    mapped.str[0] == 'statewide', 'STATE',
+                    finance['district'].str.extract(r'(\d+)', expand=False).fillna('')
+                ),
+                'office': mapped.str[1],
+                'candidate': finance['candidate_name'],
+                'filer_id': finance['filer_id']
+            }).drop_duplicates(['filer_id', 'level', 'year', 'district', 'office'])
+            records = pd.concat([records, finance], ignore_index=True)
+
+        records['year'] = records['year'].astype(int)
+        records['surname'], records['given'] = normalize_names(records['candidate'])
+        # Plan the seat was contested under (2018/2020 House: PLANH358)
+        records['plan'] = [
+            RACE_PLANS.get(level, {}).get(year)
+            for level, year in zip(records['level'], records['year'])
+        ]
+        return records[records['surname'] != ''].reset_index(drop=True)
+
+    # ------------------------------------------------------------------
+    # Resolution
+    # ------------------------------------------------------------------
+
+    def _resolve(self):
+        records = self.records
+        is_election = (records['source'] != 'finance').to_numpy()
+        sets = _UnionFind(len(records))
+
+        # 1. Seat chains
+        seat = records.groupby(['level', 'district', 'party', 'surname'], dropna=False).ngroup().to_numpy()
+        sets.union_groups(np.where(is_election, seat, -1))
+
+        # 2. Finance filers
+        filer = records['filer_id'].astype('Int64').fillna(-1).to_numpy(dtype=np.int64)
+        sets.union_groups(filer)
+
+        # 3. Finance -> election records of the same race
+        finance = records[~is_election].reset_index()
+        election = records[is_election].reset_index()
+        pairs = finance.merge(election, on=['level', 'district', 'year', 'office'], suffixes=('_f', '_e'))
+        if not pairs.empty:
+            pairs['similarity'] = name_similarity(pairs['surname_f'], pairs['surname_e'])
+            pairs = pairs[pairs['similarity'] >= self.min_similarity]
+            # Finance has no party: skip races with two matching candidates,
+            # and candidates claimed by two different filers
+            unique = (
+                (pairs.groupby('index_f')['index_e'].transform('size') == 1) &
+                (pairs.groupby('index_e')['filer_id_f'].transform('nunique') == 1)
+            )
+            for i, j in zip(pairs.loc[unique, 'index_f'], pairs.loc[unique, 'index_e']):
+                sets.union(i, j)
+
+        records['cluster'] = sets.labels()
+
+        # 4. Cross-level moves between clusters
+        for i, j in self._cross_level_links():
+            sets.union(i, j)
+
+        records['cluster'] = sets.labels()
+        records['person_id'] = self._person_ids()
+        self.records = records.drop(columns='cluster')
+
+    def _cluster_table(self):
+        """One row per cluster: party, surname, levels, years, first names, seats"""
+        records = self.records
+        election = records[records['source'] != 'finance']
+
+        clusters = election.groupby('cluster').agg(
+            party=('party', lambda p: p.mode().iloc[0] if p.notna().any() else None),
+            surname=('surname', lambda s: s.mode().iloc[0]),
+            levels=('level', lambda s: frozenset(s)),
+            years=('year', lambda s: frozenset(s)),
+            seats=('plan', lambda s: frozenset(zip(s, election.loc[s.index, 'district'])))
+        )
+        given = records[records['given'] != ''].groupby('cluster')['given'].agg(
+            lambda g: ' '.join(sorted(set(' '.join(g).split())))
+        )
+        clusters['given'] = given.reindex(clusters.index).fillna('')
+        clusters['surname_count'] = clusters.groupby('surname')['surname'].transform('size')
+        return clusters[clusters['party'].notna()].reset_index()
+
+    def _cross_level_links(self):
+        """Cluster pairs judged to be the same person at two different levels"""
+        clusters = self._cluster_table()
+        if clusters.empty:
+            return []
+
+        clusters['block'] = clusters['surname'].str[:2]
+        pairs = clusters.merge(clusters, on=['party', 'block'], suffixes=('_a', '_b'))
+        pairs = pairs[pairs['cluster_a'] < pairs['cluster_b']]
+        pairs = pairs[[a.isdisjoint(b) for a, b in zip(pairs['levels_a'], pairs['levels_b'])]]
+        pairs = pairs[[a.isdisjoint(b) for a, b in zip(pairs['years_a'], pairs['years_b'])]]
+        if pairs.empty:
+            return []
+
+        pairs = pairs[name_similarity(pairs['surname_a'], pairs['surname_b']) >= self.min_similarity]
+        pairs = pairs[[given_names_compatible(a, b) for a, b in zip(pairs['given_a'], pairs['given_b'])]]
+
+        if self.district_overlaps is not None:
+            pairs = pairs[[self._overlap(a, b) for a, b in zip(pairs['seats_a'], pairs['seats_b'])]]
+        else:
+            # No geography: need a shared first name, or a surname carried
+            # by no other candidate
+            shared_given = [share_first_name(a, b) for a, b in zip(pairs['given_a'], pairs['given_b'])]
+            rare = (pairs['surname_count_a'] <= 2) & (pairs['surname_count_b'] <= 2)
+            pairs = pairs[np.array(shared_given) | rare.to_numpy()]
+
+        # Ambiguous when a cluster has more than one candidate at the partner's level(s)
+        pairs['key_a'] = pairs['levels_a'].map(lambda s: ','.join(sorted(s)))
+        pairs['key_b'] = pairs['levels_b'].map(lambda s: ','.join(sorted(s)))
+        directed = pd.concat([
+            pairs[['cluster_a', 'key_b']].set_axis(['cluster', 'partner_levels'], axis=1),
+            pairs[['cluster_b', 'key_a']].set_axis(['cluster', 'partner_levels'], axis=1)
+        ])
+        counts = directed.groupby(['cluster', 'partner_levels']).size()
+
+        unambiguous = (
+            (counts.reindex(pd.MultiIndex.from_arrays([pairs['cluster_a'], pairs['key_b']])).to_numpy() == 1) &
+            (counts.reindex(pd.MultiIndex.from_arrays([pairs['cluster_b'], pairs['key_a']])).to_numpy() == 1)
+        )
+        pairs = pairs[unambiguous]
+        return list(zip(pairs['cluster_a'], pairs['cluster_b']))
+
+    def _overlap(self, seats_a, seats_b):
+        """True if any seat of one cluster shares geography with any seat of the other"""
+        for plan_a, district_a in seats_a:
+            for plan_b, district_b in seats_b:
+                if pd.isna(plan_a) or pd.isna(plan_b):
+                    return True  # Statewide races cover every district
+                if (plan_a, district_a, plan_b, district_b) in self.district_overlaps:
+                    return True
+        return False
+
+    def _person_ids(self):
+        """
+        Id per cluster: surname plus a hash of the cluster's earliest record
+
+        The same inputs always give the same ids. They are not guaranteed
+        to survive new data: an id changes when its cluster gains an
+        earlier record, or when new records merge or split clusters (e.g.
+        a new candidate makes a cross-level link ambiguous).
+        """
+        records = self.records
+        level_order = records['level'].map({level: i for i, level in enumerate(LEVELS)})
+        earliest = records.assign(
+            level_order=level_order,
+            is_finance=records['source'] == 'finance'
+        ).sort_values(['is_finance', 'year', 'level_order', 'district', 'candidate']).drop_duplicates('cluster')
+
+        ids = {
+            cluster: f"{surname}-" + hashlib.sha1(
+                f'{level}|{year}|{district}|{candidate}'.encode()
+            ).hexdigest()[:8]
+            for cluster, surname, level, year, district, candidate in zip(
+                earliest['cluster'], earliest['surname'], earliest['level'],
+                earliest['year'], earliest['district'], earliest['candidate']
+            )
+        }
+        return records['cluster'].map(ids)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def person_id(self, level, year, district, candidate):
+        """person_id of one race record (None if unknown)"""
+        return self._by_race.get((level, int(year), str(district), candidate))
+
+    def attach(self, df, level=None):
+        """
+        Add a person_id column to a frame of races
+
+        Parameters:
+        - df: Frame with year, district and candidate columns, plus a
+          district_level (or district_type) column unless level is given
+        - level: Level of every row ('house', 'senate', 'congressional', 'statewide')
+        """
+        if level is not None:
+            levels = pd.Series(level, index=df.index)
+        else:
+            levels = df['district_level'] if 'district_level' in df.columns else df['district_type']
+
+        ids = [
+            self._by_race.get((lvl, int(year), str(district), candidate))
+            for lvl, year, district, candidate in zip(levels, df['year'], df['district'], df['candidate'])
+        ]
+        return df.assign(person_id=ids)
+
+    def persons(self):
+        """One row per person: name, party, levels, seats and years"""
+        records = self.records
+        election = records[records['source'] != 'finance']
+        finance = records[records['source'] == 'finance']
+        level_rank = {level: i for i, level in enumerate(LEVELS)}
+
+        people = election.groupby('person_id').agg(
+            candidate=('candidate', lambda c: c.mode().iloc[0]),
+            party=('party', lambda p: p.mode().iloc[0] if p.notna().any() else None),
+            levels=('level', lambda s: ','.join(sorted(set(s), key=level_rank.get))),
+            n_levels=('level', 'nunique'),
+            n_races=('year', 'size'),
+            first_year=('year', 'min'),
+            last_year=('year', 'max')
+        )
+        full_names = finance.groupby('person_id')['candidate'].agg(lambda c: c.mode().iloc[0])
+        filer_ids = finance.groupby('person_id')['filer_id'].agg(
+            lambda f: ','.join(str(int(x)) for x in sorted(set(f)))
+        )
+        people['finance_name'] = full_names.reindex(people.index)
+        people['filer_ids'] = filer_ids.reindex(people.index)
+        return people.reset_index()
+
+    def search(self, name):
+        """Persons whose election or finance name contains a string (case-insensitive)"""
+        matches = self.records[self.records['candidate'].str.contains(name, case=False, regex=False)]
+        people = self.persons()
+        return people[people['person_id'].isin(matches['person_id'])].reset_index(drop=True)
+
+    def multi_level_careers(self, min_levels=2):
+        """Persons with races at min_levels or more levels, most recent first"""
+        people = self.persons()
+        people = people[people['n_levels'] >= min_levels]
+        return people.sort_values(['last_year', 'n_levels'], ascending=False).reset_index(drop=True)
+
+
+def main():
+    print("="*80)
+    print("CANDIDATE IDENTITY RESOLUTION")
+    print("="*80)
+
+    index = CandidateIdentityIndex()
+    if index.district_overlaps is None:
+        print("  (No VTD plan assignments found - cross-level links require an unambiguous name)")
+
+    print("\n" + "="*80)
+    print("CANDIDATES WITH RACES AT MORE THAN ONE LEVEL")
+    print("="*80)
+    print(index.multi_level_careers().to_string(index=False))
+
+    print("\n" + "="*80)
+    print("RECORDS FOR 'Alvarado'")
+    print("="*80)
+    alvarado = index.records[index.records['surname'] == 'alvarado']
+    print(alvarado[['person_id', 'source', 'level', 'year', 'district', 'office', 'candidate', 'party']].to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
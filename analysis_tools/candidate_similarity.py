@@ -0,0 +1,186 @@
+"""
+Candidate Similarity Search
+
+Finds statewide candidates whose geographic over/underperformance looked
+alike: "which candidates ran ahead and behind in the same districts as
+Allred 2024?"
+
+Every (year, office, candidate) becomes one row of a dense
+candidates x districts matrix of vs_statewide (district % - statewide %).
+Rows are normalized once, so:
+- Cosine similarity compares the raw residual patterns
+- Correlation compares the patterns after removing each row's mean
+Top-k queries are a single matrix-vector product plus argpartition, and the
+full pairwise matrix is a single matrix product (one BLAS call).
+"""
+
+import sys
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+import pandas as pd
+import numpy as np
+
+from fact_paths import PARTY_CODES, STATEWIDE_FILES
+from instrumentation import warn
+
+METRICS = ['correlation', 'cosine']
+
+
+class CandidateSimilarityIndex:
+    """Nearest-neighbor index over candidates' district residual vectors"""
+
+    def __init__(self, district_level='house', statewide_data=None, min_statewide_pct=5.0):
+        """
+        Build the residual matrix and normalized search matrices
+
+        Parameters:
+        - district_level: 'house', 'senate', or 'congressional'
+        - statewide_data: Optional pre-loaded frame in the standard results
+          format (with STATE rows); overrides district_level's file
+        - min_statewide_pct: Skip candidates below this statewide share
+          (minor candidates' residuals are mostly noise)
+        """
+        self.district_level = district_level
+
+        if statewide_data is None:
+            statewide_data = pd.read_csv(STATEWIDE_FILES[district_level])
+
+        self.keys, self.districts, self.matrix = self._build_matrix(statewide_data, min_statewide_pct)
+        self._unit = {metric: self._normalize_rows(self.matrix, metric) for metric in METRICS}
+
+        print(f"Indexed {len(self.keys)} candidates x {len(self.districts)} {district_level} districts")
+
+    @staticmethod
+    def _build_matrix(data, min_statewide_pct):
+        """
+        Pivot vs_statewide into a candidates x districts matrix
+
+        Districts where a candidate has no result are filled with 0
+        (no deviation from statewide).
+        """
+        keys = ['year', 'office', 'candidate', 'party']
+        data = data.assign(
+            district=data['district'].astype(str),
+            party=data['party'].replace(PARTY_CODES)
+        )
+
+        is_state = data['district'] == 'STATE'
+        statewide = data[is_state].drop_duplicates(keys)[keys + ['percentage']]
+        statewide = statewide[statewide['percentage'] >= min_statewide_pct]
+
+        rows = data[~is_state].merge(
+            statewide.rename(columns={'percentage': 'statewide_pct'}), on=keys, how='inner'
+        )
+        rows['vs_statewide'] = rows['percentage'] - rows['statewide_pct']
+
+        wide = rows.pivot_table(
+            index=keys, columns='district', values='vs_statewide', aggfunc='first'
+        )
+        wide = wide[sorted(wide.columns, key=lambda d: (not d.isdigit(), int(d) if d.isdigit() else 0, d))]
+
+        key_frame = wide.index.to_frame(index=False).merge(
+            statewide.rename(columns={'percentage': 'statewide_pct'}), on=keys, how='left'
+        )
+        matrix = np.ascontiguousarray(wide.fillna(0).to_numpy(dtype=np.float64))
+
+        return key_frame, wide.columns.to_numpy(), matrix
+
+    @staticmethod
+    def _normalize_rows(matrix, metric):
+        """Scale rows to unit length (after centering for correlation)"""
+        if metric == 'correlation':
+            matrix = matrix - matrix.mean(axis=1, keepdims=True)
+        elif metric != 'cosine':
+            raise ValueError(f"metric must be one of {METRICS}, not '{metric}'")
+
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.where(norms > 0, norms, 1)
+
+    def _labels(self):
+        """Row labels like '2024 U.S. Senate: Allred (D)'"""
+        k = self.keys
+        return (k['year'].astype(str) + ' ' + k['office'] + ': ' +
+                k['candidate'] + ' (' + k['party'] + ')').to_numpy()
+
+    def find(self, candidate, year=None, office=None):
+        """Row positions matching a candidate (partial name match OK)"""
+        mask = self.keys['candidate'].str.contains(candidate, case=False, na=False, regex=False)
+        if year is not None:
+            mask &= self.keys['year'] == year
+        if office is not None:
+            mask &= self.keys['office'] == office
+        return np.flatnonzero(mask.to_numpy())
+
+    def pairwise(self, metric='correlation'):
+        """Full candidates x candidates similarity matrix"""
+        unit = self._unit[metric] if metric in self._unit else self._normalize_rows(self.matrix, metric)
+        labels = self._labels()
+        return pd.DataFrame(unit @ unit.T, index=labels, columns=labels)
+
+    def most_similar(self, candidate, year=None, office=None, k=10,
+                     metric='correlation', party=None, exclude_same_race=True):
+        """
+        Top-k candidates with the most similar district residual pattern
+
+        Parameters:
+        - candidate: Candidate name (partial match OK)
+        - year, office: Narrow the query candidate when the name is ambiguous
+        - k: Number of neighbors to return
+        - metric: 'correlation' or 'cosine'
+        - party: Only return neighbors from this party
+        - exclude_same_race: Drop opponents in the query's own race (their
+          residuals mirror the query's by construction)
+
+        Returns DataFrame of neighbors sorted by similarity.
+        """
+        matches = self.find(candidate, year, office)
+        if len(matches) == 0:
+            warn(f"⚠ No indexed candidate matching '{candidate}'")
+            return pd.DataFrame()
+        if len(matches) > 1:
+            print(f"  '{candidate}' matches {len(matches)} races; using "
+                  f"{self._labels()[matches[-1]]} (pass year/office to choose)")
+        query = matches[-1]
+
+        unit = self._unit[metric] if metric in self._unit else self._normalize_rows(self.matrix, metric)
+        scores = unit @ unit[query]
+
+        valid = np.ones(len(scores), dtype=bool)
+        valid[query] = False
+        if exclude_same_race:
+            same = ((self.keys['year'] == self.keys.at[query, 'year']) &
+                    (self.keys['office'] == self.keys.at[query, 'office'])).to_numpy()
+            valid &= ~same
+        if party:
+            valid &= (self.keys['party'] == party).to_numpy()
+
+        candidates = np.flatnonzero(valid)
+        k = min(k, len(candidates))
+        if k == 0:
+            return pd.DataFrame()
+
+        top = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        top = top[np.argsort(-scores[top])]
+
+        result = self.keys.iloc[top].reset_index(drop=True)
+        result['similarity'] = scores[top]
+        return result
+
+
+def main():
+    print("="*80)
+    print("CANDIDATE SIMILARITY SEARCH (district residual patterns)")
+    print("="*80)
+
+    index = CandidateSimilarityIndex(district_level='house')
+
+    for name, year, office in [('Allred', 2024, 'U.S. Senate'), ("O'Rourke", 2018, 'U.S. Senate')]:
+        print("\n" + "="*80)
+        print(f"MOST SIMILAR TO {name.upper()} {year} ({office})")
+        print("="*80)
+        print(index.most_similar(name, year=year, office=office, k=10).round(3).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
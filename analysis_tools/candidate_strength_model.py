@@ -18,23 +18,33 @@ import sys
 if sys.platform == 'win32':
     sys.stdout.reconfigure(encoding='utf-8')
 
+import os
 import pandas as pd
 import numpy as np
+import scipy.sparse as sp
+import warnings
 from typing import Dict, List, Tuple
 
+from instrumentation import instrumented, log, stage
+from fact_paths import PARTY_CODES, PRECINCT_FILES, STATEWIDE_OFFICES
+
 class CandidateStrengthAnalyzer:
     """Analyze candidate strength across districts"""
 
-    def __init__(self, geographic_level='house'):
+    def __init__(self, geographic_level='house', year=None):
         """
         Initialize analyzer
 
         Parameters:
-        - geographic_level: 'house', 'senate', or 'congressional'
+        - geographic_level: 'house', 'senate', 'congressional', or 'precinct'
+        - year: Election year (required for 'precinct': 2016 or 2018)
         """
         self.geographic_level = geographic_level
+        self.year = year
         self.data = None
         self.baseline_data = None
+        self._lean_cache = {}
+        self._similarity_index = None
 
         # Load appropriate dataset
         file_map = {
@@ -43,7 +53,16 @@ class CandidateStrengthAnalyzer:
             'congressional': 'texas_election_data/pdf_extracts/2018_2024_congressional_results_combined.csv'
         }
 
-        self.data = pd.read_csv(file_map[geographic_level])
+        if geographic_level == 'precinct':
+            if year not in PRECINCT_FILES:
+                raise ValueError(f"Precinct data is available for {sorted(PRECINCT_FILES)}, not {year}")
+            with stage('load', 'CandidateStrengthAnalyzer', level=geographic_level, year=year) as s:
+                self.data = self._load_precinct_data(year)
+                s.rows = len(self.data)
+        else:
+            with stage('load', 'CandidateStrengthAnalyzer', level=geographic_level) as s:
+                self.data = pd.read_csv(file_map[geographic_level])
+                s.rows = len(self.data)
 
         # Incumbency data (can be expanded)
         self.incumbents = {
@@ -53,14 +72,224 @@ class CandidateStrengthAnalyzer:
             2024: {'Trump': True, 'Cruz': True}
         }
 
+    def _load_precinct_data(self, year: int) -> pd.DataFrame:
+        """
+        Load an OpenElections precinct file in the standard results format
+
+        Each county/precinct pair becomes a 'district' so the district-level
+        methods work unchanged. Only statewide races are kept; STATE rows are
+        added from the precinct sums.
+        """
+        raw = pd.read_csv(
+            PRECINCT_FILES[year],
+            usecols=['county', 'precinct', 'office', 'candidate', 'party', 'votes'],
+            dtype={'county': 'category', 'precinct': str, 'office': 'category',
+                   'candidate': 'category', 'party': 'category'},
+            low_memory=False
+        )
+        raw = raw[raw['office'].isin(STATEWIDE_OFFICES) & raw['candidate'].notna()]
+        raw['votes'] = pd.to_numeric(raw['votes'], errors='coerce').fillna(0)
+
+        precincts = raw.groupby(
+            ['county', 'precinct', 'office', 'candidate', 'party'], observed=True, as_index=False
+        )['votes'].sum()
+        precincts['district'] = precincts['county'].astype(str) + ' ' + precincts['precinct'].astype(str)
+
+        state = precincts.groupby(['office', 'candidate', 'party'], observed=True, as_index=False)['votes'].sum()
+        state['district'] = 'STATE'
+        state['county'] = 'STATE'
+
+        data = pd.concat([precincts.drop(columns=['precinct']), state], ignore_index=True)
+        data['year'] = year
+        data['office'] = data['office'].astype(str)
+        data['candidate'] = data['candidate'].astype(str)
+        data['county'] = data['county'].astype(str)
+        data['party'] = data['party'].astype(str).replace(PARTY_CODES)
+
+        totals = data.groupby(['district', 'office'])['votes'].transform('sum')
+        data['percentage'] = data['votes'] / totals.where(totals > 0) * 100
+
+        log(f"Loaded {year} precinct data: {data['district'].nunique() - 1:,} precincts, "
+            f"{len(data):,} records")
+
+        return data[['year', 'county', 'district', 'office', 'candidate', 'party', 'votes', 'percentage']]
+
+    @instrumented('aggregate')
+    def analyze_precincts(self, offices: List[str] = None) -> Dict[str, pd.DataFrame]:
+        """
+        Score every statewide candidate across all precincts in one pass
+
+        Pivots the data to a precinct x candidate vote matrix, then computes
+        vs_statewide, vs_top_ticket and weighted overperformance for every
+        candidate with array operations. County rollups reuse the same matrix
+        through a sparse precinct -> county indicator.
+
+        Returns dict with:
+        - 'candidates': One strength summary row per candidate
+        - 'precincts': Precinct x candidate long frame of metrics
+        - 'counties': County x candidate long frame of metrics
+        """
+        data = self.data[self.data['district'] != 'STATE']
+        if offices is not None:
+            data = data[data['office'].isin(offices)]
+
+        year = int(data['year'].iloc[0])
+        top_office = 'President' if year % 4 == 0 else 'Governor'
+
+        votes = data.pivot_table(
+            index=['county', 'district'], columns=['office', 'candidate', 'party'],
+            values='votes', aggfunc='sum', fill_value=0
+        )
+        candidates = votes.columns.to_frame(index=False)
+        V = votes.to_numpy(dtype=float)
+
+        # Precinct -> county indicator for rollups
+        county_codes, counties = pd.factorize(votes.index.get_level_values('county'))
+        C = sp.csr_matrix(
+            (np.ones(len(county_codes)), (np.arange(len(county_codes)), county_codes)),
+            shape=(len(county_codes), len(counties))
+        )
+
+        precinct_metrics = self._score_vote_matrix(V, candidates, top_office)
+        county_metrics = self._score_vote_matrix(np.asarray((C.T @ V)), candidates, top_office)
+
+        # Candidates without a same-party top-of-ticket race average to NaN
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            summary = candidates.copy()
+            summary['year'] = year
+            summary['statewide_pct'] = precinct_metrics['statewide_pct']
+            summary['avg_vs_statewide'] = np.nanmean(precinct_metrics['vs_statewide'], axis=0)
+            summary['avg_vs_top_ticket'] = np.nanmean(precinct_metrics['vs_top_ticket'], axis=0)
+            summary['avg_weighted_overperformance'] = np.nanmean(precinct_metrics['weighted_overperformance'], axis=0)
+            summary['precincts_won'] = (precinct_metrics['pct'] > 50).sum(axis=0)
+            summary['precincts_total'] = (~np.isnan(precinct_metrics['pct'])).sum(axis=0)
+            summary['win_rate'] = summary['precincts_won'] / summary['precincts_total']
+            summary['std_dev_performance'] = np.nanstd(precinct_metrics['vs_statewide'], axis=0, ddof=1)
+            summary['counties_won'] = (county_metrics['pct'] > 50).sum(axis=0)
+            summary['avg_county_vs_top_ticket'] = np.nanmean(county_metrics['vs_top_ticket'], axis=0)
+            summary['overall_strength_score'] = (
+                summary['avg_weighted_overperformance'] * 0.4 +
+                summary['avg_vs_top_ticket'].fillna(0) * 0.3 +
+                (np.nanmean(precinct_metrics['pct'], axis=0) - 50) * 0.2 +
+                -(summary['std_dev_performance'] * 0.1)
+            )
+
+        return {
+            'candidates': summary.sort_values('overall_strength_score', ascending=False),
+            'precincts': self._metrics_to_long(precinct_metrics, votes.index, candidates),
+            'counties': self._metrics_to_long(
+                county_metrics, pd.Index(counties, name='county'), candidates
+            )
+        }
+
+    @staticmethod
+    def _score_vote_matrix(V: np.ndarray, candidates: pd.DataFrame, top_office: str) -> Dict[str, np.ndarray]:
+        """
+        Compute candidate metrics from a units x candidates vote matrix
+
+        Units are precincts or counties; columns follow `candidates`
+        (office, candidate, party).
+        """
+        office_codes, offices = pd.factorize(candidates['office'])
+        M = np.zeros((len(candidates), len(offices)))
+        M[np.arange(len(candidates)), office_codes] = 1
+
+        # Votes cast in each candidate's race, per unit
+        race_totals = (V @ M)[:, office_codes]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            pct = np.where(race_totals > 0, V / race_totals * 100, np.nan)
+        statewide_pct = V.sum(axis=0) / race_totals.sum(axis=0) * 100
+        vs_statewide = pct - statewide_pct
+
+        # Same-party top-of-ticket candidate for each column
+        parties = candidates['party'].to_numpy()
+        is_top = (candidates['office'] == top_office).to_numpy()
+        # Top-of-ticket candidates compare to themselves (0), as in calculate_candidate_performance
+        top_pct = np.full_like(pct, np.nan)
+        top_pct[:, is_top] = pct[:, is_top]
+        for party in ('D', 'R'):
+            top_cols = np.flatnonzero(is_top & (parties == party))
+            if len(top_cols):
+                top_pct[:, (parties == party) & ~is_top] = pct[:, [top_cols[0]]]
+        vs_top_ticket = pct - top_pct
+
+        # Unit lean from the top-of-ticket two-party margin
+        dem_top = np.flatnonzero(is_top & (parties == 'D'))
+        rep_top = np.flatnonzero(is_top & (parties == 'R'))
+        if len(dem_top) and len(rep_top):
+            margin = V[:, dem_top[0]] - V[:, rep_top[0]]
+            lean = np.select([margin > 0, margin < 0], ['D', 'R'], 'tie')
+        else:
+            lean = np.full(V.shape[0], '')
+        # Tied units (including empty ones) lean toward neither party
+        opposite = (lean[:, None] != parties[None, :]) & (lean[:, None] != 'tie')
+        weighted = np.where(opposite, vs_statewide * 2, vs_statewide)
+
+        return {
+            'votes': V,
+            'pct': pct,
+            'statewide_pct': statewide_pct,
+            'vs_statewide': vs_statewide,
+            'vs_top_ticket': vs_top_ticket,
+            'weighted_overperformance': weighted,
+            'lean': lean
+        }
+
+    @staticmethod
+    def _metrics_to_long(metrics: Dict[str, np.ndarray], units: pd.Index,
+                         candidates: pd.DataFrame) -> pd.DataFrame:
+        """Flatten units x candidates metric arrays into a long frame"""
+        n_units, n_cands = metrics['pct'].shape
+        long = units.to_frame(index=False).loc[np.repeat(np.arange(n_units), n_cands)].reset_index(drop=True)
+        for col in ['office', 'candidate', 'party']:
+            long[col] = np.tile(candidates[col].to_numpy(), n_units)
+        long['partisan_lean'] = np.repeat(metrics['lean'], n_cands)
+        for key in ['votes', 'pct', 'vs_statewide', 'vs_top_ticket', 'weighted_overperformance']:
+            long[key] = metrics[key].ravel()
+        return long.rename(columns={'pct': 'percentage'})
+
+    def _baseline_votes(self) -> pd.DataFrame:
+        """
+        D and R votes for every (year, office, district), built once
+
+        Cached in self.baseline_data and shared by every partisan-lean
+        baseline, single or blended.
+        """
+        if self.baseline_data is None:
+            votes = self.data[
+                (self.data['district'] != 'STATE') & self.data['party'].isin(['D', 'R'])
+            ]
+            pivot = votes.pivot_table(
+                index=['year', 'office', 'district'], columns='party',
+                values='votes', aggfunc='sum', fill_value=0
+            )
+            self.baseline_data = pivot.reindex(columns=['D', 'R'], fill_value=0)
+
+        return self.baseline_data
+
+    @instrumented('features', args=('year',))
     def calculate_district_partisan_lean(self, year: int,
                                          baseline_race: str = None,
-                                         baseline_year: int = None) -> pd.DataFrame:
+                                         baseline_year: int = None,
+                                         blend: Dict[Tuple[int, str], float] = None) -> pd.DataFrame:
         """
         Calculate partisan lean of each district based on a baseline race
 
-        Uses presidential results as baseline for partisan lean
+        Uses presidential results as baseline for partisan lean. Results are
+        memoized per (geographic_level, baseline_year, baseline_race).
+
+        Parameters:
+        - year: Target election year (picks the default baseline)
+        - baseline_race: Baseline office
+        - baseline_year: Baseline year
+        - blend: Weighted average of several baselines instead of one, e.g.
+          {(2020, 'President'): 0.5, (2024, 'President'): 0.5}. Weights are
+          renormalized over the races available in each district.
         """
+        if blend:
+            return self._blended_partisan_lean(blend)
+
         if baseline_year is None:
             # Use most recent presidential election before or at the target year
             if year >= 2024:
@@ -81,46 +310,62 @@ class CandidateStrengthAnalyzer:
         if baseline_race is None:
             baseline_race = 'President' if year in [2020, 2024] else 'Governor'
 
-        # Get baseline race results
-        baseline = self.data[
-            (self.data['year'] == baseline_year) &
-            (self.data['office'] == baseline_race) &
-            (self.data['district'] != 'STATE')
-        ].copy()
-
-        # If still no data, return empty DataFrame
-        if baseline.empty:
-            return pd.DataFrame(columns=['district', 'baseline_year', 'baseline_race',
-                                        'dem_pct', 'rep_pct', 'dem_margin',
-                                        'partisan_lean', 'lean_strength'])
+        key = (self.geographic_level, baseline_year, baseline_race)
+        if key not in self._lean_cache:
+            votes = self._baseline_votes()
 
-        # Calculate D vs R margin
-        district_margins = []
-
-        for district in baseline['district'].unique():
-            dist_data = baseline[baseline['district'] == district]
-
-            dem_votes = dist_data[dist_data['party'] == 'D']['votes'].sum()
-            rep_votes = dist_data[dist_data['party'] == 'R']['votes'].sum()
-            total_votes = dem_votes + rep_votes
+            if (baseline_year, baseline_race) in votes.index.droplevel('district'):
+                baseline = votes.loc[(baseline_year, baseline_race)]
+            else:
+                baseline = votes.iloc[0:0].droplevel(['year', 'office'])
 
-            if total_votes > 0:
-                dem_pct = dem_votes / total_votes * 100
-                rep_pct = rep_votes / total_votes * 100
-                margin = dem_pct - rep_pct  # Positive = more Democratic
+            total = baseline['D'] + baseline['R']
+            baseline = baseline[total > 0]
+            self._lean_cache[key] = self._lean_frame(
+                baseline['D'] / total[total > 0] * 100, baseline_year, baseline_race
+            )
 
-                district_margins.append({
-                    'district': district,
-                    'baseline_year': baseline_year,
-                    'baseline_race': baseline_race,
-                    'dem_pct': dem_pct,
-                    'rep_pct': rep_pct,
-                    'dem_margin': margin,
-                    'partisan_lean': 'D' if margin > 0 else 'R',
-                    'lean_strength': abs(margin)
-                })
+        return self._lean_cache[key].copy()
+
+    def _blended_partisan_lean(self, blend: Dict[Tuple[int, str], float]) -> pd.DataFrame:
+        """Partisan lean from a weighted average of several baseline races"""
+        key = (self.geographic_level, 'blend', tuple(sorted(blend.items())))
+        if key not in self._lean_cache:
+            shares, weights = [], []
+            for (race_year, race), weight in blend.items():
+                lean = self.calculate_district_partisan_lean(
+                    race_year, baseline_race=race, baseline_year=race_year
+                )
+                shares.append(lean.set_index('district')['dem_pct'].rename((race_year, race)))
+                weights.append(weight)
+
+            shares = pd.concat(shares, axis=1)
+            weight_matrix = shares.notna() * np.asarray(weights, dtype=float)
+            dem_pct = (shares.fillna(0) * weight_matrix).sum(axis=1) / weight_matrix.sum(axis=1)
+
+            label = ' + '.join(f"{w:g}*{y} {r}" for (y, r), w in blend.items())
+            self._lean_cache[key] = self._lean_frame(
+                dem_pct.dropna(), max(y for y, _ in blend), label
+            )
 
-        return pd.DataFrame(district_margins)
+        return self._lean_cache[key].copy()
+
+    @staticmethod
+    def _lean_frame(dem_pct: pd.Series, baseline_year: int, baseline_race: str) -> pd.DataFrame:
+        """Build the partisan-lean table from each district's two-party D share"""
+        margin = dem_pct * 2 - 100  # D% - R% of the two-party vote; positive = more Democratic
+        return pd.DataFrame({
+            'district': dem_pct.index.to_numpy(),
+            'baseline_year': baseline_year,
+            'baseline_race': baseline_race,
+            'dem_pct': dem_pct.to_numpy(),
+            'rep_pct': 100 - dem_pct.to_numpy(),
+            'dem_margin': margin.to_numpy(),
+            'partisan_lean': np.where(margin > 0, 'D', 'R'),
+            'lean_strength': margin.abs().to_numpy()
+        }, columns=['district', 'baseline_year', 'baseline_race',
+                    'dem_pct', 'rep_pct', 'dem_margin',
+                    'partisan_lean', 'lean_strength'])
 
     def calculate_candidate_performance(self, year: int, office: str,
                                        candidate: str) -> pd.DataFrame:
@@ -284,28 +529,115 @@ class CandidateStrengthAnalyzer:
 
     def analyze_race(self, year: int, office: str) -> pd.DataFrame:
         """Analyze all candidates in a specific race"""
+        return self.analyze_all_races(years=[year], offices=[office])
 
-        candidates = self.data[
-            (self.data['year'] == year) &
-            (self.data['office'] == office) &
-            (self.data['district'] == 'STATE')
-        ]['candidate'].unique()
+    @instrumented('aggregate')
+    def analyze_all_races(self, years: List[int] = None, offices: List[str] = None) -> pd.DataFrame:
+        """
+        Strength summary for every candidate in every (year, office) at once
 
-        all_scores = []
+        Produces the same rows as calculate_strength_score() on
+        calculate_candidate_performance() for each candidate. Partisan lean is
+        computed once per year, statewide and top-of-ticket results are
+        attached with one merge each, and all summaries come from a single
+        grouped aggregation.
 
-        for candidate in candidates:
-            perf = self.calculate_candidate_performance(year, office, candidate)
-            if not perf.empty:
-                score = self.calculate_strength_score(perf)
-                all_scores.append(score)
+        Parameters:
+        - years: Restrict to these years (default: all)
+        - offices: Restrict to these offices (default: all)
 
-        if all_scores:
-            return pd.concat(all_scores, ignore_index=True).sort_values(
-                'overall_strength_score', ascending=False
-            )
-        else:
+        Returns DataFrame sorted by year, office and overall_strength_score.
+        """
+        keys = ['year', 'office', 'candidate']
+
+        data = self.data
+        if years is not None:
+            data = data[data['year'].isin(years)]
+        if offices is not None:
+            data = data[data['office'].isin(offices)]
+
+        is_state = data['district'] == 'STATE'
+        state = data[is_state].drop_duplicates(keys)[keys + ['percentage']]
+        rows = data[~is_state].merge(
+            state.rename(columns={'percentage': 'state_pct'}), on=keys, how='inner'
+        )
+        if rows.empty:
             return pd.DataFrame()
 
+        has_state_pct = rows['state_pct'].notna() & (rows['state_pct'] != 0)
+        rows['vs_statewide'] = np.where(has_state_pct, rows['percentage'] - rows['state_pct'], 0)
+
+        # District lean, once per year
+        leans, no_lean_years = [], []
+        for year in rows['year'].unique():
+            lean = self.calculate_district_partisan_lean(int(year))
+            if lean.empty:
+                no_lean_years.append(year)
+            else:
+                leans.append(lean[['district', 'partisan_lean']].assign(year=year))
+        if leans:
+            rows = rows.merge(pd.concat(leans, ignore_index=True), on=['year', 'district'], how='left')
+        else:
+            rows['partisan_lean'] = pd.Series(np.nan, index=rows.index, dtype=object)
+        rows.loc[rows['year'].isin(no_lean_years), 'partisan_lean'] = 'R'
+
+        # Same-party top-of-ticket result in each district
+        top_office = rows['year'].map({2020: 'President', 2024: 'President', 2018: 'Governor', 2022: 'Governor'})
+        compare = top_office.notna() & (rows['office'] != top_office)
+
+        top = self.data[self.data['district'] != 'STATE']
+        top = top[top['office'] == top['year'].map({2020: 'President', 2024: 'President',
+                                                    2018: 'Governor', 2022: 'Governor'})]
+        compared = rows[compare].merge(
+            top[['year', 'district', 'party', 'percentage']].rename(columns={'percentage': 'top_ticket_pct'}),
+            on=['year', 'district', 'party'], how='left'
+        )
+        compared['vs_top_ticket'] = compared['percentage'] - compared['top_ticket_pct']
+        rows = pd.concat([compared, rows[~compare].assign(vs_top_ticket=0.0)], ignore_index=True)
+
+        opposite = rows['partisan_lean'] != rows['party']
+        rows['weighted_overperformance'] = np.where(opposite, rows['vs_statewide'] * 2, rows['vs_statewide'])
+        rows['won'] = rows['percentage'] > 50
+        rows['vs_opposite'] = rows['vs_statewide'].where(opposite)
+        rows['vs_favorable'] = rows['vs_statewide'].where(~opposite)
+
+        summary = rows.groupby(keys, sort=False).agg(
+            party=('party', 'first'),
+            statewide_pct=('percentage', 'mean'),
+            avg_vs_statewide=('vs_statewide', 'mean'),
+            avg_vs_top_ticket=('vs_top_ticket', 'mean'),
+            districts_won=('won', 'sum'),
+            districts_total=('won', 'size'),
+            avg_overperf_opposite_districts=('vs_opposite', 'mean'),
+            avg_overperf_favorable_districts=('vs_favorable', 'mean'),
+            std_dev_performance=('vs_statewide', 'std'),
+            avg_weighted=('weighted_overperformance', 'mean')
+        ).reset_index()
+
+        summary['is_incumbent'] = [
+            candidate in self.incumbents.get(year, {})
+            for year, candidate in zip(summary['year'], summary['candidate'])
+        ]
+        summary['win_rate'] = summary['districts_won'] / summary['districts_total']
+        summary['overall_strength_score'] = (
+            summary['avg_weighted'] * 0.4 +
+            summary['avg_vs_top_ticket'] * 0.3 +
+            (summary['statewide_pct'] - 50) * 0.2 +
+            -(summary['std_dev_performance'] * 0.1)
+        )
+
+        summary = summary[[
+            'candidate', 'year', 'office', 'party', 'is_incumbent',
+            'statewide_pct', 'avg_vs_statewide', 'avg_vs_top_ticket',
+            'districts_won', 'districts_total', 'win_rate',
+            'avg_overperf_opposite_districts', 'avg_overperf_favorable_districts',
+            'std_dev_performance', 'overall_strength_score'
+        ]]
+
+        return summary.sort_values(
+            ['year', 'office', 'overall_strength_score'], ascending=[True, True, False]
+        ).reset_index(drop=True)
+
     def compare_candidates_across_elections(self, candidate: str) -> pd.DataFrame:
         """
         Track a single candidate's performance across multiple elections
@@ -316,18 +648,33 @@ class CandidateStrengthAnalyzer:
             (self.data['district'] == 'STATE')
         ][['year', 'office']].drop_duplicates()
 
-        all_analyses = []
+        if candidate_races.empty:
+            return pd.DataFrame()
 
-        for _, race in candidate_races.iterrows():
-            perf = self.calculate_candidate_performance(race['year'], race['office'], candidate)
-            if not perf.empty:
-                score = self.calculate_strength_score(perf)
-                all_analyses.append(score)
+        scores = self.analyze_all_races(
+            years=candidate_races['year'].unique().tolist(),
+            offices=candidate_races['office'].unique().tolist()
+        )
+        scores = scores[scores['candidate'] == candidate].merge(candidate_races, on=['year', 'office'])
 
-        if all_analyses:
-            return pd.concat(all_analyses, ignore_index=True).sort_values('year')
-        else:
-            return pd.DataFrame()
+        return scores.sort_values('year').reset_index(drop=True)
+
+    def find_similar_candidates(self, candidate: str, year: int = None, office: str = None,
+                                k: int = 10, metric: str = 'correlation') -> pd.DataFrame:
+        """
+        Candidates whose district-by-district vs_statewide pattern best matches
+        one candidate's (see candidate_similarity.py)
+
+        The index over every (year, office, candidate) is built on first use.
+        """
+        if self._similarity_index is None:
+            from candidate_similarity import CandidateSimilarityIndex
+            self._similarity_index = CandidateSimilarityIndex(
+                district_level=self.geographic_level, statewide_data=self.data
+            )
+
+        return self._similarity_index.most_similar(candidate, year=year, office=office,
+                                                   k=k, metric=metric)
 
 
 def main():
@@ -400,6 +747,19 @@ def main():
     ]
     print(allred_top.to_string(index=False))
 
+    # Precinct-level analysis (requires OpenElections precinct file)
+    if os.path.exists(PRECINCT_FILES[2018]):
+        print("\n" + "="*80)
+        print("2018 STATEWIDE CANDIDATES - Precinct-Level Strength")
+        print("="*80)
+
+        precinct_analyzer = CandidateStrengthAnalyzer(geographic_level='precinct', year=2018)
+        precinct_results = precinct_analyzer.analyze_precincts()
+        print(precinct_results['candidates'][[
+            'office', 'candidate', 'party', 'statewide_pct', 'avg_vs_top_ticket',
+            'avg_weighted_overperformance', 'win_rate', 'counties_won', 'overall_strength_score'
+        ]].to_string(index=False))
+
     print("\n" + "="*80)
     print("KEY INSIGHTS")
     print("="*80)
@@ -0,0 +1,235 @@
+"""
+Career-Path Tracker
+
+Every race of a person at every level (state house, state senate,
+congress, statewide) in one table, keyed by the person_id from
+candidate_identity.py:
+- District races come from the fact tables (vs_top_ticket, partisan lean,
+  competitiveness, incumbency)
+- Political WAR is joined from PoliticalWARModel where the race was scored
+- Statewide races are compared to their own top of ticket
+
+Races are sorted by person once and indexed by person_id, so a career
+lookup slices that person's rows instead of scanning the table.
+"""
+
+import sys
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+import pandas as pd
+import numpy as np
+
+from fact_paths import top_ticket_office
+from instrumentation import warn
+
+CAREER_COLUMNS = [
+    'person_id', 'year', 'level', 'office', 'district', 'candidate', 'party',
+    'votes', 'percentage', 'won', 'top_ticket_candidate', 'top_ticket_pct',
+    'vs_top_ticket', 'partisan_lean', 'has_major_party_opponent',
+    'is_competitive', 'opposition_strength', 'winning_margin', 'is_incumbent',
+    'political_war'
+]
+
+LEVEL_ORDER = {'house': 0, 'senate': 1, 'congressional': 2, 'statewide': 3}
+
+
+class CareerTracker:
+    """Per-person career index across all office levels"""
+
+    def __init__(self, identity=None, war_model=None, include_war=True):
+        """
+        Build the career table and person index
+
+        Parameters:
+        - identity: CandidateIdentityIndex (built if not given)
+        - war_model: PoliticalWARModel with WAR scores (built if not given
+          and include_war is True)
+        - include_war: Join Political WAR onto house and senate races
+        """
+        if identity is None:
+            from candidate_identity import CandidateIdentityIndex
+            identity = CandidateIdentityIndex()
+        self.identity = identity
+
+        if war_model is None and include_war:
+            from political_war_model import PoliticalWARModel
+            war_model = PoliticalWARModel()
+        if war_model is not None and (war_model.training_data is None or
+                                      'political_war' not in war_model.training_data.columns):
+            war_model.calculate_war_scores()
+        self.war_model = war_model
+
+        races = pd.concat([self._district_races(), self._statewide_races()], ignore_index=True)
+        races = self.identity.attach(races.assign(district_level=races['level']))
+        races = races[races['person_id'].notna()]
+
+        races = races.assign(level_order=races['level'].map(LEVEL_ORDER)).sort_values(
+            ['person_id', 'year', 'level_order'], kind='stable'
+        )
+        self.races = races[CAREER_COLUMNS].reset_index(drop=True)
+
+        # person_id -> (start, stop) row range in self.races
+        person_ids = self.races['person_id'].to_numpy()
+        starts = np.flatnonzero(np.r_[True, person_ids[1:] != person_ids[:-1]])
+        stops = np.r_[starts[1:], len(person_ids)]
+        self._index = dict(zip(person_ids[starts], zip(starts, stops)))
+
+        levels = self.races.groupby('person_id')['level'].nunique()
+        print(f"Indexed {len(self.races):,} races for {len(self._index):,} people "
+              f"({int((levels > 1).sum())} with multi-level careers)")
+
+    def _district_races(self):
+        """House, senate and congressional races from the fact tables, with WAR"""
+        from fact_tables import load_fact_table
+
+        frames = []
+        for level in ['house', 'senate', 'congressional']:
+            facts = load_fact_table(level)
+            facts = facts.assign(
+                level=level,
+                office=facts['office'].astype(str),
+                party=facts['party'].astype(str),
+                opposition_strength=facts['opposition_strength'].astype(str),
+                won=facts['percentage'] == facts.groupby(['year', 'district'])['percentage'].transform('max')
+            )
+            frames.append(facts)
+
+        races = pd.concat(frames, ignore_index=True)
+        races['district_level'] = races['level']
+
+        if self.war_model is not None:
+            war = self.war_model.training_data[['year', 'district', 'district_level', 'candidate', 'political_war']]
+            war = war.assign(district=war['district'].astype(str)).drop_duplicates(
+                ['year', 'district', 'district_level', 'candidate']
+            )
+            races = races.merge(war, on=['year', 'district', 'district_level', 'candidate'], how='left')
+        else:
+            races['political_war'] = np.nan
+
+        return races.drop(columns='district_level')
+
+    def _statewide_races(self):
+        """Statewide races (STATE rows), compared to the same party's top of ticket"""
+        records = self.identity.records
+        statewide = records[(records['source'] == 'statewide')][
+            ['year', 'district', 'office', 'candidate', 'party', 'votes', 'percentage']
+        ].copy()
+        statewide['level'] = 'statewide'
+        statewide['won'] = statewide['percentage'] == statewide.groupby(['year', 'office'])['percentage'].transform('max')
+
+        statewide['top_office'] = statewide['year'].map(lambda y: top_ticket_office('house', y))
+        top = statewide[statewide['office'] == statewide['top_office']][['year', 'party', 'candidate', 'percentage']]
+        top = top.drop_duplicates(['year', 'party']).rename(columns={
+            'candidate': 'top_ticket_candidate', 'percentage': 'top_ticket_pct'
+        })
+        statewide = statewide.merge(top, on=['year', 'party'], how='left')
+        statewide['vs_top_ticket'] = statewide['percentage'] - statewide['top_ticket_pct']
+
+        ranked = statewide.sort_values('percentage', ascending=False)
+        margin = ranked.groupby(['year', 'office'])['percentage'].agg(
+            lambda p: p.iloc[0] - p.iloc[1] if len(p) > 1 else 100.0
+        ).rename('winning_margin')
+        statewide = statewide.merge(margin, on=['year', 'office'], how='left')
+
+        parties = statewide.groupby(['year', 'office'])['party'].agg(set)
+        has_major = parties.map(lambda p: {'D', 'R'} <= p).rename('has_major_party_opponent')
+        statewide = statewide.merge(has_major, on=['year', 'office'], how='left')
+        statewide['is_competitive'] = statewide['winning_margin'] < 20
+
+        return statewide.drop(columns='top_office')
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def career(self, person_id):
+        """Every race of one person, in year order (empty if unknown)"""
+        rows = self._index.get(person_id)
+        if rows is None:
+            return self.races.iloc[0:0]
+        return self.races.iloc[rows[0]:rows[1]]
+
+    def career_by_name(self, name):
+        """
+        Careers of every person whose name matches (partial match OK)
+
+        Returns one frame of races for all matching people.
+        """
+        people = self.identity.search(name)
+        if people.empty:
+            warn(f"⚠ No candidates found matching '{name}'")
+            return self.races.iloc[0:0]
+        return pd.concat([self.career(pid) for pid in people['person_id']], ignore_index=True)
+
+    def summary(self):
+        """One row per person: levels, offices, years, races won and mean WAR"""
+        races = self.races
+        summary = races.groupby('person_id', sort=False).agg(
+            candidate=('candidate', lambda c: c.mode().iloc[0]),
+            party=('party', lambda p: p.mode().iloc[0]),
+            path=('level', lambda s: ' -> '.join(dict.fromkeys(s))),
+            n_levels=('level', 'nunique'),
+            n_races=('year', 'size'),
+            races_won=('won', 'sum'),
+            first_year=('year', 'min'),
+            last_year=('year', 'max'),
+            mean_vs_top_ticket=('vs_top_ticket', 'mean'),
+            mean_war=('political_war', 'mean')
+        )
+        return summary.reset_index()
+
+    def multi_level_careers(self, min_levels=2):
+        """
+        Bulk export of every career spanning min_levels or more levels
+
+        Returns (summary frame, races frame) for those people.
+        """
+        summary = self.summary()
+        summary = summary[summary['n_levels'] >= min_levels].sort_values(
+            ['last_year', 'n_races'], ascending=False
+        ).reset_index(drop=True)
+        races = pd.concat([self.career(pid) for pid in summary['person_id']], ignore_index=True) \
+            if len(summary) else self.races.iloc[0:0]
+        return summary, races
+
+    def export(self, path, min_levels=2):
+        """
+        Write the races of multi-level careers to CSV or Parquet (by extension)
+
+        Returns the number of rows written.
+        """
+        _, races = self.multi_level_careers(min_levels)
+        if str(path).endswith('.parquet'):
+            races.to_parquet(path, index=False)
+        else:
+            races.to_csv(path, index=False)
+        print(f"  ✓ Exported {len(races):,} races of {races['person_id'].nunique():,} people -> {path}")
+        return len(races)
+
+
+def main():
+    print("="*80)
+    print("CAREER-PATH TRACKER")
+    print("="*80)
+
+    tracker = CareerTracker()
+
+    summary, _ = tracker.multi_level_careers()
+    print("\n" + "="*80)
+    print("MULTI-LEVEL CAREERS")
+    print("="*80)
+    print(summary.round(2).to_string(index=False))
+
+    for name in ['Alvarado', 'Allred', 'Talarico']:
+        print("\n" + "="*80)
+        print(f"CAREER: {name}")
+        print("="*80)
+        print(tracker.career_by_name(name)[[
+            'year', 'level', 'office', 'district', 'candidate', 'party', 'percentage',
+            'won', 'vs_top_ticket', 'partisan_lean', 'opposition_strength', 'political_war'
+        ]].round(2).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
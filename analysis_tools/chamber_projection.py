@@ -0,0 +1,296 @@
+"""
+Monte Carlo Chamber Projection Engine
+
+Projects seat counts for the Texas House (150), Texas Senate (31) and the
+U.S. House delegation (38) from each district's top-of-ticket partisan lean.
+
+Each simulation draws:
+- A statewide swing (shared by every district)
+- Correlated district noise (covariance estimated from how districts
+  deviated from the statewide result across past races)
+- Independent candidate noise
+
+The three noise terms are folded into a single covariance whose Cholesky
+factor turns standard normal draws into district margins. Incumbency and
+Political WAR adjustments shift individual districts. All draws are
+vectorized over a draws x districts matrix and processed in chunks so a
+million simulations run in seconds with bounded memory.
+"""
+
+import sys
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+import pandas as pd
+import numpy as np
+
+from fact_paths import STATEWIDE_FILES, STATEWIDE_PLANS, top_ticket_office
+
+CHAMBER_SIZES = {'house': 150, 'senate': 31, 'congressional': 38}
+
+
+class ChamberProjectionEngine:
+    """Simulate chamber outcomes from district partisan lean"""
+
+    def __init__(self, district_level='house', base_year=2024, statewide_data=None):
+        """
+        Initialize engine for one chamber
+
+        Parameters:
+        - district_level: 'house', 'senate', or 'congressional'
+        - base_year: Year whose top-of-ticket race defines district lean
+        - statewide_data: Optional pre-loaded statewide-by-district frame
+        """
+        self.district_level = district_level
+        self.base_year = base_year
+        self.plan = STATEWIDE_PLANS[district_level].get(base_year)
+
+        if statewide_data is None:
+            statewide_data = pd.read_csv(STATEWIDE_FILES[district_level])
+        statewide_data = statewide_data.copy()
+        statewide_data['district'] = statewide_data['district'].astype(str)
+        self.statewide_data = statewide_data
+
+        # D - R margin for every (year, office, district) in one pivot
+        self.margins = self._build_margin_table()
+
+        base_office = top_ticket_office(district_level, base_year)
+        if (base_year, base_office) not in self.margins.index:
+            raise ValueError(
+                f"No D/R {base_office} results by district for {district_level} {base_year}; "
+                f"available: {sorted(set(self.margins.index))}"
+            )
+        base = self.margins.loc[(base_year, base_office)].copy()
+        if pd.isna(base.get('STATE')):
+            raise ValueError(f"No STATE row for {district_level} {base_year} {base_office}")
+        self.base_environment = base.pop('STATE')
+        self.lean = base.dropna().sort_index(key=lambda idx: idx.astype(int))
+        self.districts = self.lean.index.to_numpy()
+
+        self.covariance = None
+        self.adjustments = pd.Series(0.0, index=self.lean.index)
+
+        print(f"Loaded {len(self.lean)} {district_level} districts "
+              f"({base_year} {base_office}, statewide D-R {self.base_environment:+.1f})")
+
+    def _build_margin_table(self):
+        """
+        Pivot statewide results to D% - R% margins
+
+        Returns DataFrame indexed by (year, office) with one column per
+        district (including STATE). Races missing a D or R candidate are dropped.
+        """
+        df = self.statewide_data[self.statewide_data['party'].isin(['D', 'R'])]
+        pct = df.pivot_table(
+            index=['year', 'office', 'district'], columns='party',
+            values='percentage', aggfunc='sum'
+        )
+        pct = pct.dropna()
+        return (pct['D'] - pct['R']).unstack('district')
+
+    def estimate_covariance(self, shrinkage=0.25, min_variance=1.0):
+        """
+        Estimate district noise covariance from past statewide races
+
+        Uses races reported under the same district plan as the base year.
+        Each race's district margins are centered on the statewide margin,
+        then each district's mean deviation (its lean) is removed, leaving
+        race-to-race variation. With few races the sample covariance is
+        singular, so it is shrunk toward its diagonal before factoring.
+
+        Parameters:
+        - shrinkage: Weight on the diagonal target (0 = sample covariance)
+        - min_variance: Floor for each district's variance (points^2)
+        """
+        plan_years = [y for y, p in STATEWIDE_PLANS[self.district_level].items() if p == self.plan]
+        races = self.margins[self.margins.index.get_level_values('year').isin(plan_years)]
+        races = races[list(self.districts) + ['STATE']].dropna()
+
+        deviations = races[list(self.districts)].sub(races['STATE'], axis=0).to_numpy(dtype=float)
+        residuals = deviations - deviations.mean(axis=0)
+
+        n_races = residuals.shape[0]
+        if n_races < 2:
+            sample = np.zeros((len(self.districts), len(self.districts)))
+        else:
+            sample = residuals.T @ residuals / (n_races - 1)
+
+        diagonal = np.maximum(np.diag(sample), min_variance)
+        covariance = (1 - shrinkage) * sample + shrinkage * np.diag(diagonal)
+        covariance[np.diag_indices_from(covariance)] = np.maximum(
+            np.diag(covariance), min_variance
+        )
+
+        self.covariance = covariance
+
+        print(f"  Estimated {len(self.districts)}x{len(self.districts)} district covariance "
+              f"from {n_races} races ({self.plan})")
+
+        return self.covariance
+
+    def set_adjustments(self, incumbency=None, war=None,
+                        incumbency_advantage=3.0, war_weight=0.5):
+        """
+        Set per-district margin adjustments (positive favors Democrats)
+
+        Parameters:
+        - incumbency: Series/dict of district -> incumbent party ('D', 'R', or None)
+        - war: Series/dict of district -> D-minus-R WAR of the expected nominees
+        - incumbency_advantage: Margin points added for the incumbent's party
+        - war_weight: Fraction of WAR carried forward into the projection
+        """
+        adjustments = pd.Series(0.0, index=self.lean.index)
+
+        if incumbency is not None:
+            party = pd.Series(incumbency, dtype=object).rename(index=str).reindex(self.lean.index)
+            sign = party.map({'D': 1.0, 'R': -1.0}).fillna(0.0)
+            adjustments += sign * incumbency_advantage
+
+        if war is not None:
+            war = pd.Series(war, dtype=float).rename(index=str).reindex(self.lean.index)
+            adjustments += war.fillna(0.0) * war_weight
+
+        self.adjustments = adjustments
+        return self.adjustments
+
+    def adjustments_from_war_model(self, war_model, incumbency_advantage=3.0, war_weight=0.5):
+        """
+        Build incumbency and WAR adjustments from a PoliticalWARModel
+
+        Assumes each district's most recent winner runs again. Their shrunken
+        career WAR is signed toward their party.
+        """
+        races = war_model.district_races
+        races = races[races['district_level'] == self.district_level].copy()
+        races['district'] = races['district'].astype(str)
+
+        latest = races[races['year'] == races['year'].max()]
+        winners = latest.loc[latest.groupby('district')['percentage'].idxmax()]
+        incumbency = winners.set_index('district')['party'].where(lambda p: p.isin(['D', 'R']))
+
+        careers = war_model.calculate_career_war() if war_model.career_war is None else war_model.career_war
+        careers = careers[careers['district_level'] == self.district_level]
+        winners = winners.assign(name_key=war_model._normalize_candidate_name(winners['candidate']))
+        winner_war = winners.merge(
+            careers[['district', 'party', 'name_key', 'career_war']],
+            on=['district', 'party', 'name_key'], how='left'
+        ).set_index('district')
+        sign = winner_war['party'].map({'D': 1.0, 'R': -1.0}).fillna(0.0)
+        war = winner_war['career_war'].fillna(0.0) * sign
+
+        return self.set_adjustments(incumbency=incumbency, war=war,
+                                    incumbency_advantage=incumbency_advantage,
+                                    war_weight=war_weight)
+
+    def simulate(self, n_sims=1_000_000, statewide_margin=None, swing_sd=4.0,
+                 noise_scale=1.0, candidate_sd=2.0, chunk_size=100_000, seed=None):
+        """
+        Run Monte Carlo projection
+
+        Parameters:
+        - n_sims: Number of simulated elections
+        - statewide_margin: Expected statewide D-R margin (default: base year result)
+        - swing_sd: Std. dev. of statewide swing (points)
+        - noise_scale: Multiplier on the estimated district covariance
+        - candidate_sd: Std. dev. of independent per-district candidate noise
+        - chunk_size: Draws processed per chunk (bounds memory)
+        - seed: Random seed
+
+        Returns dict with seat distribution, majority probabilities and a
+        per-district DataFrame of win probabilities.
+        """
+        if self.covariance is None:
+            self.estimate_covariance()
+
+        if statewide_margin is None:
+            statewide_margin = self.base_environment
+
+        rng = np.random.default_rng(seed)
+        n_districts = len(self.districts)
+
+        base = (
+            self.lean.to_numpy() + self.adjustments.to_numpy() +
+            (statewide_margin - self.base_environment)
+        ).astype(np.float32)
+
+        # Statewide swing (shared by all districts), correlated district noise
+        # and independent candidate noise are all Gaussian, so they combine
+        # into one covariance and one Cholesky factor: a single matmul per chunk
+        total_cov = (
+            noise_scale ** 2 * self.covariance +
+            candidate_sd ** 2 * np.eye(n_districts) +
+            swing_sd ** 2 * np.ones((n_districts, n_districts))
+        )
+        chol_t = np.linalg.cholesky(total_cov).T.astype(np.float32)
+
+        dem_wins = np.zeros(n_districts, dtype=np.int64)
+        margin_sum = np.zeros(n_districts, dtype=np.float64)
+        seat_counts = np.zeros(n_districts + 1, dtype=np.int64)
+
+        done = 0
+        while done < n_sims:
+            m = min(chunk_size, n_sims - done)
+
+            margins = rng.standard_normal((m, n_districts), dtype=np.float32) @ chol_t
+            margins += base
+
+            wins = margins > 0
+            dem_wins += wins.sum(axis=0)
+            margin_sum += margins.sum(axis=0, dtype=np.float64)
+            seat_counts += np.bincount(wins.sum(axis=1), minlength=n_districts + 1)
+
+            done += m
+
+        seats = np.arange(n_districts + 1)
+        majority = CHAMBER_SIZES[self.district_level] // 2 + 1
+        seat_probs = seat_counts / n_sims
+
+        districts = pd.DataFrame({
+            'district': self.districts,
+            'partisan_lean': self.lean.to_numpy(),
+            'adjustment': self.adjustments.to_numpy(),
+            'expected_margin': margin_sum / n_sims,
+            'dem_win_prob': dem_wins / n_sims
+        })
+        districts['rep_win_prob'] = 1 - districts['dem_win_prob']
+
+        return {
+            'district_level': self.district_level,
+            'n_sims': n_sims,
+            'statewide_margin': statewide_margin,
+            'seat_distribution': pd.Series(seat_probs, index=seats, name='probability'),
+            'dem_seats_mean': float(seats @ seat_probs),
+            'dem_seats_median': int(np.searchsorted(np.cumsum(seat_probs), 0.5)),
+            'dem_majority_prob': float(seat_probs[majority:].sum()),
+            'rep_majority_prob': float(seat_probs[:n_districts - majority + 1].sum()),
+            'districts': districts
+        }
+
+
+def main():
+    print("="*80)
+    print("MONTE CARLO CHAMBER PROJECTIONS")
+    print("="*80)
+
+    for level in ['house', 'senate', 'congressional']:
+        print("\n" + "="*80)
+        print(f"{level.upper()} - 1,000,000 simulations at 2024 environment")
+        print("="*80)
+
+        engine = ChamberProjectionEngine(district_level=level, base_year=2024)
+        result = engine.simulate(n_sims=1_000_000, seed=2026)
+
+        print(f"  Expected D seats: {result['dem_seats_mean']:.1f} "
+              f"(median {result['dem_seats_median']})")
+        print(f"  P(D majority): {result['dem_majority_prob']:.1%}")
+        print(f"  P(R majority): {result['rep_majority_prob']:.1%}")
+
+        districts = result['districts']
+        tossups = districts[districts['dem_win_prob'].between(0.2, 0.8)]
+        print(f"\n  Competitive districts (20-80% D win probability): {len(tossups)}")
+        if not tossups.empty:
+            print(tossups.sort_values('dem_win_prob', ascending=False).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,9 @@ in their districts to identify:
 - Strong district candidates who outperform statewide candidates
 - Potential statewide recruitment targets
 - Districts where local candidates have unique appeal
+
+Single-year view of the multi-year engine (district_candidate_analyzer_multiyear.py):
+results are sliced from its fact tables rather than recomputed.
 """
 
 import sys
@@ -16,105 +19,101 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List
 
+def recruitment_score(df):
+    """
+    Recruitment score of each candidate row (any mix of parties)
+
+    Weighs overperformance vs. top of ticket, margin of victory and
+    performance in unfavorable terrain: for a D candidate negative
+    partisan_lean (R-leaning) is unfavorable, for anyone else positive
+    partisan_lean (D-leaning) is.
+    """
+    lean = df['partisan_lean']
+    terrain_score = np.where(
+        df['party'] == 'D',
+        np.where(lean < 0, df['partisan_lean_strength'], -lean),
+        np.where(lean > 0, df['partisan_lean_strength'], lean)
+    )
+    return (
+        (df['vs_top_ticket'] * 0.4) +  # Overperformance vs top ticket
+        ((df['percentage'] - 50) * 0.3) +  # Margin of victory
+        (terrain_score * 0.3)  # Performance in unfavorable terrain
+    )
+
+
+# Columns of the single-year calculate_vs_top_ticket() rows
+VIEW_COLUMNS = [
+    'district', 'district_type', 'candidate', 'party', 'votes', 'percentage',
+    'top_ticket_candidate', 'top_ticket_pct', 'vs_top_ticket', 'partisan_lean',
+    'partisan_lean_strength', 'favorable_district'
+]
+
+
 class DistrictCandidateAnalyzer:
-    """Analyze district candidates vs. statewide candidates"""
+    """
+    Analyze district candidates vs. statewide candidates in one year
+
+    A year-filtered view of MultiYearDistrictCandidateAnalyzer: every
+    query is answered from the multi-year engine's tables for self.year,
+    so both analyzers always agree.
+    """
+
+    def __init__(self, year=2024, analyzer=None):
+        """
+        Initialize the view
+
+        Parameters:
+        - year: Election year of the view
+        - analyzer: MultiYearDistrictCandidateAnalyzer to share. With one
+          given, constructing a view costs nothing. Without one, each view
+          builds its own multi-year engine, whose first query loads (or
+          materializes) that level's fact table for every year; pass a
+          shared engine when creating views for several years.
+        """
+        if analyzer is None:
+            from district_candidate_analyzer_multiyear import MultiYearDistrictCandidateAnalyzer
+            analyzer = MultiYearDistrictCandidateAnalyzer()
+        self.analyzer = analyzer
+        self.year = year
+
+    # Race and statewide tables of the view's year (sliced on access)
+
+    @property
+    def house_races(self):
+        return self._slice(self.analyzer.house_races)
 
-    def __init__(self):
-        """Initialize analyzer with both district races and statewide data"""
-        # Load district races (actual State House/Senate elections)
-        self.house_races = pd.read_csv('texas_election_data/pdf_extracts/2024_house_races.csv')
-        self.senate_races = pd.read_csv('texas_election_data/pdf_extracts/2024_senate_races.csv')
+    @property
+    def senate_races(self):
+        return self._slice(self.analyzer.senate_races)
 
-        # Load statewide races broken down by district
-        self.statewide_by_house = pd.read_csv('texas_election_data/pdf_extracts/2024_house_district_results.csv')
-        self.statewide_by_senate = pd.read_csv('texas_election_data/pdf_extracts/2024_senate_results.csv')
+    @property
+    def statewide_by_house(self):
+        return self._slice(self.analyzer.statewide_by_house)
 
-        print(f"Loaded {len(self.house_races)} House race records")
-        print(f"Loaded {len(self.senate_races)} Senate race records")
-        print(f"Loaded {len(self.statewide_by_house)} statewide results by House district")
-        print(f"Loaded {len(self.statewide_by_senate)} statewide results by Senate district")
+    @property
+    def statewide_by_senate(self):
+        return self._slice(self.analyzer.statewide_by_senate)
 
-    def calculate_vs_top_ticket(self, district_level='house', year=2024):
+    def _slice(self, df):
+        return None if df is None else df[df['year'] == self.year]
+
+    def calculate_vs_top_ticket(self, district_level='house', year=None):
         """
         Calculate how district candidates performed vs. top-of-ticket in their districts
 
+        Parameters:
+        - district_level: 'house', 'senate', or 'congressional'
+        - year: Year to use instead of the view's year
+
         Returns DataFrame with:
         - District candidate info
         - Top-of-ticket performance in that district
         - Overperformance/underperformance
         """
-        if district_level == 'house':
-            district_races = self.house_races[self.house_races['year'] == year].copy()
-            statewide_data = self.statewide_by_house[
-                (self.statewide_by_house['year'] == year) &
-                (self.statewide_by_house['district'] != 'STATE')
-            ].copy()
-            top_office = 'President'  # 2024 is presidential year
-        else:
-            district_races = self.senate_races[self.senate_races['year'] == year].copy()
-            statewide_data = self.statewide_by_senate[
-                (self.statewide_by_senate['year'] == year) &
-                (self.statewide_by_senate['district'] != 'STATE')
-            ].copy()
-            top_office = 'President'
-
-        # Get top-of-ticket results
-        top_ticket = statewide_data[statewide_data['office'] == top_office].copy()
-
-        # Ensure districts are strings for merging
-        district_races['district'] = district_races['district'].astype(str)
-        top_ticket['district'] = top_ticket['district'].astype(str)
-
-        results = []
-
-        for _, race_row in district_races.iterrows():
-            district = race_row['district']
-            candidate = race_row['candidate']
-            party = race_row['party']
-            votes = race_row['votes']
-            pct = race_row['percentage']
-
-            # Get top-ticket performance for this party in this district
-            top_ticket_dist = top_ticket[
-                (top_ticket['district'] == district) &
-                (top_ticket['party'] == party)
-            ]
-
-            if not top_ticket_dist.empty:
-                top_ticket_pct = top_ticket_dist['percentage'].values[0]
-                top_ticket_candidate = top_ticket_dist['candidate'].values[0]
-                vs_top_ticket = pct - top_ticket_pct
-
-                # Calculate district partisan lean (D-R margin in presidential race)
-                district_top = top_ticket[top_ticket['district'] == district]
-                dem_pct = district_top[district_top['party'] == 'D']['percentage'].sum()
-                rep_pct = district_top[district_top['party'] == 'R']['percentage'].sum()
-                partisan_lean = dem_pct - rep_pct  # Positive = D-leaning, Negative = R-leaning
-
-                # Determine if district leans toward or away from candidate's party
-                if party == 'D':
-                    favorable_district = partisan_lean > 0
-                elif party == 'R':
-                    favorable_district = partisan_lean < 0
-                else:
-                    favorable_district = None
-
-                results.append({
-                    'district': district,
-                    'district_type': district_level,
-                    'candidate': candidate,
-                    'party': party,
-                    'votes': votes,
-                    'percentage': pct,
-                    'top_ticket_candidate': top_ticket_candidate,
-                    'top_ticket_pct': top_ticket_pct,
-                    'vs_top_ticket': vs_top_ticket,
-                    'partisan_lean': partisan_lean,
-                    'partisan_lean_strength': abs(partisan_lean),
-                    'favorable_district': favorable_district
-                })
-
-        return pd.DataFrame(results)
+        df = self.analyzer.calculate_vs_top_ticket(district_level=district_level, year=year or self.year)
+        if df.empty:
+            return pd.DataFrame(columns=VIEW_COLUMNS)
+        return df[VIEW_COLUMNS]
 
     def identify_strong_candidates(self, district_level='house', min_vs_top_ticket=2.0,
                                    party=None):
@@ -128,19 +127,12 @@ class DistrictCandidateAnalyzer:
 
         Returns: DataFrame of strong candidates sorted by vs_top_ticket
         """
-        df = self.calculate_vs_top_ticket(district_level=district_level)
-
-        # Filter by party if specified
-        if party:
-            df = df[df['party'] == party]
-
-        # Filter by minimum outperformance
-        strong = df[df['vs_top_ticket'] >= min_vs_top_ticket].copy()
-
-        # Sort by overperformance
-        strong = strong.sort_values('vs_top_ticket', ascending=False)
-
-        return strong
+        strong = self.analyzer.identify_strong_candidates(
+            district_level=district_level, year=self.year,
+            min_vs_top_ticket=min_vs_top_ticket, party=party,
+            require_major_party_opponent=False, require_contested=False
+        )
+        return strong[VIEW_COLUMNS]
 
     def identify_crossover_appeal_candidates(self, district_level='house', party=None):
         """
@@ -148,24 +140,11 @@ class DistrictCandidateAnalyzer:
 
         These candidates have crossover appeal and could be strong statewide prospects
         """
-        df = self.calculate_vs_top_ticket(district_level=district_level)
-
-        # Filter by party if specified
-        if party:
-            df = df[df['party'] == party]
-
-        # Get candidates who won (>50%) in unfavorable districts
-        # OR who lost but significantly outperformed top-of-ticket in unfavorable districts
-        crossover = df[
-            (df['favorable_district'] == False) &
-            ((df['percentage'] > 50) | (df['vs_top_ticket'] > 5))
-        ].copy()
-
-        # Sort by partisan lean strength (harder districts first) then by vs_top_ticket
-        crossover = crossover.sort_values(['partisan_lean_strength', 'vs_top_ticket'],
-                                          ascending=[False, False])
-
-        return crossover
+        crossover = self.analyzer.identify_crossover_appeal_candidates(
+            district_level=district_level, year=self.year, party=party,
+            require_major_party_opponent=False
+        )
+        return crossover[VIEW_COLUMNS]
 
     def compare_to_statewide_candidate(self, statewide_candidate, district_level='house'):
         """
@@ -177,7 +156,7 @@ class DistrictCandidateAnalyzer:
 
         # Filter to same party as statewide candidate
         # For now, we'll get the results for both parties and let user filter
-        return df.sort_values('vs_top_ticket', ascending=False)
+        return df.sort_values('vs_top_ticket', ascending=False, kind='stable')
 
     def generate_recruitment_report(self, party, district_level='house'):
         """
@@ -194,18 +173,7 @@ class DistrictCandidateAnalyzer:
         df = df[df['party'] == party].copy()
 
         # Score candidates
-        # For unfavorable terrain: if D candidate, negative partisan_lean is unfavorable (R-leaning)
-        # if R candidate, positive partisan_lean is unfavorable (D-leaning)
-        if party == 'D':
-            terrain_score = np.where(df['partisan_lean'] < 0, df['partisan_lean_strength'], -df['partisan_lean'])
-        else:
-            terrain_score = np.where(df['partisan_lean'] > 0, df['partisan_lean_strength'], df['partisan_lean'])
-
-        df['recruitment_score'] = (
-            (df['vs_top_ticket'] * 0.4) +  # Overperformance vs top ticket
-            ((df['percentage'] - 50) * 0.3) +  # Margin of victory
-            (terrain_score * 0.3)  # Performance in unfavorable terrain
-        )
+        df['recruitment_score'] = recruitment_score(df)
 
         # Filter to winners only
         winners = df[df['percentage'] > 50].copy()
@@ -9,61 +9,114 @@ import sys
 if sys.platform == 'win32':
     sys.stdout.reconfigure(encoding='utf-8')
 
+import re
+
 import pandas as pd
 import numpy as np
 from typing import Dict, List
 
+from fact_paths import (
+    crossover_candidate_filter, crossover_performance, faced_major_party_opponent,
+    statewide_file, strong_candidate_filter, was_contested
+)
+from instrumentation import instrumented, log, stage, warn
+from ranking_index import check_top_n
+
+# Columns returned by the candidate tracking methods
+TRACK_COLUMNS = [
+    'year', 'district', 'candidate', 'party', 'percentage',
+    'top_ticket_candidate', 'top_ticket_pct', 'vs_top_ticket',
+    'partisan_lean', 'has_major_party_opponent', 'opposition_strength',
+    'winning_margin'
+]
+
 class MultiYearDistrictCandidateAnalyzer:
     """Analyze district candidates vs. statewide candidates across multiple years"""
 
-    def __init__(self):
-        """Initialize analyzer with all years of data"""
-        # Load district races (actual State House/Senate elections)
-        self.house_races_2024 = pd.read_csv('texas_election_data/pdf_extracts/2024_house_races.csv')
-        self.house_races_2018_2022 = pd.read_csv('texas_election_data/pdf_extracts/2018_2022_house_races.csv')
-        self.house_races = pd.concat([self.house_races_2018_2022, self.house_races_2024], ignore_index=True)
+    # Raw CSV frames set by _load_data()
+    _RAW_DATA = {
+        'house_races', 'house_races_2024', 'house_races_2018_2022',
+        'senate_races', 'senate_races_2024', 'senate_races_2018_2022',
+        'congressional_races', 'statewide_by_house', 'statewide_by_senate',
+        'statewide_by_congressional'
+    }
 
-        self.senate_races_2024 = pd.read_csv('texas_election_data/pdf_extracts/2024_senate_races.csv')
-        self.senate_races_2018_2022 = pd.read_csv('texas_election_data/pdf_extracts/2018_2022_senate_races.csv')
-        self.senate_races = pd.concat([self.senate_races_2018_2022, self.senate_races_2024], ignore_index=True)
-
-        # Load congressional races (U.S. House)
-        self.congressional_races = pd.read_csv('texas_election_data/pdf_extracts/2018_2024_congressional_races.csv')
+    def __init__(self, use_fact_tables=True):
+        """
+        Initialize analyzer with all years of data
 
-        # Load statewide races broken down by district (use CORRECT file if available)
-        import os
-        if os.path.exists('texas_election_data/pdf_extracts/2018_2024_house_results_combined_CORRECT.csv'):
-            self.statewide_by_house = pd.read_csv('texas_election_data/pdf_extracts/2018_2024_house_results_combined_CORRECT.csv')
-        else:
-            self.statewide_by_house = pd.read_csv('texas_election_data/pdf_extracts/2018_2024_house_district_results_all.csv')
-
-        # Load statewide by Senate (use CORRECT file if available)
-        import os
-        self.statewide_by_senate = None
-        if os.path.exists('texas_election_data/pdf_extracts/2018_2024_senate_results_combined_CORRECT.csv'):
-            self.statewide_by_senate = pd.read_csv('texas_election_data/pdf_extracts/2018_2024_senate_results_combined_CORRECT.csv')
-        elif os.path.exists('texas_election_data/pdf_extracts/2018_2024_senate_results_combined.csv'):
-            self.statewide_by_senate = pd.read_csv('texas_election_data/pdf_extracts/2018_2024_senate_results_combined.csv')
-
-        # Congressional statewide data (use CORRECT file if available)
-        self.statewide_by_congressional = None
-        if os.path.exists('texas_election_data/pdf_extracts/2018_2024_congressional_results_combined_CORRECT.csv'):
-            self.statewide_by_congressional = pd.read_csv('texas_election_data/pdf_extracts/2018_2024_congressional_results_combined_CORRECT.csv')
-        elif os.path.exists('texas_election_data/pdf_extracts/2020_2024_congressional_presidential_dailykos.csv'):
-            self.statewide_by_congressional = pd.read_csv('texas_election_data/pdf_extracts/2020_2024_congressional_presidential_dailykos.csv')
-        elif os.path.exists('texas_election_data/pdf_extracts/2018_2024_congressional_results_combined.csv'):
-            self.statewide_by_congressional = pd.read_csv('texas_election_data/pdf_extracts/2018_2024_congressional_results_combined.csv')
-
-        print(f"Loaded {len(self.house_races)} House race records ({len(self.house_races['year'].unique())} years)")
-        print(f"Loaded {len(self.senate_races)} Senate race records ({len(self.senate_races['year'].unique())} years)")
-        print(f"Loaded {len(self.congressional_races)} Congressional race records ({len(self.congressional_races['year'].unique())} years)")
+        Parameters:
+        - use_fact_tables: Answer calculate_vs_top_ticket() from the
+          materialized fact tables (see fact_tables.py) instead of
+          recomputing the joins row by row. The raw CSVs are then only
+          read when something needs them (e.g. roll-off or the row path).
+        """
+        self.use_fact_tables = use_fact_tables
+        self._fact_tables = {}
+        self._rankings = {}
+        self._rolloff = None
+
+        if not use_fact_tables:
+            self._load_data()
+
+    def __getattr__(self, name):
+        """Read the raw CSVs on first access to any of their frames"""
+        if name in type(self)._RAW_DATA:
+            self._load_data()
+            return self.__dict__[name]
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def _load_data(self):
+        """Load district races and statewide-by-district results for every year"""
+        with stage('load', 'MultiYearDistrictCandidateAnalyzer') as s:
+            # Load district races (actual State House/Senate elections)
+            self.house_races_2024 = pd.read_csv('texas_election_data/pdf_extracts/2024_house_races.csv')
+            self.house_races_2018_2022 = pd.read_csv('texas_election_data/pdf_extracts/2018_2022_house_races.csv')
+            self.house_races = pd.concat([self.house_races_2018_2022, self.house_races_2024], ignore_index=True)
+
+            self.senate_races_2024 = pd.read_csv('texas_election_data/pdf_extracts/2024_senate_races.csv')
+            self.senate_races_2018_2022 = pd.read_csv('texas_election_data/pdf_extracts/2018_2022_senate_races.csv')
+            self.senate_races = pd.concat([self.senate_races_2018_2022, self.senate_races_2024], ignore_index=True)
+
+            # Load congressional races (U.S. House)
+            self.congressional_races = pd.read_csv('texas_election_data/pdf_extracts/2018_2024_congressional_races.csv')
+
+            # Load statewide races broken down by district (use CORRECT file if available)
+            import os
+            if os.path.exists('texas_election_data/pdf_extracts/2018_2024_house_results_combined_CORRECT.csv'):
+                self.statewide_by_house = pd.read_csv('texas_election_data/pdf_extracts/2018_2024_house_results_combined_CORRECT.csv')
+            else:
+                self.statewide_by_house = pd.read_csv('texas_election_data/pdf_extracts/2018_2024_house_district_results_all.csv')
+
+            # Load statewide by Senate (use CORRECT file if available)
+            import os
+            self.statewide_by_senate = None
+            if os.path.exists('texas_election_data/pdf_extracts/2018_2024_senate_results_combined_CORRECT.csv'):
+                self.statewide_by_senate = pd.read_csv('texas_election_data/pdf_extracts/2018_2024_senate_results_combined_CORRECT.csv')
+            elif os.path.exists('texas_election_data/pdf_extracts/2018_2024_senate_results_combined.csv'):
+                self.statewide_by_senate = pd.read_csv('texas_election_data/pdf_extracts/2018_2024_senate_results_combined.csv')
+
+            # Congressional statewide data (use CORRECT file if available)
+            self.statewide_by_congressional = None
+            if os.path.exists('texas_election_data/pdf_extracts/2018_2024_congressional_results_combined_CORRECT.csv'):
+                self.statewide_by_congressional = pd.read_csv('texas_election_data/pdf_extracts/2018_2024_congressional_results_combined_CORRECT.csv')
+            elif os.path.exists('texas_election_data/pdf_extracts/2020_2024_congressional_presidential_dailykos.csv'):
+                self.statewide_by_congressional = pd.read_csv('texas_election_data/pdf_extracts/2020_2024_congressional_presidential_dailykos.csv')
+            elif os.path.exists('texas_election_data/pdf_extracts/2018_2024_congressional_results_combined.csv'):
+                self.statewide_by_congressional = pd.read_csv('texas_election_data/pdf_extracts/2018_2024_congressional_results_combined.csv')
+
+            s.rows = len(self.house_races) + len(self.senate_races) + len(self.congressional_races)
+
+        log(f"Loaded {len(self.house_races)} House race records ({len(self.house_races['year'].unique())} years)")
+        log(f"Loaded {len(self.senate_races)} Senate race records ({len(self.senate_races['year'].unique())} years)")
+        log(f"Loaded {len(self.congressional_races)} Congressional race records ({len(self.congressional_races['year'].unique())} years)")
         if self.statewide_by_senate is None:
-            print("⚠ Senate statewide data unavailable - vs_top_ticket analysis disabled for senate races")
+            warn("⚠ Senate statewide data unavailable - vs_top_ticket analysis disabled for senate races")
         else:
-            print(f"✓ Senate statewide data loaded ({len(self.statewide_by_senate)} records, {len(self.statewide_by_senate['year'].unique())} years)")
+            log(f"✓ Senate statewide data loaded ({len(self.statewide_by_senate)} records, {len(self.statewide_by_senate['year'].unique())} years)")
         if self.statewide_by_congressional is None:
-            print("⚠ Congressional statewide data unavailable - vs_top_ticket analysis disabled for congressional races")
-        print(f"Years available: {sorted(self.house_races['year'].unique())}")
+            warn("⚠ Congressional statewide data unavailable - vs_top_ticket analysis disabled for congressional races")
+        log(f"Years available: {sorted(self.house_races['year'].unique())}")
 
     def classify_race_competitiveness(self, district_races_for_office):
         """
@@ -124,16 +177,89 @@ class MultiYearDistrictCandidateAnalyzer:
 
         return pd.DataFrame(results)
 
-    def calculate_vs_top_ticket(self, district_level='house', year=None):
+    def get_fact_table(self, district_level='house'):
+        """
+        Materialized fact table for a level (built on first use if the
+        input files changed since it was last written)
+        """
+        if district_level not in self._fact_tables:
+            from fact_tables import load_fact_table
+            self._fact_tables[district_level] = load_fact_table(district_level)
+        return self._fact_tables[district_level]
+
+    def get_ranking(self, district_level='house', kind='strong'):
+        """
+        Presorted ranking index over calculate_vs_top_ticket() rows (see
+        ranking_index.py), built on first use
+
+        Parameters:
+        - district_level: 'house', 'senate', or 'congressional'
+        - kind: 'strong' (ranked by vs_top_ticket) or 'crossover' (ranked
+          by partisan_lean_strength, then vs_top_ticket)
+        """
+        key = (district_level, kind)
+        if key not in self._rankings:
+            from ranking_index import RankingIndex
+
+            df = self.calculate_vs_top_ticket(district_level=district_level)
+            masks = {
+                'major_party_opponent': faced_major_party_opponent(df),
+                'contested': was_contested(df),
+                'crossover': crossover_performance(df)
+            }
+            score = 'vs_top_ticket' if kind == 'strong' else ['partisan_lean_strength', 'vs_top_ticket']
+            self._rankings[key] = RankingIndex(df, score, masks)
+        return self._rankings[key]
+
+    def get_rolloff(self, district_level='house'):
+        """
+        Ballot roll-off for every district race at a level
+
+        Built from the already-loaded race and statewide files (see
+        rolloff_analysis.py) and cached across calls.
+        """
+        if self._rolloff is None:
+            from rolloff_analysis import RolloffAnalyzer
+
+            statewide = {
+                'house': self.statewide_by_house,
+                'senate': self.statewide_by_senate,
+                'congressional': self.statewide_by_congressional
+            }
+            self._rolloff = RolloffAnalyzer(
+                district_races={
+                    'house': self.house_races,
+                    'senate': self.senate_races,
+                    'congressional': self.congressional_races
+                },
+                statewide_data={level: df for level, df in statewide.items() if df is not None}
+            )
+
+        return self._rolloff.compute(district_level)
+
+    @instrumented('aggregate', args=('district_level', 'year'))
+    def calculate_vs_top_ticket(self, district_level='house', year=None, include_rolloff=False):
         """
         Calculate how district candidates performed vs. top-of-ticket in their districts
 
         Parameters:
         - district_level: 'house', 'senate', or 'congressional'
         - year: Specific year, or None for all years
+        - include_rolloff: Add the race's roll-off rate, the candidate's
+          party drop-off from the top of the ticket and rolloff_note (why
+          they are NaN, e.g. the race ran under a different plan)
 
         Returns DataFrame with competitiveness flags
         """
+        if district_level in ('senate', 'congressional') and statewide_file(district_level) is None:
+            raise ValueError(f"{district_level.capitalize()} statewide data is not available. "
+                             f"vs_top_ticket analysis cannot be performed for {district_level} races.")
+
+        if self.use_fact_tables:
+            from fact_tables import vs_top_ticket_view
+            results = vs_top_ticket_view(self.get_fact_table(district_level), year)
+            return self._with_rolloff(results, district_level, include_rolloff)
+
         if district_level == 'house':
             district_races = self.house_races.copy()
             statewide_data = self.statewide_by_house.copy()
@@ -237,12 +363,19 @@ class MultiYearDistrictCandidateAnalyzer:
                     'opposition_strength': race_row['opposition_strength']
                 })
 
-        return pd.DataFrame(results)
+        return self._with_rolloff(pd.DataFrame(results), district_level, include_rolloff)
+
+    def _with_rolloff(self, results, district_level, include_rolloff):
+        """Add roll-off features to vs_top_ticket rows when requested"""
+        if include_rolloff and not results.empty:
+            self.get_rolloff(district_level)
+            results = self._rolloff.add_candidate_features(results, district_level)
+        return results
 
     def identify_strong_candidates(self, district_level='house', year=None,
                                    min_vs_top_ticket=2.0, party=None,
                                    require_major_party_opponent=True,
-                                   require_contested=True):
+                                   require_contested=True, top_n=None):
         """
         Identify strong district candidates with filters for race quality
 
@@ -253,56 +386,57 @@ class MultiYearDistrictCandidateAnalyzer:
         - party: Filter by party ('D', 'R', or None)
         - require_major_party_opponent: Only include races with both D and R
         - require_contested: Only include contested races
+        - top_n: Number of results to return (None for all; < 1 raises ValueError)
         """
-        df = self.calculate_vs_top_ticket(district_level=district_level, year=year)
-
-        # Apply competitiveness filters
-        if require_major_party_opponent:
-            df = df[df['has_major_party_opponent'] == True]
+        check_top_n(top_n)
+        if self.use_fact_tables:
+            where = []
+            if require_major_party_opponent:
+                where.append('major_party_opponent')
+            if require_contested:
+                where.append('contested')
+            return self.get_ranking(district_level, 'strong').top(
+                party=party or None, year=year or None, where=where,
+                min_score=min_vs_top_ticket, top_n=top_n
+            )
 
-        if require_contested:
-            df = df[df['is_contested'] == True]
-
-        # Filter by party if specified
-        if party:
-            df = df[df['party'] == party]
+        df = self.calculate_vs_top_ticket(district_level=district_level, year=year)
 
-        # Filter by minimum outperformance
-        strong = df[df['vs_top_ticket'] >= min_vs_top_ticket].copy()
+        # Competitiveness, party and minimum outperformance filters
+        strong = df[strong_candidate_filter(
+            df, min_vs_top_ticket, party, require_major_party_opponent, require_contested
+        )].copy()
 
         # Sort by overperformance
-        strong = strong.sort_values('vs_top_ticket', ascending=False)
+        strong = strong.sort_values('vs_top_ticket', ascending=False, kind='stable')
 
-        return strong
+        return strong if top_n is None else strong.head(top_n)
 
     def identify_crossover_appeal_candidates(self, district_level='house', year=None,
-                                            party=None, require_major_party_opponent=True):
+                                            party=None, require_major_party_opponent=True,
+                                            top_n=None):
         """
         Identify candidates who won or performed well in unfavorable districts
 
         Only includes candidates who faced real opposition
         """
-        df = self.calculate_vs_top_ticket(district_level=district_level, year=year)
-
-        # Apply competitiveness filter
-        if require_major_party_opponent:
-            df = df[df['has_major_party_opponent'] == True]
+        check_top_n(top_n)
+        if self.use_fact_tables:
+            where = ['major_party_opponent'] if require_major_party_opponent else []
+            return self.get_ranking(district_level, 'crossover').top(
+                party=party or None, year=year or None, where=where + ['crossover'], top_n=top_n
+            )
 
-        # Filter by party if specified
-        if party:
-            df = df[df['party'] == party]
+        df = self.calculate_vs_top_ticket(district_level=district_level, year=year)
 
-        # Get candidates in unfavorable districts who won or outperformed significantly
-        crossover = df[
-            (df['favorable_district'] == False) &
-            ((df['percentage'] > 50) | (df['vs_top_ticket'] > 5))
-        ].copy()
+        # Candidates in unfavorable districts who won or outperformed significantly
+        crossover = df[crossover_candidate_filter(df, party, require_major_party_opponent)].copy()
 
         # Sort by partisan lean strength then vs_top_ticket
         crossover = crossover.sort_values(['partisan_lean_strength', 'vs_top_ticket'],
-                                          ascending=[False, False])
+                                          ascending=[False, False], kind='stable')
 
-        return crossover
+        return crossover if top_n is None else crossover.head(top_n)
 
     def track_candidate_over_time(self, candidate_name, district_level='house'):
         """
@@ -312,39 +446,105 @@ class MultiYearDistrictCandidateAnalyzer:
         - candidate_name: Candidate's name (partial match OK)
         - district_level: 'house' or 'senate'
         """
-        df = self.calculate_vs_top_ticket(district_level=district_level)
-
-        # Find candidates matching name
-        matches = df[df['candidate'].str.contains(candidate_name, case=False, na=False)]
+        matches = self.track_candidates_over_time([candidate_name], district_level=district_level)
 
         if matches.empty:
-            print(f"No candidates found matching '{candidate_name}'")
             return pd.DataFrame()
 
-        # Sort by year
-        matches = matches.sort_values('year')
+        return matches.drop(columns='query')
+
+    def track_candidates_over_time(self, candidate_names, district_level='house', regex=True):
+        """
+        Track a slate of candidates across multiple elections in one pass
+
+        All names are compiled into a single case-insensitive pattern that is
+        run once per distinct candidate name (not once per row); only the
+        names it hits are then attributed to individual queries.
+
+        Parameters:
+        - candidate_names: List of names or patterns (partial match OK)
+        - district_level: 'house', 'senate', or 'congressional'
+        - regex: Treat names as regular expressions, as str.contains() does
+          (False matches them literally)
 
-        return matches[[
-            'year', 'district', 'candidate', 'party', 'percentage',
-            'top_ticket_candidate', 'top_ticket_pct', 'vs_top_ticket',
-            'partisan_lean', 'has_major_party_opponent', 'opposition_strength',
-            'winning_margin'
-        ]]
+        Raises ValueError naming the pattern if a name is not a valid
+        regular expression.
 
-    def compare_years(self, year1, year2, district_level='house', party=None):
+        Returns tidy DataFrame with a 'query' column plus the columns of
+        track_candidate_over_time(), sorted by query (in the order given)
+        and year. A candidate matching several queries appears under each.
+        """
+        queries = list(dict.fromkeys(candidate_names))
+        columns = ['query'] + TRACK_COLUMNS
+        if not queries:
+            return pd.DataFrame(columns=columns)
+
+        patterns = [q if regex else re.escape(q) for q in queries]
+        compiled = []
+        for query, pattern in zip(queries, patterns):
+            try:
+                compiled.append(re.compile(pattern, re.IGNORECASE))
+            except re.error as e:
+                raise ValueError(f"Invalid candidate pattern '{query}': {e}") from e
+        try:
+            combined = re.compile('|'.join(f'(?:{p})' for p in patterns), re.IGNORECASE)
+        except re.error as e:
+            # Valid on their own but not together (e.g. a repeated group name)
+            raise ValueError(f"Candidate patterns {queries} cannot be combined: {e}") from e
+
+        df = self.calculate_vs_top_ticket(district_level=district_level)
+
+        # Match the candidate vocabulary, not every row
+        vocabulary = df['candidate'].dropna().unique() if not df.empty else []
+        hits = [name for name in vocabulary if combined.search(name)]
+        pairs = pd.DataFrame(
+            [(query, name) for name in hits
+             for query, pattern in zip(queries, compiled) if pattern.search(name)],
+            columns=['query', 'candidate']
+        )
+
+        matched = set(pairs['query'])
+        for query in queries:
+            if query not in matched:
+                warn(f"⚠ No candidates found matching '{query}'")
+
+        if pairs.empty:
+            return pd.DataFrame(columns=columns)
+
+        order = {query: i for i, query in enumerate(queries)}
+        matches = df.merge(pairs, on='candidate')
+        matches = matches.sort_values(
+            ['query', 'year'], key=lambda col: col.map(order) if col.name == 'query' else col,
+            kind='stable'
+        )
+
+        return matches[columns].reset_index(drop=True)
+
+    def compare_years(self, year1, year2, district_level='house', party=None, top_n=None):
         """
         Compare candidate performance between two years
 
         Useful for seeing trends: which districts improved/declined for a party
-        """
-        df = self.calculate_vs_top_ticket(district_level=district_level)
 
-        if party:
-            df = df[df['party'] == party]
+        Parameters:
+        - top_n: Number of results to return, largest pct_change first
+          (None for all)
+        """
+        from ranking_index import top_k
 
         # Get data for both years
-        year1_data = df[df['year'] == year1].copy()
-        year2_data = df[df['year'] == year2].copy()
+        if self.use_fact_tables:
+            ranking = self.get_ranking(district_level, 'strong')
+            year1_data = ranking.select(party=party or None, year=year1)
+            year2_data = ranking.select(party=party or None, year=year2)
+        else:
+            df = self.calculate_vs_top_ticket(district_level=district_level)
+
+            if party:
+                df = df[df['party'] == party]
+
+            year1_data = df[df['year'] == year1].copy()
+            year2_data = df[df['year'] == year2].copy()
 
         # Merge on district to compare
         comparison = year1_data.merge(
@@ -357,7 +557,7 @@ class MultiYearDistrictCandidateAnalyzer:
         comparison['pct_change'] = comparison[f'percentage_{year2}'] - comparison[f'percentage_{year1}']
         comparison['vs_ticket_change'] = comparison[f'vs_top_ticket_{year2}'] - comparison[f'vs_top_ticket_{year1}']
 
-        return comparison.sort_values('pct_change', ascending=False)
+        return comparison.take(top_k(comparison['pct_change'], top_n))
 
 
 def main():
@@ -376,12 +576,13 @@ def main():
         year=2022,
         party='D',
         min_vs_top_ticket=2.0,
-        require_major_party_opponent=True
+        require_major_party_opponent=True,
+        top_n=10
     )
     print(strong_d_2022[[
         'district', 'candidate', 'percentage', 'top_ticket_pct', 'vs_top_ticket',
         'opposition_strength', 'winning_margin', 'partisan_lean'
-    ]].head(10).to_string(index=False))
+    ]].to_string(index=False))
 
     # Example 2: Compare all years for a specific candidate
     print("\n" + "="*80)
@@ -397,12 +598,13 @@ def main():
         district_level='house',
         party='D',
         min_vs_top_ticket=5.0,
-        require_major_party_opponent=True
+        require_major_party_opponent=True,
+        top_n=15
     )
     print(strong_all[[
         'year', 'district', 'candidate', 'percentage', 'vs_top_ticket',
         'opposition_strength', 'partisan_lean'
-    ]].head(15).to_string(index=False))
+    ]].to_string(index=False))
 
     # Example 4: Crossover appeal - Democrats in R districts (2022)
     print("\n" + "="*80)
@@ -413,24 +615,25 @@ def main():
         district_level='house',
         year=2022,
         party='D',
-        require_major_party_opponent=True
+        require_major_party_opponent=True,
+        top_n=10
     )
     print(crossover_2022[[
         'district', 'candidate', 'percentage', 'vs_top_ticket',
         'partisan_lean', 'opposition_strength', 'winning_margin'
-    ]].head(10).to_string(index=False))
+    ]].to_string(index=False))
 
     # Example 5: Compare 2018 vs 2022 for Democrats
     print("\n" + "="*80)
     print("DEMOCRAT PERFORMANCE CHANGE: 2018 → 2022")
     print("(Districts with D candidates in both years)")
     print("="*80)
-    comparison = analyzer.compare_years(2018, 2022, district_level='house', party='D')
+    comparison = analyzer.compare_years(2018, 2022, district_level='house', party='D', top_n=10)
     print(comparison[[
         'district', f'candidate_2018', f'candidate_2022',
         f'percentage_2018', f'percentage_2022', 'pct_change',
         f'vs_top_ticket_2018', f'vs_top_ticket_2022', 'vs_ticket_change'
-    ]].head(10).to_string(index=False))
+    ]].to_string(index=False))
 
     # Example 6: Track specific candidate
     print("\n" + "="*80)
@@ -440,5 +643,12 @@ def main():
     if not lambert.empty:
         print(lambert.to_string(index=False))
 
+    # Example 7: Track a slate of candidates at once
+    print("\n" + "="*80)
+    print("SLATE TRACKING: Talarico, Lambert, Zwiener")
+    print("="*80)
+    slate = analyzer.track_candidates_over_time(['Talarico', 'Lambert', 'Zwiener'], district_level='house')
+    print(slate[['query', 'year', 'district', 'candidate', 'party', 'percentage', 'vs_top_ticket']].to_string(index=False))
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,185 @@
+"""
+Fact Table Locations and Shared Data Constants
+
+Input files, input hashes, Parquet paths and view columns of the
+district-year fact tables (see fact_tables.py), plus the data locations,
+district plans, office and party codes shared by the analysis modules,
+and the strong/crossover candidate filters. Standard library only, so
+callers that just need to find a current table or filter its rows (e.g.
+the texas-election CLI) can do so without importing pandas.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+PDF_EXTRACTS = 'texas_election_data/pdf_extracts'
+FACT_DIR = Path('texas_election_data/facts')
+
+# Bump when the derived columns change so stale tables are rebuilt
+FACT_TABLE_VERSION = 1
+
+# Actual district races for each level
+RACE_FILES = {
+    'house': [f'{PDF_EXTRACTS}/2018_2022_house_races.csv', f'{PDF_EXTRACTS}/2024_house_races.csv'],
+    'senate': [f'{PDF_EXTRACTS}/2018_2022_senate_races.csv', f'{PDF_EXTRACTS}/2024_senate_races.csv'],
+    'congressional': [f'{PDF_EXTRACTS}/2018_2024_congressional_races.csv']
+}
+
+# Statewide-by-district sources in order of preference (same as the analyzers)
+STATEWIDE_CANDIDATES = {
+    'house': [
+        f'{PDF_EXTRACTS}/2018_2024_house_results_combined_CORRECT.csv',
+        f'{PDF_EXTRACTS}/2018_2024_house_district_results_all.csv'
+    ],
+    'senate': [
+        f'{PDF_EXTRACTS}/2018_2024_senate_results_combined_CORRECT.csv',
+        f'{PDF_EXTRACTS}/2018_2024_senate_results_combined.csv'
+    ],
+    'congressional': [
+        f'{PDF_EXTRACTS}/2018_2024_congressional_results_combined_CORRECT.csv',
+        f'{PDF_EXTRACTS}/2020_2024_congressional_presidential_dailykos.csv',
+        f'{PDF_EXTRACTS}/2018_2024_congressional_results_combined.csv'
+    ]
+}
+
+# Statewide-results-by-district file the analysis modules read for each level
+STATEWIDE_FILES = {level: files[0] for level, files in STATEWIDE_CANDIDATES.items()}
+
+# District plan each year's statewide-by-district results are re-tabulated under
+STATEWIDE_PLANS = {
+    'house': {2018: 'PLANH2316', 2020: 'PLANH2316', 2022: 'PLANH2316', 2024: 'PLANH2316'},
+    'senate': {2018: 'PLANS172', 2020: 'PLANS172', 2022: 'PLANS2168', 2024: 'PLANS2168'},
+    'congressional': {2018: 'PLANC2100', 2020: 'PLANC2100', 2022: 'PLANC2193', 2024: 'PLANC2193'}
+}
+
+# District plan each year's district races (RACE_FILES) were run under
+RACE_PLANS = {
+    'house': {2018: 'PLANH358', 2020: 'PLANH358', 2022: 'PLANH2316', 2024: 'PLANH2316'},
+    'senate': {2018: 'PLANS172', 2020: 'PLANS172', 2022: 'PLANS2168', 2024: 'PLANS2168'},
+    'congressional': {2018: 'PLANC2100', 2020: 'PLANC2100', 2022: 'PLANC2193', 2024: 'PLANC2193'}
+}
+
+# OpenElections precinct-level general election files
+PRECINCT_FILES = {
+    2016: 'texas_election_data/clean/openelections_2016_general_precinct.csv',
+    2018: 'texas_election_data/clean/openelections_2018_general_precinct.csv'
+}
+
+STATEWIDE_OFFICES = ['President', 'U.S. Senate', 'Governor', 'Lieutenant Governor', 'Attorney General']
+
+# Long party names in the precinct/legacy files -> one-letter codes
+PARTY_CODES = {'DEM': 'D', 'REP': 'R', 'LIB': 'L', 'GRN': 'G'}
+
+# Column order of calculate_vs_top_ticket() output
+VS_TOP_TICKET_COLUMNS = [
+    'year', 'district', 'district_type', 'candidate', 'party', 'votes', 'percentage',
+    'top_ticket_candidate', 'top_ticket_pct', 'vs_top_ticket', 'partisan_lean',
+    'partisan_lean_strength', 'favorable_district', 'has_major_party_opponent',
+    'is_contested', 'is_competitive', 'winning_margin', 'opposition_strength'
+]
+
+
+def top_ticket_office(district_level, year):
+    """
+    Top-of-ticket office for a level and year (None if no top-ticket race)
+
+    U.S. Senate for State Senate races, otherwise President (2020/2024) or
+    Governor (2018/2022), as in the district analyzers.
+    """
+    if district_level == 'senate':
+        return 'U.S. Senate'
+    return {2020: 'President', 2024: 'President', 2018: 'Governor', 2022: 'Governor'}.get(year)
+
+
+# Candidate filters of identify_strong_candidates() and
+# identify_crossover_appeal_candidates(). Each takes either one
+# vs_top_ticket row (a dict; returns a bool) or a whole DataFrame (returns
+# a boolean Series), so the analyzer and the pandas-free CLI share them.
+
+def faced_major_party_opponent(r):
+    """Race had both a D and an R candidate"""
+    return r['has_major_party_opponent'] == True
+
+
+def was_contested(r):
+    """Race had more than one candidate"""
+    return r['is_contested'] == True
+
+
+def crossover_performance(r):
+    """Unfavorable district, and the candidate won or beat the top of the ticket by 5+"""
+    return (r['favorable_district'] == False) & ((r['percentage'] > 50) | (r['vs_top_ticket'] > 5))
+
+
+def strong_candidate_filter(r, min_vs_top_ticket=2.0, party=None,
+                            require_major_party_opponent=True, require_contested=True):
+    """Rows identify_strong_candidates() keeps (before sorting by vs_top_ticket)"""
+    keep = r['vs_top_ticket'] >= min_vs_top_ticket
+    if require_major_party_opponent:
+        keep = keep & faced_major_party_opponent(r)
+    if require_contested:
+        keep = keep & was_contested(r)
+    if party:
+        keep = keep & (r['party'] == party)
+    return keep
+
+
+def crossover_candidate_filter(r, party=None, require_major_party_opponent=True):
+    """Rows identify_crossover_appeal_candidates() keeps (before sorting)"""
+    keep = crossover_performance(r)
+    if require_major_party_opponent:
+        keep = keep & faced_major_party_opponent(r)
+    if party:
+        keep = keep & (r['party'] == party)
+    return keep
+
+
+def statewide_file(district_level):
+    """First available statewide-by-district file for a level (None if none exist)"""
+    for path in STATEWIDE_CANDIDATES[district_level]:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def input_files(district_level):
+    """Every input file a level's fact table is built from"""
+    files = list(RACE_FILES[district_level])
+    statewide = statewide_file(district_level)
+    if statewide:
+        files.append(statewide)
+    return files
+
+
+# (path, size, mtime_ns) -> content digest, so unchanged files are read once per process
+_file_digests = {}
+
+
+def file_digest(path):
+    """SHA-256 of a file's bytes, re-read only when its size or mtime changes"""
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    if key not in _file_digests:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        _file_digests[key] = digest.hexdigest()
+    return _file_digests[key]
+
+
+def input_hash(district_level):
+    """Hash of the input file contents and FACT_TABLE_VERSION"""
+    digest = hashlib.sha256(f'v{FACT_TABLE_VERSION}'.encode())
+    for path in input_files(district_level):
+        digest.update(path.encode())
+        digest.update(file_digest(path).encode())
+    return digest.hexdigest()[:12]
+
+
+def fact_table_path(district_level, hash_value=None):
+    """Parquet path for a level's fact table at a given input hash"""
+    if hash_value is None:
+        hash_value = input_hash(district_level)
+    return FACT_DIR / f'{district_level}_facts_{hash_value}.parquet'
@@ -0,0 +1,305 @@
+"""
+District-Year Fact Tables
+
+Materializes one denormalized table per district level (house, senate,
+congressional) with every derived column the analyzers otherwise rebuild
+at query time:
+- District race result (year, district, candidate, party, votes, percentage)
+- Same-party top-of-ticket result and vs_top_ticket
+  (MultiYearDistrictCandidateAnalyzer.calculate_vs_top_ticket)
+- District partisan lean, lean strength, favorable district
+- Competitiveness flags (classify_race_competitiveness)
+- Incumbency, statewide environment, major-party opponent and vote margin
+  (PoliticalWARModel.prepare_training_data)
+
+Tables are written as Parquet, sorted by year and district, to
+texas_election_data/facts/{level}_facts_{hash}.parquet where the hash
+covers the bytes of every input file and FACT_TABLE_VERSION. Loading
+checks the hash, so a re-parsed input file triggers a rebuild on next use.
+Parquet needs pyarrow (or fastparquet); without one, load_fact_table()
+builds the table in memory on each load instead of writing it.
+
+Run this after the parse_* scripts to materialize all levels:
+    python analysis_tools/fact_tables.py
+"""
+
+import sys
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+import importlib.util
+
+import pandas as pd
+import numpy as np
+
+from fact_paths import (
+    FACT_DIR, FACT_TABLE_VERSION, RACE_FILES, STATEWIDE_CANDIDATES, VS_TOP_TICKET_COLUMNS,
+    top_ticket_office, statewide_file, input_files, input_hash, fact_table_path
+)
+from instrumentation import instrumented
+
+_warned_no_parquet = False
+
+
+def parquet_available():
+    """True if pandas has a Parquet engine (pyarrow or fastparquet) installed"""
+    return any(importlib.util.find_spec(engine) for engine in ('pyarrow', 'fastparquet'))
+
+
+def _competitiveness(races):
+    """
+    Race competitiveness flags per candidate row
+
+    Same rules as classify_race_competitiveness(): contested = more than one
+    candidate, margin = top two percentages, competitive = margin < 20.
+    """
+    keys = [races['year'], races['district']]
+
+    n_candidates = races.groupby(keys)['candidate'].transform('size')
+    has_d = races['party'].eq('D').groupby(keys).transform('any')
+    has_r = races['party'].eq('R').groupby(keys).transform('any')
+
+    ranked = races.sort_values('percentage', ascending=False, kind='stable')
+    rank = ranked.groupby([ranked['year'], ranked['district']]).cumcount()
+    first = ranked['percentage'].where(rank == 0).groupby([ranked['year'], ranked['district']]).transform('max')
+    second = ranked['percentage'].where(rank == 1).groupby([ranked['year'], ranked['district']]).transform('max')
+    margin = (first - second).reindex(races.index)
+
+    is_contested = n_candidates > 1
+    has_major = has_d & has_r
+    margin = margin.where(is_contested, 100.0)
+    is_competitive = is_contested & (margin < 20)
+
+    strength = np.select(
+        [~is_contested, ~has_major, margin < 10, margin < 20],
+        ['none', 'weak', 'strong', 'moderate'],
+        default='weak'
+    )
+
+    return pd.DataFrame({
+        'has_major_party_opponent': has_major,
+        'is_contested': is_contested,
+        'is_competitive': is_competitive,
+        'winning_margin': margin,
+        'opposition_strength': strength
+    }, index=races.index)
+
+
+@instrumented('incumbency', 'fact_tables')
+def _incumbency(races):
+    """
+    Incumbent flag: candidate won the same district two years earlier
+
+    Winners are the highest percentage in each (district, year), matching
+    PoliticalWARModel._detect_incumbency().
+    """
+    winners = races.loc[races.groupby(['district', 'year'])['percentage'].idxmax(),
+                        ['district', 'year', 'candidate']]
+    winners = winners.assign(year=winners['year'] + 2, is_incumbent=True)
+
+    flagged = races[['district', 'year', 'candidate']].merge(
+        winners, on=['district', 'year', 'candidate'], how='left'
+    )
+    return flagged['is_incumbent'].fillna(False).astype(bool).to_numpy()
+
+
+def _vote_margin(races):
+    """
+    Margin over the first opposing major-party candidate in the same race
+
+    NaN for third parties and for D/R candidates without a major-party opponent.
+    """
+    keys = ['year', 'district']
+    first_pct = races[races['party'].isin(['D', 'R'])].drop_duplicates(keys + ['party'])
+    first_pct = first_pct.pivot(index=keys, columns='party', values='percentage')
+    first_pct = first_pct.reindex(columns=['D', 'R'])
+
+    opponent = races[keys].merge(first_pct.reset_index(), on=keys, how='left')
+    opponent_pct = np.select(
+        [races['party'].to_numpy() == 'D', races['party'].to_numpy() == 'R'],
+        [opponent['R'].to_numpy(), opponent['D'].to_numpy()],
+        default=np.nan
+    )
+    return races['percentage'].to_numpy() - opponent_pct
+
+
+@instrumented('features', 'fact_tables', args=('district_level',))
+def build_fact_table(district_level):
+    """
+    Build a level's fact table from the raw CSVs (no caching)
+
+    Returns DataFrame with one row per district race candidate, sorted by
+    year and district.
+    """
+    races = pd.concat([pd.read_csv(path) for path in RACE_FILES[district_level]], ignore_index=True)
+    races['district'] = races['district'].astype(str)
+    races.insert(2, 'district_level', district_level)
+
+    facts = pd.concat([races, _competitiveness(races)], axis=1)
+    facts['is_incumbent'] = _incumbency(races)
+    facts['is_democrat'] = facts['party'] == 'D'
+    facts['vote_margin'] = _vote_margin(races)
+    facts['has_major_opponent'] = facts['vote_margin'].notna()
+
+    facts['top_ticket_office'] = facts['year'].map(lambda y: top_ticket_office(district_level, y))
+
+    path = statewide_file(district_level)
+    if path is None:
+        statewide = pd.DataFrame(columns=['year', 'district', 'office', 'candidate', 'party', 'percentage'])
+    else:
+        statewide = pd.read_csv(path)
+    statewide['district'] = statewide['district'].astype(str)
+    statewide = statewide[
+        statewide['office'] == statewide['year'].map(lambda y: top_ticket_office(district_level, y))
+    ]
+
+    # D% - R% in the top-of-ticket race, per district and statewide
+    margins = statewide.pivot_table(
+        index=['year', 'district'], columns='party', values='percentage', aggfunc='sum'
+    ).reindex(columns=['D', 'R']).fillna(0)
+    margins = (margins['D'] - margins['R']).rename('margin').reset_index()
+
+    lean = margins[margins['district'] != 'STATE'].rename(columns={'margin': 'partisan_lean'})
+    environment = margins[margins['district'] == 'STATE'][['year', 'margin']].rename(
+        columns={'margin': 'statewide_environment'}
+    )
+
+    same_party = statewide[statewide['district'] != 'STATE'].drop_duplicates(['year', 'district', 'party'])
+    same_party = same_party[['year', 'district', 'party', 'candidate', 'percentage']].rename(columns={
+        'candidate': 'top_ticket_candidate', 'percentage': 'top_ticket_pct'
+    })
+
+    facts = facts.merge(same_party, on=['year', 'district', 'party'], how='left')
+    facts = facts.merge(lean, on=['year', 'district'], how='left')
+    facts = facts.merge(environment, on='year', how='left')
+
+    facts['vs_top_ticket'] = facts['percentage'] - facts['top_ticket_pct']
+    facts['partisan_lean_strength'] = facts['partisan_lean'].abs()
+    facts['favorable_district'] = pd.array(
+        np.select(
+            [facts['party'] == 'D', facts['party'] == 'R'],
+            [facts['partisan_lean'] > 0, facts['partisan_lean'] < 0],
+            default=False
+        ),
+        dtype='boolean'
+    )
+    facts.loc[~facts['party'].isin(['D', 'R']) | facts['partisan_lean'].isna(), 'favorable_district'] = pd.NA
+
+    facts = facts.sort_values(
+        ['year', 'district'], key=lambda col: pd.to_numeric(col, errors='coerce'), kind='stable'
+    ).reset_index(drop=True)
+
+    return facts.astype({
+        'year': 'int64', 'votes': 'int64',
+        'district_level': 'category', 'office': 'category', 'party': 'category',
+        'top_ticket_office': 'category', 'opposition_strength': 'category'
+    })
+
+
+def materialize(district_level, force=False):
+    """
+    Write a level's fact table if the current inputs have no table yet
+
+    Older versions of the level's table are removed. Returns the path.
+    Raises ImportError if no Parquet engine is installed.
+    """
+    if not parquet_available():
+        raise ImportError("Writing fact tables needs pyarrow: pip install pyarrow")
+
+    hash_value = input_hash(district_level)
+    path = fact_table_path(district_level, hash_value)
+
+    if path.exists() and not force:
+        return path
+
+    FACT_DIR.mkdir(parents=True, exist_ok=True)
+    facts = build_fact_table(district_level)
+    facts.to_parquet(path, index=False)
+
+    for stale in FACT_DIR.glob(f'{district_level}_facts_*.parquet'):
+        if stale != path:
+            stale.unlink()
+
+    print(f"  ✓ Materialized {district_level} fact table: {len(facts):,} rows -> {path}")
+    return path
+
+
+@instrumented('load', 'fact_tables', args=('district_level',))
+def load_fact_table(district_level):
+    """
+    Read a level's fact table, materializing it first if the inputs changed
+
+    Without a Parquet engine the table is built in memory (same rows and
+    dtypes) and a warning is printed to stderr once.
+    """
+    global _warned_no_parquet
+    if not parquet_available():
+        if not _warned_no_parquet:
+            print("⚠ pyarrow is not installed; building fact tables in memory on each load "
+                  "(pip install pyarrow to cache them)", file=sys.stderr)
+            _warned_no_parquet = True
+        return build_fact_table(district_level)
+    return pd.read_parquet(materialize(district_level))
+
+
+def vs_top_ticket_view(facts, year=None):
+    """
+    Rows and columns of calculate_vs_top_ticket() from a fact table
+
+    Keeps candidates with a same-party top-of-ticket result, as the
+    per-row implementation does.
+    """
+    view = facts[facts['top_ticket_pct'].notna()]
+    if year:
+        view = view[view['year'] == year]
+
+    view = view.rename(columns={'district_level': 'district_type'})[VS_TOP_TICKET_COLUMNS].copy()
+    for col in ['district_type', 'party', 'opposition_strength']:
+        view[col] = view[col].astype(str)
+    view['favorable_district'] = view['favorable_district'].astype(object).where(
+        view['favorable_district'].notna(), None
+    )
+    return view.reset_index(drop=True)
+
+
+def training_view(facts):
+    """
+    Rows of PoliticalWARModel.prepare_training_data() from a fact table
+
+    D/R candidates with a top-ticket lean, a statewide environment and a
+    major-party opponent.
+    """
+    view = facts[
+        facts['party'].isin(['D', 'R']) &
+        facts['partisan_lean'].notna() &
+        facts['statewide_environment'].notna() &
+        facts['vote_margin'].notna()
+    ]
+    view = view[[
+        'year', 'district', 'district_level', 'candidate', 'party', 'percentage',
+        'partisan_lean', 'is_incumbent', 'statewide_environment',
+        'has_major_opponent', 'is_democrat', 'vote_margin'
+    ]].copy()
+
+    for col in ['district_level', 'party']:
+        view[col] = view[col].astype(str)
+    for col in ['is_incumbent', 'has_major_opponent', 'is_democrat']:
+        view[col] = view[col].astype(int)
+
+    return view.reset_index(drop=True)
+
+
+def main():
+    print("="*80)
+    print("MATERIALIZING DISTRICT-YEAR FACT TABLES")
+    print("="*80)
+
+    for level in RACE_FILES:
+        path = materialize(level, force=True)
+        facts = pd.read_parquet(path)
+        print(f"  {level}: {len(facts):,} rows, {facts['year'].nunique()} years, "
+              f"input hash {input_hash(level)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,451 @@
+"""
+Stage Instrumentation
+
+Structured timing, memory and row-count events for the pipeline stages
+(load, incumbency, feature build, fit, parse, aggregate):
+- stage(): context manager around one stage; set .rows (or call .set())
+  to record what it produced
+- instrumented(): decorator form; row count taken from len() of the
+  return value when it has one
+- log(): progress message that is dropped in quiet mode, used in place of
+  print() inside per-page / per-district loops
+- warn(): warning or error message that quiet mode never hides: printed to
+  stderr and emitted as a 'warning' event
+
+Every finished stage emits one JSON-serializable event to the registered
+sinks (JSON Lines file, in-memory list or any callable) and to the
+in-process recorder behind summary(). Standard library only, so the
+parsers and the CLI can use it without importing pandas.
+
+Environment (read at import, so standalone scripts honor it too):
+- TEXAS_ELECTION_EVENTS=path.jsonl: append events to a JSON Lines file
+- TEXAS_ELECTION_QUIET=1: quiet mode
+- TEXAS_ELECTION_STAGE_SUMMARY=1: print the stage summary to stderr at exit
+
+Usage:
+    python analysis_tools/instrumentation.py events.jsonl [--sort self|total|calls|rows|rss]
+"""
+
+import sys
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+import argparse
+import atexit
+import collections
+import datetime
+import functools
+import json
+import numbers
+import os
+import threading
+import time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Stage names used across the tools
+STAGES = ['command', 'pipeline', 'load', 'parse', 'incumbency', 'features', 'fit', 'score', 'aggregate', 'render']
+
+# Events kept in-process for summary(); sinks receive every event
+MAX_RECORDED_EVENTS = 100000
+
+_quiet = False
+_sinks = []
+_events = collections.deque(maxlen=MAX_RECORDED_EVENTS)
+_local = threading.local()
+
+
+# ----------------------------------------------------------------------
+# Configuration
+# ----------------------------------------------------------------------
+
+def set_quiet(quiet=True):
+    """Enable or disable quiet mode (log() becomes a no-op)"""
+    global _quiet
+    _quiet = bool(quiet)
+
+
+def is_quiet():
+    return _quiet
+
+
+def log(*args, **kwargs):
+    """print() unless quiet mode is on"""
+    if not _quiet:
+        print(*args, **kwargs)
+
+
+def warn(message):
+    """
+    Report a warning or failure: always printed to stderr (quiet mode or
+    not) and emitted as a 'warning' event tagged with the open stage
+    """
+    print(message, file=sys.stderr)
+    stack = _open_stages()
+    emit({
+        'event': 'warning',
+        'ts': datetime.datetime.now().isoformat(timespec='milliseconds'),
+        'message': message.strip(),
+        'stage': stack[-1].name if stack else None,
+        'component': stack[-1].component if stack else None
+    })
+
+
+def add_sink(sink):
+    """
+    Register an event sink
+
+    Parameters:
+    - sink: Callable taking one event dict (JsonLinesSink, MemorySink or
+      any function)
+    """
+    _sinks.append(sink)
+    return sink
+
+
+def remove_sink(sink):
+    if sink in _sinks:
+        _sinks.remove(sink)
+    if hasattr(sink, 'close'):
+        sink.close()
+
+
+def reset():
+    """Drop recorded events and close every sink"""
+    for sink in list(_sinks):
+        remove_sink(sink)
+    _events.clear()
+    _local.__dict__.clear()
+
+
+def _json_default(value):
+    """numpy scalars as Python numbers, anything else as text"""
+    return value.item() if hasattr(value, 'item') else str(value)
+
+
+class JsonLinesSink:
+    """Appends each event as one JSON line to a file path or open stream"""
+
+    def __init__(self, target):
+        self._owns = isinstance(target, (str, os.PathLike))
+        self.stream = open(target, 'a', encoding='utf-8') if self._owns else target
+        self._lock = threading.Lock()
+
+    def __call__(self, event):
+        line = json.dumps(event, default=_json_default) + '\n'
+        with self._lock:
+            self.stream.write(line)
+            self.stream.flush()
+
+    def close(self):
+        if self._owns and not self.stream.closed:
+            self.stream.close()
+
+
+class MemorySink:
+    """Keeps events in a list (tests, notebooks, the benchmark harness)"""
+
+    def __init__(self):
+        self.events = []
+
+    def __call__(self, event):
+        self.events.append(event)
+
+
+def emit(event):
+    """Record an event and pass it to every sink"""
+    _events.append(event)
+    for sink in _sinks:
+        sink(event)
+
+
+def events():
+    """Events recorded in this process (the latest MAX_RECORDED_EVENTS)"""
+    return list(_events)
+
+
+# ----------------------------------------------------------------------
+# Memory
+# ----------------------------------------------------------------------
+
+def peak_rss_mb():
+    """Process peak resident set size in MB (None where unavailable)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # KB on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def rss_mb():
+    """Current resident set size in MB (Linux only; None elsewhere)"""
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+
+
+def _round(value, digits=1):
+    return None if value is None else round(value, digits)
+
+
+# ----------------------------------------------------------------------
+# Stages
+# ----------------------------------------------------------------------
+
+def _open_stages():
+    """Stages currently running in this thread, outermost first"""
+    if not hasattr(_local, 'stack'):
+        _local.stack = []
+    return _local.stack
+
+
+class Stage:
+    """One running stage; set .rows or call .set(**fields) before it ends"""
+
+    def __init__(self, name, component=None, **fields):
+        self.name = name
+        self.component = component
+        self.rows = fields.pop('rows', None)
+        self.fields = fields
+
+    def set(self, **fields):
+        """Attach extra fields (e.g. rows=, year=, path=) to the event"""
+        if 'rows' in fields:
+            self.rows = fields.pop('rows')
+        self.fields.update(fields)
+        return self
+
+    def __enter__(self):
+        stack = _open_stages()
+        self.parent = stack[-1].name if stack else None
+        self.depth = len(stack)
+        self._child_seconds = 0.0
+        stack.append(self)
+        self._peak_before = peak_rss_mb()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        seconds = time.perf_counter() - self._start
+        stack = _open_stages()
+        stack.pop()
+        if stack:
+            stack[-1]._child_seconds += seconds
+
+        peak = peak_rss_mb()
+        event = {
+            'event': 'stage',
+            'ts': datetime.datetime.now().isoformat(timespec='milliseconds'),
+            'stage': self.name,
+            'component': self.component,
+            'seconds': round(seconds, 6),
+            'self_seconds': round(seconds - self._child_seconds, 6),
+            'rows': self.rows,
+            'rss_mb': _round(rss_mb()),
+            'peak_rss_mb': _round(peak),
+            'peak_rss_growth_mb': _round(None if peak is None else peak - self._peak_before),
+            'parent': self.parent,
+            'depth': self.depth,
+            'status': 'ok' if exc_type is None else 'error'
+        }
+        if exc_type is not None:
+            event['error'] = f"{exc_type.__name__}: {exc}"
+        event.update(self.fields)
+        emit(event)
+        return False
+
+
+def stage(name, component=None, **fields):
+    """
+    Time one pipeline stage
+
+    Parameters:
+    - name: Stage kind (one of STAGES)
+    - component: What ran it (e.g. 'PoliticalWARModel', 'house_statewide')
+    - fields: Extra event fields (year, level, path, ...)
+
+    Usage:
+        with stage('load', 'PoliticalWARModel') as s:
+            races = ...
+            s.rows = len(races)
+    """
+    return Stage(name, component, **fields)
+
+
+def _row_count(result):
+    if isinstance(result, tuple):
+        result = result[0] if result else None
+    if hasattr(result, 'shape') and len(getattr(result, 'shape')) > 0:
+        return int(result.shape[0])
+    try:
+        return len(result)
+    except TypeError:
+        return None
+
+
+def instrumented(name, component=None, args=()):
+    """
+    Decorator form of stage()
+
+    Parameters:
+    - name: Stage kind
+    - component: What ran it (default: the function's qualified name)
+    - args: Names of call arguments copied into the event (scalars only),
+      e.g. @instrumented('parse', args=('year', 'plan'))
+
+    The row count is len() of the return value (the first element of a
+    tuple) when it has one.
+    """
+    def decorate(func):
+        label = component or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*call_args, **call_kwargs):
+            fields = _call_fields(func, args, call_args, call_kwargs) if args else {}
+            with Stage(name, label, **fields) as s:
+                result = func(*call_args, **call_kwargs)
+                if s.rows is None:
+                    s.rows = _row_count(result)
+            return result
+
+        return wrapper
+
+    return decorate
+
+
+def _call_fields(func, names, args, kwargs):
+    """Scalar call arguments named in names"""
+    import inspect
+    bound = inspect.signature(func).bind_partial(*args, **kwargs)
+    bound.apply_defaults()
+    return {
+        key: bound.arguments[key] for key in names
+        if key in bound.arguments
+        and (bound.arguments[key] is None or isinstance(bound.arguments[key], (str, numbers.Number)))
+    }
+
+
+# ----------------------------------------------------------------------
+# Summary
+# ----------------------------------------------------------------------
+
+def read_events(path):
+    """Events from a JSON Lines file written by JsonLinesSink"""
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def summary(stage_events=None):
+    """
+    Aggregate stage events by (stage, component)
+
+    Returns list of dicts sorted by self time: stage, component, calls,
+    total_s (including nested stages), self_s (excluding them), max_s,
+    rows, peak_rss_mb, errors and share (self_s as a fraction of the time
+    covered by top-level stages).
+    """
+    stage_events = [e for e in (_events if stage_events is None else stage_events)
+                    if e.get('event') == 'stage']
+    wall = sum(e['seconds'] for e in stage_events if e.get('depth', 0) == 0) or None
+
+    groups = {}
+    for e in stage_events:
+        key = (e['stage'], e.get('component'))
+        g = groups.setdefault(key, {
+            'stage': key[0], 'component': key[1], 'calls': 0, 'total_s': 0.0,
+            'self_s': 0.0, 'max_s': 0.0, 'rows': None, 'peak_rss_mb': None, 'errors': 0
+        })
+        g['calls'] += 1
+        g['total_s'] += e['seconds']
+        g['self_s'] += e.get('self_seconds', e['seconds'])
+        g['max_s'] = max(g['max_s'], e['seconds'])
+        if e.get('rows') is not None:
+            g['rows'] = (g['rows'] or 0) + e['rows']
+        if e.get('peak_rss_mb') is not None:
+            g['peak_rss_mb'] = max(g['peak_rss_mb'] or 0, e['peak_rss_mb'])
+        g['errors'] += e.get('status') == 'error'
+
+    rows = []
+    for g in groups.values():
+        g['mean_s'] = g['total_s'] / g['calls']
+        g['share'] = g['self_s'] / wall if wall else None
+        rows.append(g)
+    return sorted(rows, key=lambda g: g['self_s'], reverse=True)
+
+
+SORT_KEYS = {
+    'self': lambda g: g['self_s'],
+    'total': lambda g: g['total_s'],
+    'calls': lambda g: g['calls'],
+    'rows': lambda g: g['rows'] or 0,
+    'rss': lambda g: g['peak_rss_mb'] or 0
+}
+
+
+def print_summary(stage_events=None, sort='self', file=None):
+    """Print the stage summary as a table (to stdout by default)"""
+    file = file or sys.stdout
+    rows = sorted(summary(stage_events), key=SORT_KEYS[sort], reverse=True)
+
+    print("="*80, file=file)
+    print("STAGE SUMMARY", file=file)
+    print("="*80, file=file)
+    if not rows:
+        print("  No stage events recorded", file=file)
+        return rows
+
+    print(f"  {'stage':<10} {'component':<40} {'calls':>5} {'self s':>8} {'total s':>8} "
+          f"{'share':>5} {'rows':>10} {'peak MB':>7}", file=file)
+    for g in rows:
+        share = '' if g['share'] is None else f"{g['share']:.0%}"
+        rows_text = '' if g['rows'] is None else f"{g['rows']:,}"
+        peak = '' if g['peak_rss_mb'] is None else f"{g['peak_rss_mb']:.0f}"
+        errors = f"  ⚠ {g['errors']} failed" if g['errors'] else ''
+        print(f"  {g['stage']:<10} {str(g['component'])[:40]:<40} {g['calls']:>5} "
+              f"{g['self_s']:>8.3f} {g['total_s']:>8.3f} {share:>5} {rows_text:>10} {peak:>7}{errors}",
+              file=file)
+
+    by_stage = {}
+    for g in rows:
+        by_stage[g['stage']] = by_stage.get(g['stage'], 0.0) + g['self_s']
+    print("\n  Self time by stage: " + ", ".join(
+        f"{name} {seconds:.2f}s" for name, seconds in sorted(by_stage.items(), key=lambda kv: -kv[1])
+    ), file=file)
+    return rows
+
+
+def configure_from_env(environ=None):
+    """Apply TEXAS_ELECTION_EVENTS / _QUIET / _STAGE_SUMMARY"""
+    environ = os.environ if environ is None else environ
+    if environ.get('TEXAS_ELECTION_QUIET', '') not in ('', '0'):
+        set_quiet(True)
+    path = environ.get('TEXAS_ELECTION_EVENTS')
+    if path:
+        add_sink(JsonLinesSink(path))
+    if environ.get('TEXAS_ELECTION_STAGE_SUMMARY', '') not in ('', '0'):
+        atexit.register(print_summary, file=sys.stderr)
+
+
+configure_from_env()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize stage events from a JSON Lines file")
+    parser.add_argument('events', nargs='+', help="Event files written with TEXAS_ELECTION_EVENTS or --events")
+    parser.add_argument('--sort', choices=sorted(SORT_KEYS), default='self')
+    args = parser.parse_args()
+
+    stage_events = []
+    for path in args.events:
+        stage_events += read_events(path)
+    print_summary(stage_events, sort=args.sort)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+"""
+Seats-Votes and Partisan Bias Metrics
+
+Measures how each district plan translates statewide votes into seats,
+using the statewide races reported by district (Red-206):
+- Efficiency gap: Difference in wasted votes as a share of all votes
+- Mean-median difference: Mean minus median district D share
+- Declination: Angle between the D-won and R-won halves of the vote curve
+- Seats-votes curve: Seat share across statewide vote shares (uniform swing)
+
+Sign convention: positive values favor Republicans for all three bias
+metrics. Vote shares are two-party (D / (D + R)).
+
+Every statewide race of a (plan, year) is scored in one matrix operation
+over a races x districts vote array, and results are cached per
+(plan, year, office).
+"""
+
+import sys
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+import pandas as pd
+import numpy as np
+
+from fact_paths import PARTY_CODES, PDF_EXTRACTS
+
+# Statewide-results-by-district files for each plan, with the years they cover
+PLAN_SOURCES = {
+    'PLANH2316': {
+        'level': 'house',
+        'files': {f'{PDF_EXTRACTS}/2018_2024_house_results_combined_CORRECT.csv': [2018, 2020, 2022, 2024]}
+    },
+    'PLANH2176': {
+        'level': 'house',
+        'files': {
+            f'{PDF_EXTRACTS}/2022_house_district_results.csv': [2022],
+            f'{PDF_EXTRACTS}/2024_house_district_results.csv': [2024]
+        }
+    },
+    'PLANS172': {
+        'level': 'senate',
+        'files': {f'{PDF_EXTRACTS}/2018_2024_senate_results_combined_CORRECT.csv': [2018, 2020]}
+    },
+    'PLANS2168': {
+        'level': 'senate',
+        'files': {f'{PDF_EXTRACTS}/2018_2024_senate_results_combined_CORRECT.csv': [2022, 2024]}
+    },
+    'PLANC2100': {
+        'level': 'congressional',
+        'files': {f'{PDF_EXTRACTS}/2018_2024_congressional_results_combined_CORRECT.csv': [2018, 2020]}
+    },
+    'PLANC2193': {
+        'level': 'congressional',
+        'files': {f'{PDF_EXTRACTS}/2018_2024_congressional_results_combined_CORRECT.csv': [2022, 2024]}
+    }
+}
+
+
+# Statewide two-party D shares at which the seats-votes curve is evaluated
+SWING_GRID = np.round(np.arange(0.30, 0.7001, 0.005), 3)
+
+
+def efficiency_gap(dem_votes, rep_votes):
+    """
+    Efficiency gap for each row of a races x districts vote array
+
+    Wasted votes are all losing votes plus winning votes above 50% of the
+    two-party total. Returns (wasted D - wasted R) / total two-party votes.
+    """
+    total = dem_votes + rep_votes
+    threshold = total / 2
+    dem_wins = dem_votes > rep_votes
+
+    wasted_dem = np.where(dem_wins, dem_votes - threshold, dem_votes)
+    wasted_rep = np.where(dem_wins, rep_votes, rep_votes - threshold)
+
+    return (wasted_dem.sum(axis=1) - wasted_rep.sum(axis=1)) / total.sum(axis=1)
+
+
+def mean_median(shares):
+    """Mean minus median district D share for each row"""
+    return shares.mean(axis=1) - np.median(shares, axis=1)
+
+
+def declination(shares):
+    """
+    Declination for each row of a races x districts D-share array
+
+    Compares the angle from the 50% point to the mean of R-won districts
+    with the angle to the mean of D-won districts. NaN when one party wins
+    every district.
+    """
+    n = shares.shape[1]
+    dem_won = shares > 0.5
+    k_dem = dem_won.sum(axis=1)
+    k_rep = n - k_dem
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean_dem = np.where(dem_won, shares, 0).sum(axis=1) / k_dem
+        mean_rep = np.where(~dem_won, shares, 0).sum(axis=1) / k_rep
+
+        theta_dem = np.arctan((2 * mean_dem - 1) / (k_dem / n))
+        theta_rep = np.arctan((1 - 2 * mean_rep) / (k_rep / n))
+
+    result = 2 * (theta_dem - theta_rep) / np.pi
+    return np.where((k_dem == 0) | (k_rep == 0), np.nan, result)
+
+
+def seats_votes_curve(shares, statewide_share, grid=SWING_GRID):
+    """
+    Seat share at each statewide vote share under uniform swing
+
+    Parameters:
+    - shares: races x districts D-share array
+    - statewide_share: Statewide D share for each race
+    - grid: Statewide D shares to evaluate
+
+    Returns races x grid array of D seat shares.
+    """
+    shift = grid[None, :] - statewide_share[:, None]
+    swung = shares[:, None, :] + shift[:, :, None]
+    return (swung > 0.5).mean(axis=2)
+
+
+class PartisanBiasAnalyzer:
+    """Compute seats-votes curves and bias metrics for every plan and cycle"""
+
+    def __init__(self):
+        """Initialize analyzer (data is loaded per plan on first use)"""
+        self._plan_data = {}
+        self._cache = {}
+        self._curves = {}
+
+    def load_plan(self, plan):
+        """Load statewide-by-district results for a plan"""
+        if plan in self._plan_data:
+            return self._plan_data[plan]
+
+        frames = []
+        for path, years in PLAN_SOURCES[plan]['files'].items():
+            df = pd.read_csv(path)
+            frames.append(df[df['year'].isin(years)])
+
+        data = pd.concat(frames, ignore_index=True)
+        data['district'] = data['district'].astype(str)
+        data['party'] = data['party'].replace(PARTY_CODES)
+        data = data[(data['district'] != 'STATE') & data['party'].isin(['D', 'R'])]
+
+        self._plan_data[plan] = data
+        return data
+
+    def compute_cycle(self, plan, year):
+        """
+        Score every statewide race of a (plan, year) in one pass
+
+        Builds a races x districts array of D and R votes, then evaluates all
+        metrics and seats-votes curves across the race axis at once.
+        Races missing D or R votes in any district are skipped.
+
+        Returns DataFrame with one row per office.
+        """
+        data = self.load_plan(plan)
+        cycle = data[data['year'] == year]
+
+        if cycle.empty:
+            return pd.DataFrame()
+
+        votes = cycle.pivot_table(
+            index='office', columns=['party', 'district'],
+            values='votes', aggfunc='sum'
+        )
+        dem = votes['D']
+        rep = votes['R'].reindex(index=dem.index, columns=dem.columns)
+
+        complete = dem.notna().all(axis=1) & rep.notna().all(axis=1) & ((dem + rep) > 0).all(axis=1)
+        dem, rep = dem[complete], rep[complete]
+        if dem.empty:
+            return pd.DataFrame()
+
+        offices = dem.index.tolist()
+        dem_votes = dem.to_numpy(dtype=float)
+        rep_votes = rep.to_numpy(dtype=float)
+
+        shares = dem_votes / (dem_votes + rep_votes)
+        statewide_share = dem_votes.sum(axis=1) / (dem_votes + rep_votes).sum(axis=1)
+        seat_share = (shares > 0.5).mean(axis=1)
+        curves = seats_votes_curve(shares, statewide_share)
+
+        # Seat share when the statewide vote is split evenly
+        half = np.searchsorted(SWING_GRID, 0.5)
+        seats_at_50 = curves[:, half]
+
+        metrics = pd.DataFrame({
+            'plan': plan,
+            'level': PLAN_SOURCES[plan]['level'],
+            'year': year,
+            'office': offices,
+            'districts': shares.shape[1],
+            'dem_vote_share': statewide_share,
+            'dem_seat_share': seat_share,
+            'dem_seats': (shares > 0.5).sum(axis=1),
+            'efficiency_gap': efficiency_gap(dem_votes, rep_votes),
+            'mean_median': mean_median(shares),
+            'declination': declination(shares),
+            'partisan_bias': 0.5 - seats_at_50
+        })
+
+        for i, office in enumerate(offices):
+            key = (plan, year, office)
+            self._cache[key] = metrics.iloc[i].to_dict()
+            self._curves[key] = pd.DataFrame({
+                'dem_vote_share': SWING_GRID,
+                'dem_seat_share': curves[i]
+            })
+
+        return metrics
+
+    def get_metrics(self, plan, year, office):
+        """Get cached metrics for one (plan, year, office)"""
+        key = (plan, year, office)
+        if key not in self._cache:
+            self.compute_cycle(plan, year)
+        return self._cache.get(key)
+
+    def get_seats_votes_curve(self, plan, year, office):
+        """Get the uniform-swing seats-votes curve for one (plan, year, office)"""
+        key = (plan, year, office)
+        if key not in self._curves:
+            self.compute_cycle(plan, year)
+        return self._curves.get(key)
+
+    def compute_all(self, level=None):
+        """
+        Compute metrics for every (plan, year, statewide race) combination
+
+        Parameters:
+        - level: Restrict to 'house', 'senate', or 'congressional'
+        """
+        results = []
+
+        for plan, source in PLAN_SOURCES.items():
+            if level and source['level'] != level:
+                continue
+
+            years = sorted({y for ys in source['files'].values() for y in ys})
+            for year in years:
+                metrics = self.compute_cycle(plan, year)
+                if not metrics.empty:
+                    results.append(metrics)
+
+        if not results:
+            return pd.DataFrame()
+
+        return pd.concat(results, ignore_index=True)
+
+
+def main():
+    print("="*80)
+    print("SEATS-VOTES AND PARTISAN BIAS METRICS")
+    print("="*80)
+    print("(Positive efficiency gap / mean-median / declination / bias favor Republicans)")
+
+    analyzer = PartisanBiasAnalyzer()
+    all_metrics = analyzer.compute_all()
+
+    for level in ['house', 'senate', 'congressional']:
+        print("\n" + "="*80)
+        print(f"{level.upper()} PLANS")
+        print("="*80)
+        level_metrics = all_metrics[all_metrics['level'] == level]
+        print(level_metrics[[
+            'plan', 'year', 'office', 'dem_vote_share', 'dem_seat_share',
+            'efficiency_gap', 'mean_median', 'declination', 'partisan_bias'
+        ]].round(3).to_string(index=False))
+
+    print("\n" + "="*80)
+    print("SEATS-VOTES CURVE: PLANH2316, 2024 President")
+    print("="*80)
+    curve = analyzer.get_seats_votes_curve('PLANH2316', 2024, 'President')
+    if curve is not None:
+        print(curve[curve['dem_vote_share'].isin([0.40, 0.45, 0.50, 0.55, 0.60])].to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -18,6 +18,8 @@ from sklearn.linear_model import LinearRegression
 from sklearn.model_selection import train_test_split
 import os
 
+from instrumentation import instrumented, log, stage, warn
+
 
 class PoliticalWARModel:
     """
@@ -32,11 +34,29 @@ class PoliticalWARModel:
     WAR = Actual Margin - Expected Margin
     """
 
-    def __init__(self):
-        """Initialize the Political WAR model"""
+    def __init__(self, use_rolloff=False, use_fact_tables=True):
+        """
+        Initialize the Political WAR model
+
+        Args:
+            use_rolloff: Add the race's roll-off rate from the top of the
+                ticket (see rolloff_analysis.py) as a model feature. Races
+                without a comparable top-ticket total get the mean measured
+                rate and rolloff_missing = 1.
+            use_fact_tables: Read training rows from the materialized fact
+                tables (see fact_tables.py) instead of deriving them row by row
+        """
+        self.use_rolloff = use_rolloff
+        self.use_fact_tables = use_fact_tables
+        self.feature_cols = ['partisan_lean', 'is_incumbent', 'statewide_environment', 'is_democrat']
+        if use_rolloff:
+            self.feature_cols += ['rolloff_rate', 'rolloff_missing']
+
         self.model = None
         self.feature_importance = None
         self.training_data = None
+        self.career_war = None
+        self.war_ranking = None
 
         # Load district race data
         self._load_data()
@@ -46,8 +66,16 @@ class PoliticalWARModel:
 
     def _load_data(self):
         """Load all district race and statewide data"""
-        print("Loading election data...")
+        log("Loading election data...")
+
+        with stage('load', 'PoliticalWARModel') as s:
+            self._read_csvs()
+            s.rows = len(self.district_races)
 
+        log(f"  Loaded {len(self.district_races):,} district race records")
+
+    def _read_csvs(self):
+        """Read the district race and statewide-by-district CSVs"""
         # District races (actual races FOR districts)
         house_2018_2022 = pd.read_csv('texas_election_data/pdf_extracts/2018_2022_house_races.csv')
         house_2024 = pd.read_csv('texas_election_data/pdf_extracts/2024_house_races.csv')
@@ -73,8 +101,6 @@ class PoliticalWARModel:
             'texas_election_data/pdf_extracts/2018_2024_senate_results_combined_CORRECT.csv'
         )
 
-        print(f"  Loaded {len(self.district_races):,} district race records")
-
     def _detect_incumbency(self):
         """
         Detect incumbents by tracking candidates who won in previous cycle
@@ -83,8 +109,17 @@ class PoliticalWARModel:
         1. Won the same district in the previous election (2 years ago)
         2. Are running again in the current election
         """
-        print("\nDetecting incumbency status...")
+        log("\nDetecting incumbency status...")
 
+        with stage('incumbency', 'PoliticalWARModel') as s:
+            self._mark_incumbents()
+            incumbent_count = self.district_races['is_incumbent'].sum()
+            s.set(rows=len(self.district_races), incumbents=int(incumbent_count))
+
+        log(f"  Identified {incumbent_count} incumbent candidates")
+
+    def _mark_incumbents(self):
+        """Set is_incumbent on district_races (prior-cycle winner running again)"""
         # Sort by year to process chronologically
         self.district_races = self.district_races.sort_values(['district_level', 'district', 'year'])
 
@@ -118,9 +153,6 @@ class PoliticalWARModel:
                     )
                     self.district_races.loc[mask, 'is_incumbent'] = True
 
-        incumbent_count = self.district_races['is_incumbent'].sum()
-        print(f"  Identified {incumbent_count} incumbent candidates")
-
     def _get_district_partisan_lean(self, row):
         """
         Get district partisan lean for a given race
@@ -205,6 +237,7 @@ class PoliticalWARModel:
 
         return dem_pct - rep_pct
 
+    @instrumented('features')
     def prepare_training_data(self):
         """
         Prepare training data with features and target variable
@@ -219,7 +252,15 @@ class PoliticalWARModel:
         Target:
         - vote_margin: Candidate's vote % - opponent's vote %
         """
-        print("\nPreparing training data...")
+        log("\nPreparing training data...")
+
+        if self.use_fact_tables:
+            from fact_tables import load_fact_table, training_view
+            self.training_data = pd.concat(
+                [training_view(load_fact_table(level)) for level in ['house', 'senate']],
+                ignore_index=True
+            )
+            return self._finish_training_data()
 
         # Only use races with major party candidates (D or R)
         major_party_races = self.district_races[
@@ -275,12 +316,65 @@ class PoliticalWARModel:
 
         self.training_data = pd.DataFrame(features_list)
 
-        print(f"  Prepared {len(self.training_data):,} training examples")
-        print(f"  Features: partisan_lean, is_incumbent, statewide_environment, is_democrat")
-        print(f"  Target: vote_margin")
+        return self._finish_training_data()
+
+    def _finish_training_data(self):
+        """Add optional features and report the prepared training data"""
+        if self.use_rolloff:
+            self._add_rolloff_features()
+
+        log(f"  Prepared {len(self.training_data):,} training examples")
+        log(f"  Features: {', '.join(self.feature_cols)}")
+        log(f"  Target: vote_margin")
 
         return self.training_data
 
+    def _add_rolloff_features(self):
+        """
+        Join each race's roll-off rate onto the training data
+
+        Only the district-level rolloff_rate is used: party drop-off is built
+        from the candidate's own votes and would leak the target. Races with
+        no comparable top-of-ticket total (plan mismatch, no D/R top-ticket
+        result) are imputed with the mean measured rate and flagged by
+        rolloff_missing, so every race is still scored. Raises ValueError if
+        no race can be measured.
+        """
+        from rolloff_analysis import RolloffAnalyzer
+
+        races = self.district_races.drop(columns=['is_incumbent', 'district_level'])
+        rolloff = RolloffAnalyzer(
+            district_races={
+                'house': races[self.district_races['district_level'] == 'house'],
+                'senate': races[self.district_races['district_level'] == 'senate']
+            },
+            statewide_data={'house': self.statewide_by_house, 'senate': self.statewide_by_senate}
+        )
+
+        self.training_data = pd.concat([
+            rolloff.add_candidate_features(group, level)
+            for level, group in self.training_data.groupby('district_level')
+        ], ignore_index=True)
+
+        is_missing = self.training_data['rolloff_rate'].isna()
+        missing = self.training_data[is_missing]
+        if not missing.empty:
+            reasons = missing.groupby(['district_level', 'year', 'rolloff_note']).size()
+            details = '; '.join(f"{level} {year}: {note} ({count})"
+                                for (level, year, note), count in reasons.items())
+            if is_missing.all():
+                raise ValueError(f"Roll-off is unavailable for every training row: {details}")
+            warn(f"  ⚠ Roll-off unavailable for {len(missing):,} of {len(self.training_data):,} "
+                 f"training rows; imputed with the mean rate and flagged rolloff_missing: {details}")
+
+        self.training_data['rolloff_missing'] = is_missing.astype(int)
+        self.training_data['rolloff_rate'] = self.training_data['rolloff_rate'].fillna(
+            self.training_data['rolloff_rate'].mean()
+        )
+        self.training_data = self.training_data.drop(columns=['party_dropoff', 'rolloff_note'])
+        log("  Added roll-off rate feature "
+            f"(measured for {(~is_missing).sum():,} of {len(self.training_data):,} rows)")
+
     def train_model(self):
         """
         Train regression model to predict expected vote margin
@@ -291,26 +385,28 @@ class PoliticalWARModel:
         if self.training_data is None:
             self.prepare_training_data()
 
-        print("\nTraining regression model...")
+        log("\nTraining regression model...")
 
         # Prepare features (X) and target (y)
-        feature_cols = ['partisan_lean', 'is_incumbent', 'statewide_environment', 'is_democrat']
+        feature_cols = self.feature_cols
         X = self.training_data[feature_cols]
         y = self.training_data['vote_margin']
 
         # Train model on all data (we want to predict for same races)
-        self.model = LinearRegression()
-        self.model.fit(X, y)
+        with stage('fit', 'PoliticalWARModel', features=len(feature_cols)) as s:
+            self.model = LinearRegression()
+            self.model.fit(X, y)
+            s.rows = len(X)
 
         # Calculate R-squared
         r2 = self.model.score(X, y)
-        print(f"  Model R² = {r2:.3f}")
+        log(f"  Model R² = {r2:.3f}")
 
         # Show feature importance (coefficients)
-        print(f"\n  Feature Coefficients:")
+        log(f"\n  Feature Coefficients:")
         for feature, coef in zip(feature_cols, self.model.coef_):
-            print(f"    {feature:25s}: {coef:+.3f}")
-        print(f"    {'intercept':25s}: {self.model.intercept_:+.3f}")
+            log(f"    {feature:25s}: {coef:+.3f}")
+        log(f"    {'intercept':25s}: {self.model.intercept_:+.3f}")
 
         self.feature_importance = dict(zip(feature_cols, self.model.coef_))
 
@@ -328,18 +424,22 @@ class PoliticalWARModel:
         if self.model is None:
             self.train_model()
 
-        print("\nCalculating Political WAR scores...")
+        log("\nCalculating Political WAR scores...")
 
         # Predict expected margins
-        feature_cols = ['partisan_lean', 'is_incumbent', 'statewide_environment', 'is_democrat']
-        X = self.training_data[feature_cols]
+        with stage('score', 'PoliticalWARModel', rows=len(self.training_data)):
+            X = self.training_data[self.feature_cols]
 
-        self.training_data['expected_margin'] = self.model.predict(X)
-        self.training_data['political_war'] = (
-            self.training_data['vote_margin'] - self.training_data['expected_margin']
-        )
+            self.training_data['expected_margin'] = self.model.predict(X)
+            self.training_data['political_war'] = (
+                self.training_data['vote_margin'] - self.training_data['expected_margin']
+            )
 
-        print(f"  Calculated WAR for {len(self.training_data):,} candidates")
+        log(f"  Calculated WAR for {len(self.training_data):,} candidates")
+
+        # Career aggregates and the WAR ranking depend on these scores
+        self.career_war = None
+        self.war_ranking = None
 
         return self.training_data
 
@@ -351,7 +451,7 @@ class PoliticalWARModel:
             party: Filter by party ('D' or 'R')
             year: Filter by year
             min_war: Minimum WAR score
-            top_n: Number of results to return
+            top_n: Number of results to return (None for all; < 1 raises ValueError)
 
         Returns:
             DataFrame of top performers sorted by WAR
@@ -359,26 +459,151 @@ class PoliticalWARModel:
         if self.training_data is None or 'political_war' not in self.training_data.columns:
             self.calculate_war_scores()
 
-        df = self.training_data.copy()
+        if self.war_ranking is None:
+            from ranking_index import RankingIndex
+            self.war_ranking = RankingIndex(self.training_data[[
+                'year', 'district', 'district_level', 'candidate', 'party',
+                'percentage', 'vote_margin', 'expected_margin', 'political_war',
+                'partisan_lean', 'is_incumbent'
+            ]], 'political_war')
+
+        # Presorted by WAR: filters only slice the per-(party, year) ordering
+        return self.war_ranking.top(
+            party=party or None, year=year or None, min_score=min_war or None, top_n=top_n
+        )
+
+    @staticmethod
+    def _normalize_candidate_name(names):
+        """
+        Normalize candidate names so the same person matches across cycles
+
+        Lowercases, strips punctuation and generational suffixes
+        ("Jr.", "III", ...) and collapses whitespace.
+        """
+        normalized = (
+            names.astype(str)
+            .str.lower()
+            .str.replace(r'[^a-z\s]', ' ', regex=True)
+            .str.replace(r'\b(jr|sr|ii|iii|iv)\b', ' ', regex=True)
+            .str.split()
+            .str.join(' ')
+        )
+        return normalized
 
-        # Apply filters
+    @instrumented('aggregate')
+    def calculate_career_war(self):
+        """
+        Calculate career-level Political WAR for every candidate
+
+        Candidates who ran in several cycles appear as separate rows in
+        training_data. This groups them by normalized identity
+        (district_level, district, party, name) and shrinks each candidate's
+        mean WAR toward the overall mean using empirical Bayes:
+
+            career_war = mu + (1 - B) * (mean_war - mu)
+            B = (sigma^2 / n) / (sigma^2 / n + tau^2)
+
+        where sigma^2 is the pooled within-candidate residual variance,
+        tau^2 the between-candidate variance of true WAR (method of moments)
+        and n the number of races. A single great race is pulled toward the
+        mean; repeated overperformance keeps most of its value.
+
+        The district is part of the key because the race files mostly carry
+        surnames only, so careers do not carry across redistricting: a member
+        whose district number changed (e.g. with the 2022 plans) is counted
+        as two careers, each with fewer races and more shrinkage.
+
+        Returns:
+            DataFrame with one row per candidate, sorted by career_war
+        """
+        if self.training_data is None or 'political_war' not in self.training_data.columns:
+            self.calculate_war_scores()
+
+        df = self.training_data
+        name_key = self._normalize_candidate_name(df['candidate'])
+
+        grouped = df.assign(name_key=name_key, district=df['district'].astype(str)).groupby(
+            ['district_level', 'district', 'party', 'name_key'], sort=False
+        )
+        careers = grouped.agg(
+            candidate=('candidate', 'last'),
+            n_races=('political_war', 'size'),
+            first_year=('year', 'min'),
+            last_year=('year', 'max'),
+            mean_war=('political_war', 'mean'),
+            war_var=('political_war', 'var'),
+            mean_partisan_lean=('partisan_lean', 'mean'),
+            incumbent_races=('is_incumbent', 'sum')
+        ).reset_index()
+
+        mu = df['political_war'].mean()
+        n = careers['n_races'].to_numpy(dtype=float)
+
+        # Pooled within-candidate variance from candidates with repeat races
+        repeat = n > 1
+        if repeat.any():
+            sigma2 = (
+                (careers.loc[repeat, 'war_var'] * (n[repeat] - 1)).sum() /
+                (n[repeat] - 1).sum()
+            )
+        else:
+            sigma2 = df['political_war'].var()
+
+        # Between-candidate variance of true WAR (floored at a small positive value)
+        tau2 = np.var(careers['mean_war'].to_numpy(), ddof=1) - np.mean(sigma2 / n)
+        tau2 = max(tau2, 1e-6)
+
+        shrinkage = (sigma2 / n) / (sigma2 / n + tau2)
+        careers['shrinkage'] = shrinkage
+        careers['career_war'] = mu + (1 - shrinkage) * (careers['mean_war'] - mu)
+        careers['career_war_se'] = np.sqrt((1 - shrinkage) * sigma2 / n)
+
+        self.career_war = careers.drop(columns=['war_var']).sort_values(
+            'career_war', ascending=False
+        ).reset_index(drop=True)
+
+        log(f"  Calculated career WAR for {len(self.career_war):,} candidates "
+            f"({int(repeat.sum()):,} with multiple races)")
+
+        return self.career_war
+
+    def get_top_career_performers(self, party=None, district_level=None,
+                                  min_races=1, top_n=20):
+        """
+        Get top candidates by shrunken career-level Political WAR
+
+        Args:
+            party: Filter by party ('D' or 'R')
+            district_level: Filter by level ('house' or 'senate')
+            min_races: Minimum number of races in the candidate's career
+            top_n: Number of results to return (None for all; < 1 raises ValueError)
+
+        Returns:
+            DataFrame of candidates sorted by career_war
+        """
+        from ranking_index import check_top_n
+        check_top_n(top_n)
+
+        if self.career_war is None:
+            self.calculate_career_war()
+
+        df = self.career_war
+
+        mask = df['n_races'] >= min_races
         if party:
-            df = df[df['party'] == party]
-        if year:
-            df = df[df['year'] == year]
-        if min_war:
-            df = df[df['political_war'] >= min_war]
+            mask &= df['party'] == party
+        if district_level:
+            mask &= df['district_level'] == district_level
 
-        # Sort by WAR
-        df = df.sort_values('political_war', ascending=False)
+        df = df[mask]
 
-        if top_n:
+        if top_n is not None:
             df = df.head(top_n)
 
         return df[[
-            'year', 'district', 'district_level', 'candidate', 'party',
-            'percentage', 'vote_margin', 'expected_margin', 'political_war',
-            'partisan_lean', 'is_incumbent'
+            'candidate', 'party', 'district_level', 'district', 'n_races',
+            'first_year', 'last_year', 'mean_war', 'career_war',
+            'career_war_se', 'shrinkage', 'incumbent_races'
         ]]
 
 
@@ -415,6 +640,13 @@ def main():
     top_2024 = war_model.get_top_performers(year=2024, top_n=20)
     print(top_2024.to_string(index=False))
 
+    # Show career-level WAR (rewards repeated overperformance)
+    print("\n" + "="*70)
+    print("Top 20 Democrats by Career WAR (2+ races, shrunk toward mean)")
+    print("="*70)
+    top_career = war_model.get_top_career_performers(party='D', min_races=2, top_n=20)
+    print(top_career.to_string(index=False))
+
 
 if __name__ == "__main__":
     main()
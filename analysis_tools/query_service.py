@@ -0,0 +1,342 @@
+"""
+Local Query Service
+
+Long-lived HTTP/JSON service that loads the analyzers once and answers
+queries from their warm tables, so notebooks and scripts don't re-read
+every CSV and retrain WAR before each question.
+
+Loads MultiYearDistrictCandidateAnalyzer, PoliticalWARModel and
+CandidateStrengthAnalyzer at startup. Requests are handled on separate
+threads; identical queries are answered from an LRU response cache.
+
+Endpoints (GET, query-string parameters):
+    /strong            level, year, party, min_vs_top_ticket,
+                       require_major_party_opponent, require_contested, top_n
+    /crossover         level, year, party, require_major_party_opponent, top_n
+    /track             name, level
+    /compare           year1, year2, level, party, top_n
+    /war/top           party, year, min_war, top_n
+    /war/career        party, level, min_races, top_n
+    /strength          year, office
+    /metrics           Request counts, cache hits, errors, p50/p99 latency per endpoint
+    /health
+
+Bad parameters (including invalid /track name patterns and top_n < 1)
+return 400; any other failure returns 500 and counts as a server error.
+
+Usage:
+    python analysis_tools/query_service.py --port 8765
+    curl "http://127.0.0.1:8765/strong?level=house&year=2024&party=D"
+"""
+
+import sys
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+import argparse
+import json
+import re
+import threading
+import time
+import traceback
+from collections import OrderedDict, defaultdict, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+import numpy as np
+
+from district_candidate_analyzer_multiyear import MultiYearDistrictCandidateAnalyzer
+from political_war_model import PoliticalWARModel
+from candidate_strength_model import CandidateStrengthAnalyzer
+
+LEVELS = ['house', 'senate', 'congressional']
+
+
+class QueryParams:
+    """Typed access to query-string parameters (raises ValueError on bad input)"""
+
+    def __init__(self, query):
+        self.values = {key: vals[-1] for key, vals in parse_qs(query).items()}
+
+    def text(self, name, default=None, choices=None):
+        value = self.values.get(name, default)
+        if choices is not None and value is not None and value not in choices:
+            raise ValueError(f"'{name}' must be one of {choices}")
+        return value
+
+    def integer(self, name, default=None, minimum=None):
+        value = self.values.get(name)
+        if value is None:
+            return default
+        try:
+            value = int(value)
+        except ValueError:
+            raise ValueError(f"'{name}' must be an integer")
+        if minimum is not None and value < minimum:
+            raise ValueError(f"'{name}' must be at least {minimum}")
+        return value
+
+    def number(self, name, default=None):
+        value = self.values.get(name)
+        if value is None:
+            return default
+        try:
+            return float(value)
+        except ValueError:
+            raise ValueError(f"'{name}' must be a number")
+
+    def flag(self, name, default=False):
+        value = self.values.get(name)
+        if value is None:
+            return default
+        return value.lower() in ('1', 'true', 'yes', 'y')
+
+    def require(self, name):
+        if name not in self.values:
+            raise ValueError(f"'{name}' is required")
+        return self.values[name]
+
+
+class QueryService:
+    """Warm analyzers plus response cache and latency metrics"""
+
+    def __init__(self, cache_size=512):
+        """
+        Load every analyzer and precompute their derived tables
+
+        Parameters:
+        - cache_size: Maximum number of cached responses
+        """
+        start = time.perf_counter()
+
+        self.district_analyzer = MultiYearDistrictCandidateAnalyzer()
+        for level in LEVELS:
+            try:
+                self.district_analyzer.calculate_vs_top_ticket(level)
+            except ValueError as e:
+                print(f"  ⚠ {e}")
+
+        self.war_model = PoliticalWARModel()
+        self.war_model.calculate_war_scores()
+        self.war_model.calculate_career_war()
+
+        self.strength_analyzer = CandidateStrengthAnalyzer(geographic_level='house')
+
+        self.routes = {
+            '/strong': self.strong,
+            '/crossover': self.crossover,
+            '/track': self.track,
+            '/compare': self.compare,
+            '/war/top': self.war_top,
+            '/war/career': self.war_career,
+            '/strength': self.strength,
+            '/metrics': self.metrics,
+            '/health': self.health
+        }
+
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        self._metrics_lock = threading.Lock()
+        self._latencies = defaultdict(lambda: deque(maxlen=10_000))
+        self._requests = defaultdict(int)
+        self._cache_hits = defaultdict(int)
+        self._errors = defaultdict(int)
+        self._server_errors = defaultdict(int)
+
+        print(f"\n✓ Query service ready in {time.perf_counter() - start:.1f}s")
+
+    # ------------------------------------------------------------------
+    # Endpoints: each returns a DataFrame or a JSON-serializable dict
+    # ------------------------------------------------------------------
+
+    def strong(self, params):
+        return self.district_analyzer.identify_strong_candidates(
+            district_level=params.text('level', 'house', LEVELS),
+            year=params.integer('year'),
+            min_vs_top_ticket=params.number('min_vs_top_ticket', 2.0),
+            party=params.text('party'),
+            require_major_party_opponent=params.flag('require_major_party_opponent', True),
+            require_contested=params.flag('require_contested', True),
+            top_n=params.integer('top_n', minimum=1)
+        )
+
+    def crossover(self, params):
+        return self.district_analyzer.identify_crossover_appeal_candidates(
+            district_level=params.text('level', 'house', LEVELS),
+            year=params.integer('year'),
+            party=params.text('party'),
+            require_major_party_opponent=params.flag('require_major_party_opponent', True),
+            top_n=params.integer('top_n', minimum=1)
+        )
+
+    def track(self, params):
+        return self.district_analyzer.track_candidate_over_time(
+            params.require('name'),
+            district_level=params.text('level', 'house', LEVELS)
+        )
+
+    def compare(self, params):
+        return self.district_analyzer.compare_years(
+            int(params.require('year1')), int(params.require('year2')),
+            district_level=params.text('level', 'house', LEVELS),
+            party=params.text('party'),
+            top_n=params.integer('top_n', minimum=1)
+        )
+
+    def war_top(self, params):
+        return self.war_model.get_top_performers(
+            party=params.text('party'),
+            year=params.integer('year'),
+            min_war=params.number('min_war'),
+            top_n=params.integer('top_n', 20, minimum=1)
+        )
+
+    def war_career(self, params):
+        return self.war_model.get_top_career_performers(
+            party=params.text('party'),
+            district_level=params.text('level'),
+            min_races=params.integer('min_races', 1),
+            top_n=params.integer('top_n', 20, minimum=1)
+        )
+
+    def strength(self, params):
+        return self.strength_analyzer.analyze_race(
+            int(params.require('year')), params.require('office')
+        )
+
+    def metrics(self, params):
+        with self._metrics_lock:
+            endpoints = {}
+            for path, count in self._requests.items():
+                latencies = np.array(self._latencies[path]) * 1000
+                endpoints[path] = {
+                    'requests': count,
+                    'cache_hits': self._cache_hits[path],
+                    'errors': self._errors[path],
+                    'server_errors': self._server_errors[path],
+                    'p50_ms': round(float(np.percentile(latencies, 50)), 3) if len(latencies) else None,
+                    'p99_ms': round(float(np.percentile(latencies, 99)), 3) if len(latencies) else None
+                }
+        return {'endpoints': endpoints, 'cached_responses': len(self._cache)}
+
+    def health(self, params):
+        return {'status': 'ok'}
+
+    # ------------------------------------------------------------------
+    # Dispatch, caching and metrics
+    # ------------------------------------------------------------------
+
+    def handle(self, path, query):
+        """
+        Answer one request
+
+        Returns (status, JSON bytes). Data endpoints are cached by
+        (path, sorted parameters); /metrics and /health are never cached.
+        """
+        start = time.perf_counter()
+        status, body, cached = self._dispatch(path, query)
+        elapsed = time.perf_counter() - start
+
+        with self._metrics_lock:
+            self._requests[path] += 1
+            self._latencies[path].append(elapsed)
+            if cached:
+                self._cache_hits[path] += 1
+            if status != 200:
+                self._errors[path] += 1
+            if status >= 500:
+                self._server_errors[path] += 1
+
+        return status, body
+
+    def _dispatch(self, path, query):
+        route = self.routes.get(path)
+        if route is None:
+            return 404, self._json({'error': f"Unknown endpoint '{path}'",
+                                    'endpoints': sorted(self.routes)}), False
+
+        uncached = path in ('/metrics', '/health')
+        key = (path, tuple(sorted((name, tuple(vals)) for name, vals in parse_qs(query).items())))
+
+        if not uncached:
+            with self._cache_lock:
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+                    return 200, self._cache[key], True
+
+        try:
+            body = self._json(route(QueryParams(query)))
+        except ValueError as e:
+            return 400, self._json({'error': str(e)}), False
+        except re.error as e:
+            return 400, self._json({'error': f"Invalid pattern: {e}"}), False
+        except Exception as e:
+            traceback.print_exc(file=sys.stderr)
+            return 500, self._json({'error': f"{type(e).__name__}: {e}"}), False
+
+        if not uncached:
+            with self._cache_lock:
+                self._cache[key] = body
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        return 200, body, False
+
+    @staticmethod
+    def _json(result):
+        """Serialize a DataFrame as {'count', 'rows'} or a dict as-is"""
+        if isinstance(result, dict):
+            return json.dumps(result).encode('utf-8')
+        rows = result.to_json(orient='records') if not result.empty else '[]'
+        return f'{{"count": {len(result)}, "rows": {rows}}}'.encode('utf-8')
+
+
+def make_handler(service):
+    """Request handler class bound to a QueryService"""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlsplit(self.path)
+            status, body = service.handle(url.path.rstrip('/') or '/', url.query)
+
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve election analyses over local HTTP/JSON")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--cache-size', type=int, default=512)
+    args = parser.parse_args()
+
+    print("="*80)
+    print("TEXAS ELECTION QUERY SERVICE")
+    print("="*80)
+
+    service = QueryService(cache_size=args.cache_size)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(service))
+
+    print(f"  Listening on http://{args.host}:{args.port}")
+    print(f"  Endpoints: {', '.join(sorted(service.routes))}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nShutting down")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Ranking Index
+
+Presorted orderings for the ranking queries (strong candidates, crossover
+appeal, top WAR performers). The table is sorted once by its score, and
+the ordering is split per party, per year and per (party, year). Named
+filters are precomputed as boolean masks over the rows, so a top-n query
+only indexes small position arrays and takes n rows; it never copies,
+filters or sorts the full table.
+
+Also provides top_k(), an argpartition-based top-k for rankings over
+values that only exist at query time (e.g. year-over-year changes).
+"""
+
+import sys
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+import numpy as np
+
+
+def check_top_n(top_n, name='top_n'):
+    """Raise ValueError unless top_n is None (all rows) or at least 1"""
+    if top_n is not None and top_n < 1:
+        raise ValueError(f"{name} must be at least 1 (or None for all), got {top_n}")
+
+
+def top_k(values, k=None):
+    """
+    Positions of the k largest values, largest first
+
+    Uses argpartition so only the k winners are sorted; ties keep their
+    original order and NaN values rank last. k=None sorts everything;
+    k < 1 raises ValueError.
+    """
+    check_top_n(k, 'k')
+    values = np.asarray(values, dtype=float)
+    keys = np.where(np.isnan(values), -np.inf, values)
+
+    if k is not None and k < len(values):
+        candidates = np.argpartition(-keys, k - 1)[:k]
+        # Everything tied with the k-th value competes for the last slots
+        cutoff = keys[candidates].min()
+        candidates = np.flatnonzero(keys >= cutoff)
+    else:
+        candidates = np.arange(len(values))
+
+    order = np.lexsort((np.isnan(values[candidates]), -keys[candidates]))
+    return candidates[order][:k]
+
+
+class RankingIndex:
+    """Per-(party, year) orderings of one table by descending score"""
+
+    def __init__(self, df, score, masks=None):
+        """
+        Sort the table once and precompute filters
+
+        Parameters:
+        - df: Table to rank (must have 'party' and 'year' columns)
+        - score: Score column, or list of columns ranked lexicographically
+          (all descending; NaN ranks last)
+        - masks: Dict of filter name -> boolean array/Series aligned with df
+        """
+        self.df = df.reset_index(drop=True)
+        self.score = [score] if isinstance(score, str) else list(score)
+
+        keys = [self.df[col].to_numpy(dtype=float) for col in self.score]
+        order = np.lexsort(self._lexsort_keys(keys))
+
+        self.masks = {
+            name: np.asarray(mask, dtype=bool) for name, mask in (masks or {}).items()
+        }
+
+        party = self.df['party'].astype(str).to_numpy()
+        year = self.df['year'].to_numpy()
+        self._orders = {(None, None): order}
+        for p in np.unique(party):
+            self._orders[(p, None)] = order[party[order] == p]
+        for y in np.unique(year):
+            in_year = order[year[order] == y]
+            self._orders[(None, int(y))] = in_year
+            for p in np.unique(party[in_year]):
+                self._orders[(p, int(y))] = in_year[party[in_year] == p]
+
+        # First score negated (NaN -> inf) per ordering, ascending for searchsorted
+        ascending = np.where(np.isnan(keys[0]), np.inf, -keys[0])
+        self._thresholds = {key: ascending[positions] for key, positions in self._orders.items()}
+
+    @staticmethod
+    def _lexsort_keys(keys):
+        """lexsort keys for a descending, NaN-last ordering by keys[0], keys[1], ..."""
+        sort_keys = []
+        for values in reversed(keys):
+            sort_keys.append(np.where(np.isnan(values), np.inf, -values))
+            sort_keys.append(np.isnan(values))
+        return tuple(sort_keys)
+
+    def positions(self, party=None, year=None, where=(), min_score=None, top_n=None):
+        """
+        Row positions of a ranking query, best first
+
+        Parameters:
+        - party: Party filter (None for all)
+        - year: Year filter (None for all)
+        - where: Names of precomputed masks that must all hold
+        - min_score: Minimum value of the first score column
+        - top_n: Number of rows to return (None for all; < 1 raises ValueError)
+        """
+        check_top_n(top_n)
+        key = (str(party) if party is not None else None, int(year) if year is not None else None)
+        order = self._orders.get(key)
+        if order is None:
+            return np.array([], dtype=np.intp)
+
+        if min_score is not None:
+            # Leading rows of the ordering with score >= min_score
+            order = order[:np.searchsorted(self._thresholds[key], -min_score, side='right')]
+
+        for name in where:
+            order = order[self.masks[name][order]]
+
+        return order if top_n is None else order[:top_n]
+
+    def top(self, party=None, year=None, where=(), min_score=None, top_n=None):
+        """Rows of a ranking query, best first (see positions())"""
+        return self.df.take(self.positions(party, year, where, min_score, top_n))
+
+    def select(self, party=None, year=None, where=()):
+        """Rows matching the filters in their original table order"""
+        return self.df.take(np.sort(self.positions(party, year, where)))
@@ -0,0 +1,286 @@
+"""
+Batch Recruitment Reports
+
+Recruitment reports for every (party, level, year) at once. The
+vs_top_ticket rows of every level are computed once into a single base
+frame, scored in one vectorized pass, and split into per-report sections:
+- Recruitment targets: winners ranked by recruitment score
+- Strong candidates: outperformed top of ticket against a major-party opponent
+- Crossover appeal: won or overperformed in unfavorable districts
+
+Reports are rendered to Markdown, HTML and CSV in parallel worker
+processes. Each report is hashed before rendering; reports whose hash
+matches the manifest from the previous run are skipped.
+
+Usage:
+    python analysis_tools/recruitment_reports.py [--output-dir DIR] [--force]
+"""
+
+import sys
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+import argparse
+import hashlib
+import html
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from district_candidate_analyzer import recruitment_score
+from fact_paths import crossover_candidate_filter, strong_candidate_filter
+from instrumentation import stage
+
+REPORT_DIR = 'reports/recruitment'
+LEVELS = ['house', 'senate', 'congressional']
+FORMATS = ['md', 'html', 'csv']
+
+# Bump when the rendered layout changes so every report is rewritten
+RENDER_VERSION = 1
+
+REPORT_KEYS = ['party', 'district_type', 'year']
+
+LEVEL_NAMES = {'house': 'State House', 'senate': 'State Senate', 'congressional': 'U.S. House'}
+PARTY_NAMES = {'D': 'Democratic', 'R': 'Republican', 'L': 'Libertarian', 'G': 'Green'}
+
+# Section name -> (title, row filter, sort columns, columns shown)
+SECTIONS = {
+    'targets': (
+        'Recruitment Targets',
+        lambda df: df['percentage'] > 50,
+        ['recruitment_score'],
+        ['district', 'candidate', 'percentage', 'top_ticket_pct',
+         'vs_top_ticket', 'partisan_lean', 'recruitment_score']
+    ),
+    'strong': (
+        'Strong Candidates (Outperformed Top of Ticket, Real Opposition)',
+        lambda df: df['is_strong'],
+        ['vs_top_ticket'],
+        ['district', 'candidate', 'percentage', 'top_ticket_pct', 'vs_top_ticket',
+         'opposition_strength', 'winning_margin', 'partisan_lean']
+    ),
+    'crossover': (
+        'Crossover Appeal (Unfavorable Districts)',
+        lambda df: df['is_crossover'],
+        ['partisan_lean_strength', 'vs_top_ticket'],
+        ['district', 'candidate', 'percentage', 'vs_top_ticket',
+         'partisan_lean', 'opposition_strength', 'winning_margin']
+    )
+}
+
+
+def report_hash(title, sections, fmt):
+    """Content hash of one report's rows, layout version and format"""
+    digest = hashlib.sha256(f"{RENDER_VERSION}|{fmt}|{title}".encode('utf-8'))
+    for name, frame in sections.items():
+        digest.update(f"|{name}|{','.join(frame.columns)}|{len(frame)}|".encode('utf-8'))
+        digest.update(pd.util.hash_pandas_object(frame, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _cell(value):
+    """Display text of one table cell"""
+    if isinstance(value, float):
+        return '' if pd.isna(value) else f"{value:.1f}"
+    return str(value)
+
+
+def render_markdown(title, sections):
+    lines = [f"# {title}", ""]
+    for name, frame in sections.items():
+        lines += [f"## {SECTIONS[name][0]}", ""]
+        if frame.empty:
+            lines += ["_None_", ""]
+            continue
+        lines.append("| " + " | ".join(frame.columns) + " |")
+        lines.append("|" + "---|" * len(frame.columns))
+        for row in frame.itertuples(index=False):
+            lines.append("| " + " | ".join(_cell(v) for v in row) + " |")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def render_html(title, sections):
+    parts = [
+        "<!DOCTYPE html>",
+        f"<html><head><meta charset=\"utf-8\"><title>{html.escape(title)}</title></head><body>",
+        f"<h1>{html.escape(title)}</h1>"
+    ]
+    for name, frame in sections.items():
+        parts.append(f"<h2>{html.escape(SECTIONS[name][0])}</h2>")
+        if frame.empty:
+            parts.append("<p><em>None</em></p>")
+        else:
+            parts.append(frame.to_html(index=False, float_format=lambda v: f"{v:.1f}", na_rep=''))
+    parts.append("</body></html>")
+    return "\n".join(parts)
+
+
+def render_csv(title, sections):
+    frames = [frame.assign(section=name) for name, frame in sections.items() if not frame.empty]
+    if not frames:
+        return "section\n"
+    combined = pd.concat(frames, ignore_index=True)
+    return combined[['section'] + [c for c in combined.columns if c != 'section']].to_csv(index=False)
+
+
+RENDERERS = {'md': render_markdown, 'html': render_html, 'csv': render_csv}
+
+
+def _render_batch(jobs):
+    """Render and write a batch of (path, fmt, title, sections) jobs (runs in a worker)"""
+    for path, fmt, title, sections in jobs:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(RENDERERS[fmt](title, sections))
+    return len(jobs)
+
+
+class RecruitmentReportGenerator:
+    """All (party, level, year) recruitment reports from one base frame"""
+
+    def __init__(self, analyzer=None, levels=None, min_vs_top_ticket=2.0):
+        """
+        Build the base frame and split it into reports
+
+        Parameters:
+        - analyzer: MultiYearDistrictCandidateAnalyzer (built if not given)
+        - levels: District levels to report on (default: all three)
+        - min_vs_top_ticket: Minimum outperformance for the strong section
+        """
+        if analyzer is None:
+            from district_candidate_analyzer_multiyear import MultiYearDistrictCandidateAnalyzer
+            analyzer = MultiYearDistrictCandidateAnalyzer()
+
+        frames = []
+        for level in levels or LEVELS:
+            try:
+                frames.append(analyzer.calculate_vs_top_ticket(district_level=level))
+            except ValueError as e:
+                print(f"  ⚠ {e}")
+        base = pd.concat(frames, ignore_index=True)
+
+        base['recruitment_score'] = recruitment_score(base)
+        base['is_strong'] = strong_candidate_filter(base, min_vs_top_ticket)
+        base['is_crossover'] = crossover_candidate_filter(base)
+        self.base = base
+        self.reports = self._split(base)
+
+        print(f"Built {len(self.reports)} reports from {len(base):,} candidate rows")
+
+    @staticmethod
+    def _split(base):
+        """Dict of (party, level, year) -> {section: rows}, each section sorted once for all reports"""
+        keys = base[REPORT_KEYS].drop_duplicates().sort_values(REPORT_KEYS)
+        reports = {
+            key: {name: base.iloc[0:0][columns] for name, (_, _, _, columns) in SECTIONS.items()}
+            for key in keys.itertuples(index=False, name=None)
+        }
+
+        for name, (_, row_filter, sort_by, columns) in SECTIONS.items():
+            rows = base[row_filter(base)].sort_values(sort_by, ascending=False, kind='stable')
+            for key, group in rows.groupby(REPORT_KEYS, sort=False):
+                reports[key][name] = group[columns].reset_index(drop=True)
+
+        return reports
+
+    def report(self, party, district_level='house', year=2024):
+        """Sections of one report ({section: DataFrame}; empty dict if absent)"""
+        return self.reports.get((party, district_level, year), {})
+
+    @staticmethod
+    def title(party, district_level, year):
+        return (f"{PARTY_NAMES.get(party, party)} Recruitment Report: "
+                f"{LEVEL_NAMES.get(district_level, district_level)} {year}")
+
+    def generate(self, output_dir=REPORT_DIR, formats=None, workers=None, force=False):
+        """
+        Render every report in every format, skipping unchanged ones
+
+        Parameters:
+        - output_dir: Directory for the report files and manifest.json
+        - formats: Any of 'md', 'html', 'csv' (default: all)
+        - workers: Render processes (default: CPU count; 1 renders in-process)
+        - force: Re-render even if the content hash is unchanged
+
+        Returns DataFrame with one row per file: party, level, year, format,
+        path and status ('written' or 'unchanged').
+        """
+        formats = formats or FORMATS
+        os.makedirs(output_dir, exist_ok=True)
+        manifest_path = os.path.join(output_dir, 'manifest.json')
+
+        manifest = {}
+        if os.path.exists(manifest_path) and not force:
+            with open(manifest_path, encoding='utf-8') as f:
+                manifest = json.load(f)
+
+        jobs = []
+        status = []
+        new_manifest = {}
+        for (party, level, year), sections in self.reports.items():
+            title = self.title(party, level, year)
+            for fmt in formats:
+                filename = f"{year}_{level}_{party}.{fmt}"
+                path = os.path.join(output_dir, filename)
+                digest = report_hash(title, sections, fmt)
+                new_manifest[filename] = digest
+
+                unchanged = manifest.get(filename) == digest and os.path.exists(path)
+                if not unchanged:
+                    jobs.append((path, fmt, title, sections))
+                status.append({
+                    'party': party, 'district_level': level, 'year': year, 'format': fmt,
+                    'path': path, 'status': 'unchanged' if unchanged else 'written'
+                })
+
+        workers = workers or os.cpu_count() or 1
+        with stage('render', 'RecruitmentReportGenerator', rows=len(jobs), workers=workers):
+            if jobs and workers > 1:
+                batches = [jobs[i::workers] for i in range(workers)]
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    list(pool.map(_render_batch, batches))
+            elif jobs:
+                _render_batch(jobs)
+
+        # Keep hashes of reports not generated this run (other formats/levels)
+        manifest.update(new_manifest)
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+
+        status = pd.DataFrame(status)
+        print(f"  ✓ {len(jobs)} report files written, "
+              f"{len(status) - len(jobs)} unchanged -> {output_dir}")
+        return status
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate recruitment reports for every party, level and year")
+    parser.add_argument('--output-dir', default=REPORT_DIR)
+    parser.add_argument('--format', dest='formats', action='append', choices=FORMATS,
+                        help="Output format (repeatable; default: all)")
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--force', action='store_true', help="Re-render unchanged reports")
+    args = parser.parse_args()
+
+    print("="*80)
+    print("BATCH RECRUITMENT REPORTS")
+    print("="*80)
+
+    generator = RecruitmentReportGenerator()
+    status = generator.generate(args.output_dir, args.formats, args.workers, args.force)
+
+    print("\n" + "="*80)
+    print("REPORTS BY LEVEL AND PARTY")
+    print("="*80)
+    counts = {key: len(sections['targets']) for key, sections in generator.reports.items()}
+    summary = pd.Series(counts, name='targets').rename_axis(REPORT_KEYS).reset_index()
+    print(summary.pivot_table(index=['district_type', 'year'], columns='party',
+                              values='targets', fill_value=0).astype(int).to_string())
+    print(f"\n{(status['status'] == 'written').sum()} written, "
+          f"{(status['status'] == 'unchanged').sum()} unchanged")
+
+
+if __name__ == "__main__":
+    main()
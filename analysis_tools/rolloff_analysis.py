@@ -0,0 +1,251 @@
+"""
+Ballot Roll-Off Analysis
+
+Compares the total votes cast in each down-ballot district race with the
+top-of-ticket total in the same district:
+- rolloff_ratio: Down-ballot total / top-ticket total
+- rolloff_rate: 1 - rolloff_ratio (share of top-ticket voters who skipped
+  the district race)
+- dem_dropoff / rep_dropoff: 1 - party's down-ballot votes / the same
+  party's top-ticket votes
+
+High roll-off means many voters did not engage with the district race, a
+signal of low candidate visibility. Party drop-off shows which side's
+voters stopped before reaching it.
+
+District totals and the top-ticket totals are each reduced with one
+groupby and combined in a single join, cached per district level. Only
+years whose district races ran under the plan the statewide results are
+tabulated under are joined; other races keep NaN roll-off and a
+rolloff_note saying why (plan mismatch or no top-ticket results).
+"""
+
+import sys
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+import pandas as pd
+import numpy as np
+
+from fact_paths import (
+    PARTY_CODES, RACE_FILES, RACE_PLANS, STATEWIDE_FILES, STATEWIDE_PLANS, top_ticket_office
+)
+
+
+def _district_totals(df):
+    """Total, D and R votes per (year, district)"""
+    df = df.assign(
+        district=df['district'].astype(str),
+        party=df['party'].replace(PARTY_CODES)
+    )
+    by_party = df.pivot_table(
+        index=['year', 'district'], columns='party',
+        values='votes', aggfunc='sum', fill_value=0
+    )
+    totals = pd.DataFrame({
+        'votes': by_party.sum(axis=1),
+        'dem_votes': by_party['D'] if 'D' in by_party.columns else 0,
+        'rep_votes': by_party['R'] if 'R' in by_party.columns else 0
+    })
+    return totals
+
+
+class RolloffAnalyzer:
+    """Measure ballot roll-off from the top of the ticket to district races"""
+
+    def __init__(self, district_races=None, statewide_data=None):
+        """
+        Initialize analyzer (files are loaded per level on first use)
+
+        Parameters:
+        - district_races: Optional dict of level -> pre-loaded district race frame
+        - statewide_data: Optional dict of level -> pre-loaded statewide-by-district frame
+        """
+        self._district_races = dict(district_races or {})
+        self._statewide_data = dict(statewide_data or {})
+        self._cache = {}
+
+    def _load(self, district_level):
+        """Get district races and statewide results for a level"""
+        if district_level not in self._district_races:
+            self._district_races[district_level] = pd.concat(
+                [pd.read_csv(path) for path in RACE_FILES[district_level]], ignore_index=True
+            )
+        if district_level not in self._statewide_data:
+            self._statewide_data[district_level] = pd.read_csv(STATEWIDE_FILES[district_level])
+
+        return self._district_races[district_level], self._statewide_data[district_level]
+
+    def _top_ticket_index(self, district_level, statewide):
+        """
+        Top-ticket totals per (year, district), indexed for the join
+
+        Each year keeps only its top-of-ticket office; the STATE rows are dropped.
+        Districts whose top-ticket race is missing the D or R candidate are
+        dropped so a partial parse can't pass for roll-off.
+        """
+        statewide = statewide[statewide['district'].astype(str) != 'STATE']
+        top_office = statewide['year'].map(lambda y: top_ticket_office(district_level, y))
+        top = _district_totals(statewide[statewide['office'] == top_office])
+        top = top[(top['dem_votes'] > 0) & (top['rep_votes'] > 0)]
+        return top.add_prefix('top_')
+
+    def compute(self, district_level='house'):
+        """
+        Roll-off for every (year, district) race at one level
+
+        Returns DataFrame with one row per district race. Races with no
+        comparable top-ticket total (the race ran under a different district
+        plan than the statewide results, or the year's top-ticket race has
+        no D/R results for the district) keep NaN roll-off and drop-off, and
+        rolloff_note gives the reason. Cached per level.
+        """
+        if district_level in self._cache:
+            return self._cache[district_level]
+
+        races, statewide = self._load(district_level)
+
+        down = _district_totals(races)
+        top = self._top_ticket_index(district_level, statewide)
+
+        result = down.join(top, how='left').reset_index()
+
+        # Statewide totals are only comparable when the race used the same plan
+        race_plan = result['year'].map(RACE_PLANS[district_level])
+        top_plan = result['year'].map(STATEWIDE_PLANS[district_level])
+        plan_mismatch = race_plan != top_plan
+        top_cols = [col for col in result.columns if col.startswith('top_')]
+        result.loc[plan_mismatch, top_cols] = np.nan
+
+        result['rolloff_note'] = np.select(
+            [plan_mismatch, result['top_votes'].isna()],
+            [
+                'race plan ' + race_plan.astype(str) + ' != statewide plan ' + top_plan.astype(str),
+                'no D/R top-ticket results for district'
+            ],
+            default=''
+        )
+
+        result['is_contested_dr'] = (result['dem_votes'] > 0) & (result['rep_votes'] > 0)
+
+        top_votes = result['top_votes'].where(result['top_votes'] > 0)
+        result['rolloff_ratio'] = result['votes'] / top_votes
+        result['rolloff_rate'] = 1 - result['rolloff_ratio']
+        result['dem_dropoff'] = 1 - result['dem_votes'] / result['top_dem_votes'].where(result['top_dem_votes'] > 0)
+        result['rep_dropoff'] = 1 - result['rep_votes'] / result['top_rep_votes'].where(result['top_rep_votes'] > 0)
+        result['dropoff_gap'] = result['dem_dropoff'] - result['rep_dropoff']
+
+        result.insert(0, 'district_level', district_level)
+        result.insert(3, 'top_office', result['year'].map(lambda y: top_ticket_office(district_level, y)))
+
+        result = result.sort_values(
+            ['year', 'district'], key=lambda col: pd.to_numeric(col, errors='coerce')
+        ).reset_index(drop=True)
+
+        self._cache[district_level] = result
+        return result
+
+    def missing_top_ticket(self, district_level='house'):
+        """
+        Races without a roll-off measurement, counted by year and reason
+
+        Returns DataFrame with year, top_office, rolloff_note and races.
+        """
+        rolloff = self.compute(district_level)
+        missing = rolloff[rolloff['rolloff_note'] != '']
+        return missing.groupby(['year', 'top_office', 'rolloff_note']).size().reset_index(name='races')
+
+    def compute_all(self):
+        """Roll-off for every level with available data"""
+        return pd.concat(
+            [self.compute(level) for level in RACE_FILES], ignore_index=True
+        )
+
+    def add_candidate_features(self, candidates, district_level='house'):
+        """
+        Join roll-off features onto candidate rows
+
+        Parameters:
+        - candidates: DataFrame with year, district and party columns
+        - district_level: Level the candidates ran at
+
+        Adds rolloff_rate (the race's roll-off), party_dropoff (drop-off of
+        the candidate's own party; NaN for third parties) and rolloff_note
+        (why roll-off is NaN; '' when measured). party_dropoff is built
+        from the candidate's own votes, so it describes a result and must
+        not be used to predict one.
+        """
+        rolloff = self.compute(district_level)
+        keys = rolloff.set_index(['year', 'district'])
+
+        index = pd.MultiIndex.from_arrays([
+            candidates['year'].to_numpy(), candidates['district'].astype(str).to_numpy()
+        ])
+        rows = keys.index.get_indexer(index)
+        found = rows >= 0
+
+        def lookup(col):
+            values = np.full(len(candidates), np.nan)
+            values[found] = keys[col].to_numpy(dtype=float)[rows[found]]
+            return values
+
+        party = candidates['party'].to_numpy()
+        dem, rep = lookup('dem_dropoff'), lookup('rep_dropoff')
+
+        note = np.full(len(candidates), 'no district race', dtype=object)
+        note[found] = keys['rolloff_note'].to_numpy()[rows[found]]
+
+        return candidates.assign(
+            rolloff_rate=lookup('rolloff_rate'),
+            party_dropoff=np.select([party == 'D', party == 'R'], [dem, rep], default=np.nan),
+            rolloff_note=note
+        )
+
+    def summarize(self, district_level='house', contested_only=True):
+        """Mean roll-off and party drop-off by year (measured counts races with roll-off)"""
+        rolloff = self.compute(district_level)
+        if contested_only:
+            rolloff = rolloff[rolloff['is_contested_dr']]
+
+        return rolloff.groupby('year').agg(
+            races=('district', 'size'),
+            measured=('rolloff_rate', 'count'),
+            mean_rolloff=('rolloff_rate', 'mean'),
+            median_rolloff=('rolloff_rate', 'median'),
+            mean_dem_dropoff=('dem_dropoff', 'mean'),
+            mean_rep_dropoff=('rep_dropoff', 'mean')
+        ).reset_index()
+
+
+def main():
+    print("="*80)
+    print("BALLOT ROLL-OFF ANALYSIS")
+    print("="*80)
+
+    analyzer = RolloffAnalyzer()
+
+    for level in ['house', 'senate', 'congressional']:
+        print("\n" + "="*80)
+        print(f"{level.upper()} - ROLL-OFF BY YEAR (D vs R contested races)")
+        print("="*80)
+        print(analyzer.summarize(level).round(3).to_string(index=False))
+
+        missing = analyzer.missing_top_ticket(level)
+        if not missing.empty:
+            print("\n  ⚠ Races without roll-off:")
+            print(missing.to_string(index=False))
+
+    print("\n" + "="*80)
+    print("HIGHEST ROLL-OFF STATE HOUSE RACES (contested)")
+    print("="*80)
+    house = analyzer.compute('house')
+    house = house[house['is_contested_dr']].dropna(subset=['rolloff_rate'])
+    house = house.sort_values('rolloff_rate', ascending=False)
+    print(house[[
+        'year', 'district', 'top_office', 'votes', 'top_votes',
+        'rolloff_rate', 'dem_dropoff', 'rep_dropoff'
+    ]].head(15).round(3).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+"""
+Low-Rank Decomposition of District Swing
+
+Stacks every statewide race reported by district into one
+districts x races matrix of two-party D share, removes the statewide
+result of each race and the average lean of each district, and factors the
+remaining residuals with a truncated randomized SVD:
+
+    residual ~= U * S * V^T
+
+- District loadings (U * S): How strongly each district moves along each
+  axis, e.g. a Hispanic-shift or suburban-shift pattern
+- Race scores (V): How much each race expressed each axis
+
+New races are added by fold-in: the race's residual vector is projected
+onto the existing district factors (v = S^-1 U^T x) without recomputing
+the SVD.
+
+Each level (house, senate, congressional) is decomposed separately, using
+only races reported under one district plan.
+"""
+
+import sys
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+import pandas as pd
+import numpy as np
+from sklearn.utils.extmath import randomized_svd
+
+from fact_paths import PARTY_CODES, STATEWIDE_FILES, STATEWIDE_PLANS
+
+
+class SwingDecomposition:
+    """Truncated SVD of district D-share residuals across races"""
+
+    def __init__(self, district_level='house', plan=None, n_components=3,
+                 statewide_data=None, n_iter=7, seed=0):
+        """
+        Build the residual matrix and fit the decomposition
+
+        Parameters:
+        - district_level: 'house', 'senate', or 'congressional'
+        - plan: District plan to use (default: the most recent year's plan)
+        - n_components: Number of factors to keep
+        - statewide_data: Optional pre-loaded statewide-by-district frame
+        - n_iter: Power iterations for the randomized SVD
+        - seed: Random seed for the randomized SVD
+        """
+        self.district_level = district_level
+        plans = STATEWIDE_PLANS[district_level]
+        self.plan = plan or plans[max(plans)]
+        self.years = [y for y, p in plans.items() if p == self.plan]
+
+        if statewide_data is None:
+            statewide_data = pd.read_csv(STATEWIDE_FILES[district_level])
+        self.statewide_data = statewide_data
+
+        shares, statewide_share = self._two_party_shares(
+            statewide_data[statewide_data['year'].isin(self.years)]
+        )
+        self.districts = shares.index.to_numpy()
+
+        # Remove each race's statewide result, then each district's average lean
+        deviations = shares.to_numpy() - statewide_share.to_numpy()[None, :]
+        self.district_mean = deviations.mean(axis=1)
+        residuals = deviations - self.district_mean[:, None]
+
+        n_components = min(n_components, min(residuals.shape) - 1)
+        U, S, Vt = randomized_svd(residuals, n_components, n_iter=n_iter, random_state=seed)
+
+        self.U = U
+        self.S = S
+        self.n_components = n_components
+        self.total_variance = float((residuals ** 2).sum())
+        self._race_scores = pd.DataFrame(
+            Vt.T, index=shares.columns, columns=self._component_names()
+        )
+        self._race_scores['folded_in'] = False
+        self._race_scores['fit_quality'] = 1 - self._unexplained(residuals)
+
+        print(f"Decomposed {len(self.districts)} {district_level} districts x "
+              f"{len(shares.columns)} races ({self.plan}) into {n_components} factors "
+              f"explaining {self.explained_variance_ratio().sum():.1%} of residual variance")
+
+    @staticmethod
+    def _two_party_shares(data):
+        """
+        Two-party D share per district for every complete race
+
+        Returns (districts x races share frame, statewide share per race).
+        Races missing a D or R vote in any district are dropped.
+        """
+        data = data.assign(
+            district=data['district'].astype(str),
+            party=data['party'].replace(PARTY_CODES)
+        )
+        data = data[data['party'].isin(['D', 'R'])]
+
+        votes = data.pivot_table(
+            index='district', columns=['party', 'year', 'office'],
+            values='votes', aggfunc='sum'
+        )
+        if not {'D', 'R'} <= set(votes.columns.get_level_values('party')):
+            return pd.DataFrame(), pd.Series(dtype=float)
+
+        dem = votes['D']
+        rep = votes['R'].reindex(index=dem.index, columns=dem.columns)
+
+        state_dem = dem.loc['STATE'] if 'STATE' in dem.index else None
+        state_rep = rep.loc['STATE'] if 'STATE' in rep.index else None
+        dem = dem.drop(index='STATE', errors='ignore')
+        rep = rep.drop(index='STATE', errors='ignore')
+
+        complete = (dem > 0).all(axis=0) & (rep > 0).all(axis=0)
+        dem, rep = dem.loc[:, complete], rep.loc[:, complete]
+        shares = dem / (dem + rep)
+
+        # Statewide share from the STATE rows, else from the district sums
+        if state_dem is not None and state_rep is not None:
+            statewide = (state_dem / (state_dem + state_rep))[complete]
+        else:
+            statewide = dem.sum() / (dem.sum() + rep.sum())
+
+        shares = shares.sort_index(key=lambda idx: pd.to_numeric(idx, errors='coerce'))
+        shares.columns = [f"{year} {office}" for year, office in shares.columns]
+        statewide.index = shares.columns
+
+        return shares, statewide
+
+    def _component_names(self):
+        """Column names for the kept factors"""
+        return [f'factor_{i + 1}' for i in range(self.n_components)]
+
+    def _unexplained(self, residuals):
+        """Share of each race column's residual not captured by the factors"""
+        projected = self.U @ (self.U.T @ residuals)
+        norms = (residuals ** 2).sum(axis=0)
+        return np.where(norms > 0, ((residuals - projected) ** 2).sum(axis=0) / norms, 0)
+
+    def explained_variance_ratio(self):
+        """Share of total residual variance captured by each factor"""
+        return pd.Series(self.S ** 2 / self.total_variance, index=self._component_names())
+
+    def district_loadings(self):
+        """Districts x factors loadings (U * S, in D-share units)"""
+        loadings = pd.DataFrame(self.U * self.S, index=self.districts, columns=self._component_names())
+        loadings.index.name = 'district'
+        loadings['district_lean'] = self.district_mean
+        return loadings
+
+    def race_scores(self):
+        """Races x factors scores, including any folded-in races"""
+        return self._race_scores.copy()
+
+    def top_districts(self, factor=1, n=10):
+        """Districts with the most positive and most negative loadings on one factor"""
+        loadings = self.district_loadings()[f'factor_{factor}'].sort_values()
+        return {
+            'positive': loadings.tail(n)[::-1],
+            'negative': loadings.head(n)
+        }
+
+    def fold_in(self, district_shares, label, statewide_share=None):
+        """
+        Add a race to the race scores without refitting
+
+        Parameters:
+        - district_shares: Series of district -> two-party D share
+        - label: Name for the race (e.g. '2026 Governor')
+        - statewide_share: Statewide two-party D share (default: unweighted
+          district mean, which is only approximate)
+
+        Returns the race's factor scores. Districts missing from the new race
+        contribute no deviation.
+        """
+        shares = pd.Series(district_shares, dtype=float).rename(index=str).reindex(self.districts)
+        if statewide_share is None:
+            statewide_share = shares.mean()
+
+        x = (shares.to_numpy() - statewide_share) - self.district_mean
+        x = np.nan_to_num(x)[:, None]
+
+        scores = (self.U.T @ x).ravel() / self.S
+        row = dict(zip(self._component_names(), scores))
+        row['folded_in'] = True
+        row['fit_quality'] = 1 - float(self._unexplained(x)[0])
+
+        self._race_scores.loc[label] = pd.Series(row)
+        return self._race_scores.loc[label]
+
+    def fold_in_race(self, year, office, statewide_data=None):
+        """
+        Fold in a statewide race from a results frame in the standard format
+
+        Parameters:
+        - year, office: Race to add
+        - statewide_data: Frame containing the race (default: the loaded data)
+        """
+        data = self.statewide_data if statewide_data is None else statewide_data
+        race = data[(data['year'] == year) & (data['office'] == office)]
+        shares, statewide = self._two_party_shares(race)
+        if shares.empty:
+            raise ValueError(f"No complete D/R results for {year} {office}")
+
+        return self.fold_in(shares.iloc[:, 0], shares.columns[0], statewide_share=statewide.iloc[0])
+
+
+def main():
+    print("="*80)
+    print("LOW-RANK DECOMPOSITION OF DISTRICT SWING")
+    print("="*80)
+
+    for level in ['house', 'senate', 'congressional']:
+        print("\n" + "="*80)
+        print(f"{level.upper()}")
+        print("="*80)
+
+        decomposition = SwingDecomposition(district_level=level, n_components=3)
+        print("\nExplained variance by factor:")
+        print(decomposition.explained_variance_ratio().round(3).to_string())
+
+        print("\nRace scores:")
+        print(decomposition.race_scores().round(3).to_string())
+
+        top = decomposition.top_districts(factor=1, n=5)
+        print("\nFactor 1 - most positive districts:")
+        print(top['positive'].round(4).to_string())
+        print("\nFactor 1 - most negative districts:")
+        print(top['negative'].round(4).to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+"""
+Vote-Mode Decomposition Analyzer
+
+Breaks candidate performance down by how votes were cast (early voting,
+election day, mail, absentee, provisional, limited) using the OpenElections
+precinct files, and compares each candidate to the top of the ticket
+within each mode.
+
+Precinct results are aggregated to State House, State Senate and
+Congressional districts through a precinct -> district mapping taken from
+the district races on the same ballots. The precinct file is streamed in
+chunks with categorical dtypes; each chunk is reduced with a groupby before
+the next is read, so the full file never sits in memory as Python objects.
+"""
+
+import sys
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+import pandas as pd
+import numpy as np
+from pandas.api.types import union_categoricals
+
+from fact_paths import PARTY_CODES, PRECINCT_FILES, STATEWIDE_OFFICES
+from instrumentation import log
+
+VOTE_MODES = ['early_voting', 'election_day', 'mail', 'absentee', 'provisional', 'limited']
+
+# District race office -> district level
+DISTRICT_OFFICES = {
+    'State Representative': 'house',
+    'State Senate': 'senate',
+    'U.S. House': 'congressional'
+}
+
+
+def _recode_categories(values, mapper):
+    """Map a categorical Series' categories, merging any that map to the same label"""
+    codes, labels = pd.factorize(pd.Index(mapper(values.cat.categories)))
+    return pd.Series(pd.Categorical.from_codes(codes[values.cat.codes], labels), index=values.index)
+
+
+class VoteModeAnalyzer:
+    """Analyze candidate performance by vote mode"""
+
+    def __init__(self, year=2018, chunk_size=200_000):
+        """
+        Load and reduce one precinct file
+
+        Parameters:
+        - year: Election year (2016 or 2018)
+        - chunk_size: Rows read per chunk
+        """
+        self.year = year
+        self.top_office = 'President' if year % 4 == 0 else 'Governor'
+
+        self.precinct_votes, self.precinct_districts = self._load_precinct_modes(
+            PRECINCT_FILES[year], chunk_size
+        )
+        self.modes = [m for m in VOTE_MODES if m in self.precinct_votes.columns]
+        self._district_cache = {}
+
+        log(f"Loaded {year} vote modes: {self.precinct_votes['precinct_id'].nunique():,} precincts, "
+            f"modes: {', '.join(self.modes)}")
+
+    def _load_precinct_modes(self, path, chunk_size):
+        """
+        Stream the precinct file and reduce it to per-precinct mode totals
+
+        Returns:
+        - votes: (county, precinct, office, district, candidate, party) x mode totals
+          for statewide and district races
+        - districts: Precinct -> district number for each district level
+        """
+        header = pd.read_csv(path, nrows=0).columns
+        modes = [m for m in VOTE_MODES if m in header]
+        keys = ['county', 'precinct', 'office', 'district', 'candidate', 'party']
+
+        offices = STATEWIDE_OFFICES + list(DISTRICT_OFFICES)
+        dtypes = {col: 'category' for col in keys}
+        dtypes.update({m: 'float32' for m in modes + ['votes']})
+
+        partials = []
+        reader = pd.read_csv(path, usecols=keys + ['votes'] + modes, dtype=dtypes,
+                             chunksize=chunk_size)
+        for chunk in reader:
+            chunk = chunk[chunk['office'].isin(offices) & chunk['candidate'].notna()]
+            if chunk.empty:
+                continue
+            # Blank keys (e.g. no district for statewide races) become '' per chunk
+            for col in keys:
+                if chunk[col].hasnans:
+                    values = chunk[col]
+                    if '' not in values.cat.categories:
+                        values = values.cat.add_categories([''])
+                    chunk[col] = values.fillna('')
+            partials.append(
+                chunk.groupby(keys, observed=True)[['votes'] + modes].sum().reset_index()
+            )
+
+        if not partials:
+            raise ValueError(f"No rows in {path} for any of the offices: {', '.join(offices)}")
+
+        # Chunks carry different categories; union them so the regroup stays categorical
+        votes = pd.concat([part[['votes'] + modes] for part in partials], ignore_index=True)
+        for col in keys:
+            votes[col] = union_categoricals([part[col] for part in partials])
+        votes = votes.groupby(keys, observed=True, as_index=False)[['votes'] + modes].sum()
+
+        votes['party'] = _recode_categories(votes['party'], lambda cats: cats.map(lambda p: PARTY_CODES.get(p, p)))
+        votes['district'] = _recode_categories(votes['district'], lambda cats: cats.str.replace(r'\.0$', '', regex=True))
+        votes['precinct_id'] = votes['county'].astype(str) + ' ' + votes['precinct'].astype(str)
+        votes['district'] = votes['district'].astype(str)
+        votes['precinct'] = votes['precinct'].astype(str)
+
+        # Each precinct's district at every level comes from the district race on its ballot
+        district_rows = votes[votes['office'].isin(list(DISTRICT_OFFICES))]
+        districts = (
+            district_rows.assign(level=district_rows['office'].map(DISTRICT_OFFICES))
+            .drop_duplicates(['precinct_id', 'level'])
+            .pivot(index='precinct_id', columns='level', values='district')
+        )
+
+        return votes, districts
+
+    def district_mode_results(self, district_level='house'):
+        """
+        Candidate share and vs-top-ticket by vote mode for every district
+
+        Statewide candidates are aggregated to districts through the
+        precinct -> district mapping; district-race candidates use their own
+        district. Shares are within each (district, office, mode).
+
+        Returns long DataFrame with one row per
+        (district, office, candidate, mode). Cached per level.
+        """
+        if district_level in self._district_cache:
+            return self._district_cache[district_level]
+
+        votes = self.precinct_votes
+        mapping = self.precinct_districts[district_level].dropna()
+
+        statewide = votes[votes['office'].isin(STATEWIDE_OFFICES)]
+        statewide = statewide.assign(district=statewide['precinct_id'].map(mapping)).dropna(subset=['district'])
+
+        race_office = [o for o, level in DISTRICT_OFFICES.items() if level == district_level]
+        district_races = votes[votes['office'].isin(race_office)]
+
+        combined = pd.concat([statewide, district_races], ignore_index=True)
+        combined['office'] = combined['office'].astype(str)
+        combined['candidate'] = combined['candidate'].astype(str)
+        combined['party'] = combined['party'].astype(str)
+
+        wide = combined.groupby(
+            ['district', 'office', 'candidate', 'party'], as_index=False
+        )[['votes'] + self.modes].sum()
+
+        long = wide.melt(
+            id_vars=['district', 'office', 'candidate', 'party'],
+            value_vars=['votes'] + self.modes, var_name='mode', value_name='mode_votes'
+        )
+        long['mode'] = long['mode'].replace({'votes': 'total'})
+
+        totals = long.groupby(['district', 'office', 'mode'])['mode_votes'].transform('sum')
+        long['mode_share'] = long['mode_votes'] / totals.where(totals > 0) * 100
+
+        # Same-party top-of-ticket share in the same district and mode
+        top = long[long['office'] == self.top_office][['district', 'party', 'mode', 'candidate', 'mode_share']]
+        top = top.drop_duplicates(['district', 'party', 'mode']).rename(columns={
+            'candidate': 'top_ticket_candidate', 'mode_share': 'top_ticket_share'
+        })
+        long = long.merge(top, on=['district', 'party', 'mode'], how='left')
+        long['vs_top_ticket'] = long['mode_share'] - long['top_ticket_share']
+
+        # Mode mix: how much of each candidate's vote came from each mode
+        cand_total = long[long['mode'] == 'total'][['district', 'office', 'candidate', 'mode_votes']]
+        long = long.merge(
+            cand_total.rename(columns={'mode_votes': 'candidate_total'}),
+            on=['district', 'office', 'candidate'], how='left'
+        )
+        long['mode_mix'] = long['mode_votes'] / long['candidate_total'].where(long['candidate_total'] > 0) * 100
+
+        long.insert(0, 'year', self.year)
+        long.insert(1, 'district_level', district_level)
+        long = long.drop(columns=['candidate_total']).sort_values(
+            ['district', 'office', 'candidate', 'mode'],
+            key=lambda col: pd.to_numeric(col, errors='coerce') if col.name == 'district' else col
+        ).reset_index(drop=True)
+
+        self._district_cache[district_level] = long
+        return long
+
+    def mode_gap(self, district_level='house', mode_a='early_voting', mode_b='election_day'):
+        """
+        Difference in vs-top-ticket between two modes for every candidate
+
+        Positive values mean the candidate ran further ahead of the top of the
+        ticket among mode_a voters than among mode_b voters.
+        """
+        results = self.district_mode_results(district_level)
+        wide = results[results['mode'].isin([mode_a, mode_b])].pivot_table(
+            index=['district', 'office', 'candidate', 'party'],
+            columns='mode', values='vs_top_ticket'
+        ).dropna()
+
+        if mode_a not in wide.columns or mode_b not in wide.columns:
+            return pd.DataFrame()
+
+        wide['mode_gap'] = wide[mode_a] - wide[mode_b]
+        return wide.reset_index().sort_values('mode_gap', ascending=False)
+
+    def statewide_mode_shares(self):
+        """Statewide candidate share by mode for every statewide race"""
+        votes = self.precinct_votes[self.precinct_votes['office'].isin(STATEWIDE_OFFICES)]
+        totals = votes.groupby(['office', 'candidate', 'party'], observed=True)[['votes'] + self.modes].sum()
+        shares = totals / totals.groupby(level='office', observed=True).transform('sum') * 100
+        return shares.rename(columns={'votes': 'total'}).reset_index()
+
+
+def main():
+    print("="*80)
+    print("VOTE-MODE DECOMPOSITION")
+    print("="*80)
+
+    analyzer = VoteModeAnalyzer(year=2018)
+
+    print("\n" + "="*80)
+    print("STATEWIDE SHARE BY VOTE MODE - 2018")
+    print("="*80)
+    print(analyzer.statewide_mode_shares().round(1).to_string(index=False))
+
+    print("\n" + "="*80)
+    print("STATE HOUSE CANDIDATES: EARLY VOTE vs ELECTION DAY (vs Top of Ticket)")
+    print("="*80)
+    gap = analyzer.mode_gap('house', 'early_voting', 'election_day')
+    house_cands = gap[gap['office'] == 'State Representative']
+    print(house_cands.head(15).round(2).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
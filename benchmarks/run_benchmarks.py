@@ -0,0 +1,495 @@
+"""
+Benchmark Harness
+
+Times every analyzer entry point and the VTD aggregation on synthetic data
+roots (see synthetic_data.py) at 1x, 10x and 100x scale, and writes the
+results as JSON so runs can be compared across commits. Runs fully offline.
+
+Each benchmark is run once under tracemalloc for peak Python memory, then
+--repeat times untraced for wall time (min and median are reported).
+Benchmarks with a max_scale are skipped above it (e.g. the row-by-row
+paths, which are quadratic). The PDF parsers run on the PDFs already in
+texas_election_data/pdf_extracts when pdfplumber is installed.
+
+Usage:
+    python benchmarks/run_benchmarks.py                      # 1x and 10x
+    python benchmarks/run_benchmarks.py --scale 1 10 100 --repeat 5
+    python benchmarks/run_benchmarks.py --only war --scale 1
+    python benchmarks/run_benchmarks.py --compare benchmarks/results/<old>.json
+"""
+
+import sys
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+import argparse
+import contextlib
+import datetime
+import gc
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+ROOT = BENCH_DIR.parent
+DATA_DIR = BENCH_DIR / 'data'
+RESULTS_DIR = BENCH_DIR / 'results'
+
+sys.path.insert(0, str(ROOT / 'analysis_tools'))
+sys.path.insert(0, str(ROOT / 'data_collection'))
+sys.path.insert(0, str(BENCH_DIR))
+
+from synthetic_data import SCALES, VTD_YEAR, generate
+
+VTD_RETURNS = f'texas_election_data/vtd_data/{VTD_YEAR}_data/{VTD_YEAR}_General_Election_Returns.csv'
+HOUSE_ASSIGNMENT = 'texas_election_data/vtd_data/assignments/PLANH2316.csv'
+
+
+class Context:
+    """Warm objects shared by benchmarks at one scale (built on first use, untimed)"""
+
+    def __init__(self):
+        self._objects = {}
+
+    def get(self, name, build):
+        if name not in self._objects:
+            with contextlib.redirect_stdout(io.StringIO()):
+                self._objects[name] = build()
+        return self._objects[name]
+
+    def analyzer(self):
+        from district_candidate_analyzer_multiyear import MultiYearDistrictCandidateAnalyzer
+        return self.get('analyzer', MultiYearDistrictCandidateAnalyzer)
+
+    def war_model(self):
+        def build():
+            from political_war_model import PoliticalWARModel
+            model = PoliticalWARModel()
+            model.calculate_war_scores()
+            return model
+        return self.get('war_model', build)
+
+    def identity(self):
+        from candidate_identity import CandidateIdentityIndex
+        return self.get('identity', CandidateIdentityIndex)
+
+
+# ----------------------------------------------------------------------
+# Benchmarks: name -> (setup(ctx) returning a zero-argument callable, max_scale)
+# ----------------------------------------------------------------------
+
+def _materialize(ctx):
+    import fact_tables
+    from fact_paths import FACT_DIR
+
+    def run():
+        shutil.rmtree(FACT_DIR, ignore_errors=True)
+        for level in ['house', 'senate', 'congressional']:
+            fact_tables.materialize(level)
+    return run
+
+
+def _analyzer_init(ctx):
+    from district_candidate_analyzer_multiyear import MultiYearDistrictCandidateAnalyzer
+    ctx.analyzer().get_fact_table('house')  # fact tables exist before timing
+    return MultiYearDistrictCandidateAnalyzer
+
+
+def _vs_top_ticket(level, use_fact_tables=True):
+    def setup(ctx):
+        analyzer = ctx.analyzer()
+        if not use_fact_tables:
+            from district_candidate_analyzer_multiyear import MultiYearDistrictCandidateAnalyzer
+            analyzer = ctx.get('analyzer_rows', lambda: MultiYearDistrictCandidateAnalyzer(use_fact_tables=False))
+        return lambda: analyzer.calculate_vs_top_ticket(level)
+    return setup
+
+
+def _strong(ctx):
+    analyzer = ctx.analyzer()
+    analyzer.get_ranking('house')
+    return lambda: analyzer.identify_strong_candidates('house', year=2024, party='D', top_n=20)
+
+
+def _crossover(ctx):
+    analyzer = ctx.analyzer()
+    analyzer.get_ranking('house', 'crossover')
+    return lambda: analyzer.identify_crossover_appeal_candidates('house', year=2020, party='D')
+
+
+def _compare_years(ctx):
+    analyzer = ctx.analyzer()
+    return lambda: analyzer.compare_years(2020, 2024, 'house', party='D')
+
+
+def _track(ctx):
+    analyzer = ctx.analyzer()
+    names = analyzer.house_races['candidate'].drop_duplicates().head(50).tolist()
+    return lambda: analyzer.track_candidates_over_time(names, 'house', regex=False)
+
+
+def _single_year_view(ctx):
+    from district_candidate_analyzer import DistrictCandidateAnalyzer
+    analyzer = ctx.analyzer()
+    return lambda: DistrictCandidateAnalyzer(2024, analyzer).generate_recruitment_report('D', 'house')
+
+
+def _war_prepare(use_fact_tables=True):
+    def setup(ctx):
+        from political_war_model import PoliticalWARModel
+        model = ctx.get(f'war_prepare_{use_fact_tables}',
+                        lambda: PoliticalWARModel(use_fact_tables=use_fact_tables))
+        return model.prepare_training_data
+    return setup
+
+
+def _war_scores(ctx):
+    from political_war_model import PoliticalWARModel
+
+    def run():
+        model = PoliticalWARModel()
+        model.calculate_war_scores()
+        return model
+    return run
+
+
+def _career_war(ctx):
+    model = ctx.war_model()
+
+    def run():
+        model.career_war = None
+        return model.calculate_career_war()
+    return run
+
+
+def _war_top(ctx):
+    model = ctx.war_model()
+    model.get_top_performers()
+    return lambda: model.get_top_performers(party='D', year=2022, top_n=20)
+
+
+def _strength(ctx):
+    from candidate_strength_model import CandidateStrengthAnalyzer
+    analyzer = ctx.get('strength', lambda: CandidateStrengthAnalyzer(geographic_level='house'))
+    return analyzer.analyze_all_races
+
+
+def _identity(ctx):
+    from candidate_identity import CandidateIdentityIndex
+    return CandidateIdentityIndex
+
+
+def _career_tracker(ctx):
+    from career_tracker import CareerTracker
+    identity = ctx.identity()
+    model = ctx.war_model()
+    return lambda: CareerTracker(identity=identity, war_model=model)
+
+
+def _reports(ctx):
+    from recruitment_reports import RecruitmentReportGenerator
+    analyzer = ctx.analyzer()
+
+    def run():
+        output = tempfile.mkdtemp(prefix='bench_reports_')
+        try:
+            RecruitmentReportGenerator(analyzer).generate(output, workers=1)
+        finally:
+            shutil.rmtree(output, ignore_errors=True)
+    return run
+
+
+def _vtd_district_races(ctx):
+    from parse_vtd_district_races import extract_district_races_from_vtd
+    return lambda: extract_district_races_from_vtd(VTD_RETURNS, VTD_YEAR)
+
+
+def _vtd_congressional_races(ctx):
+    from parse_congressional_races import extract_congressional_races_from_vtd
+    return lambda: extract_congressional_races_from_vtd(VTD_RETURNS, VTD_YEAR)
+
+
+def _vtd_crosswalk(ctx):
+    from vtd_crosswalk import VTDCrosswalk, load_vtd_returns, reaggregate
+
+    def run():
+        crosswalk = VTDCrosswalk.from_csv(HOUSE_ASSIGNMENT)
+        vote_matrix, vtds, candidates = load_vtd_returns(VTD_RETURNS)
+        return reaggregate(crosswalk, vote_matrix, vtds, candidates, VTD_YEAR)
+    return run
+
+
+BENCHMARKS = {
+    'fact_tables.materialize': (_materialize, None),
+    'multiyear.__init__': (_analyzer_init, None),
+    'multiyear.calculate_vs_top_ticket[house]': (_vs_top_ticket('house'), None),
+    'multiyear.calculate_vs_top_ticket[senate]': (_vs_top_ticket('senate'), None),
+    'multiyear.calculate_vs_top_ticket[congressional]': (_vs_top_ticket('congressional'), None),
+    'multiyear.calculate_vs_top_ticket[house,rows]': (_vs_top_ticket('house', use_fact_tables=False), 1),
+    'multiyear.identify_strong_candidates': (_strong, None),
+    'multiyear.identify_crossover_appeal_candidates': (_crossover, None),
+    'multiyear.compare_years': (_compare_years, None),
+    'multiyear.track_candidates_over_time': (_track, None),
+    'single_year.generate_recruitment_report': (_single_year_view, None),
+    'war.prepare_training_data': (_war_prepare(), None),
+    'war.prepare_training_data[rows]': (_war_prepare(use_fact_tables=False), 1),
+    'war.calculate_war_scores': (_war_scores, None),
+    'war.calculate_career_war': (_career_war, None),
+    'war.get_top_performers': (_war_top, None),
+    'strength.analyze_all_races': (_strength, None),
+    'identity.CandidateIdentityIndex': (_identity, 10),
+    'career.CareerTracker': (_career_tracker, 10),
+    'reports.generate': (_reports, None),
+    'vtd.extract_district_races': (_vtd_district_races, 10),
+    'vtd.extract_congressional_races': (_vtd_congressional_races, None),
+    'vtd.crosswalk_reaggregate': (_vtd_crosswalk, None)
+}
+
+# PDF parsers run on the repository's own PDFs (scale 'pdf')
+PDF_BENCHMARKS = {
+    'pdf.parse_house_statewide[2024]': (
+        'parse_house_statewide_CORRECT', 'parse_house_pdf_generic',
+        ('texas_election_data/pdf_extracts/2024_planh2316.pdf', 2024, 'PLANH2316')
+    ),
+    'pdf.parse_senate_statewide[2022]': (
+        'parse_senate_districts_CORRECT', 'parse_senate_pdf_generic',
+        ('texas_election_data/pdf_extracts/2022_senate_PLANS2168_r206_CORRECT.pdf', 2022, 'PLANS2168')
+    ),
+    'pdf.parse_congressional_statewide[2024]': (
+        'parse_congressional_statewide_CORRECT', 'parse_congressional_pdf_generic',
+        ('texas_election_data/pdf_extracts/2024_congressional_PLANC2193_r206.pdf', 2024, 'PLANC2193')
+    )
+}
+
+
+# ----------------------------------------------------------------------
+# Measurement
+# ----------------------------------------------------------------------
+
+def measure(run, repeat):
+    """
+    Peak traced memory of one run, then wall times of `repeat` untraced runs
+
+    Returns dict of seconds_min, seconds_median, peak_mb, runs.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        gc.collect()
+        tracemalloc.start()
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        times = []
+        for _ in range(repeat):
+            gc.collect()
+            start = time.perf_counter()
+            run()
+            times.append(time.perf_counter() - start)
+
+    return {
+        'seconds_min': min(times),
+        'seconds_median': statistics.median(times),
+        'peak_mb': peak / 1e6,
+        'runs': times
+    }
+
+
+def run_scale(scale, names, repeat, regenerate=False):
+    """Run the selected benchmarks on one synthetic data root"""
+    root = generate(DATA_DIR / f'scale_{scale}', scale, force=regenerate)
+    results = []
+
+    cwd = os.getcwd()
+    os.chdir(root)
+    try:
+        ctx = Context()
+        for name in names:
+            setup, max_scale = BENCHMARKS[name]
+            result = {'benchmark': name, 'scale': scale}
+            if max_scale is not None and scale > max_scale:
+                result['status'] = 'skipped'
+                result['reason'] = f'max scale {max_scale}x'
+            else:
+                try:
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        run = setup(ctx)
+                    result.update(measure(run, repeat))
+                    result['status'] = 'ok'
+                except Exception as e:
+                    result['status'] = 'error'
+                    result['error'] = f'{type(e).__name__}: {e}'
+            print_result(result)
+            results.append(result)
+    finally:
+        os.chdir(cwd)
+
+    return results
+
+
+def run_pdf(names, repeat):
+    """Run the PDF parser benchmarks on the repository's PDFs (needs pdfplumber)"""
+    results = []
+    try:
+        import pdfplumber  # noqa: F401
+        missing = None
+    except ImportError:
+        missing = 'pdfplumber not installed'
+
+    cwd = os.getcwd()
+    os.chdir(ROOT)
+    try:
+        for name in names:
+            module_name, function_name, args = PDF_BENCHMARKS[name]
+            result = {'benchmark': name, 'scale': 'pdf'}
+            if missing or not os.path.exists(args[0]):
+                result['status'] = 'skipped'
+                result['reason'] = missing or f'{args[0]} not found'
+            else:
+                try:
+                    function = getattr(__import__(module_name), function_name)
+                    result.update(measure(lambda: function(*args), repeat))
+                    result['status'] = 'ok'
+                except Exception as e:
+                    result['status'] = 'error'
+                    result['error'] = f'{type(e).__name__}: {e}'
+            print_result(result)
+            results.append(result)
+    finally:
+        os.chdir(cwd)
+
+    return results
+
+
+def print_result(result):
+    label = f"{result['benchmark']} [{result['scale']}{'x' if result['scale'] != 'pdf' else ''}]"
+    if result['status'] == 'ok':
+        print(f"  {label:<62} {result['seconds_min'] * 1000:>10.1f} ms  {result['peak_mb']:>8.1f} MB")
+    elif result['status'] == 'skipped':
+        print(f"  {label:<62} {'skipped':>10}  ({result['reason']})")
+    else:
+        print(f"  {label:<62} {'ERROR':>10}  {result['error']}")
+
+
+# ----------------------------------------------------------------------
+# Results
+# ----------------------------------------------------------------------
+
+def git_commit():
+    """Short hash of HEAD (with '-dirty' for uncommitted changes), or None"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=ROOT,
+                               capture_output=True, text=True, check=True).stdout.strip()
+        return commit + ('-dirty' if dirty else '')
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def save_results(results, repeat, path=None):
+    commit = git_commit()
+    timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+    report = {
+        'commit': commit,
+        'timestamp': timestamp,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': repeat,
+        'results': results
+    }
+    if path is None:
+        RESULTS_DIR.mkdir(exist_ok=True)
+        path = RESULTS_DIR / f"{timestamp}_{commit or 'nogit'}.json"
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    return path
+
+
+def compare(old_path, results, threshold):
+    """
+    Print new/old min-time ratios for benchmarks present in both runs
+
+    Returns the (benchmark, scale, ratio) rows slower than threshold.
+    """
+    with open(old_path, encoding='utf-8') as f:
+        old = json.load(f)
+    previous = {(r['benchmark'], r['scale']): r for r in old['results'] if r['status'] == 'ok'}
+
+    print("\n" + "="*80)
+    print(f"COMPARISON vs {old.get('commit')} ({old.get('timestamp')})")
+    print("="*80)
+
+    regressions = []
+    for r in results:
+        before = previous.get((r['benchmark'], r['scale']))
+        if r['status'] != 'ok' or before is None:
+            continue
+        ratio = r['seconds_min'] / before['seconds_min'] if before['seconds_min'] else float('inf')
+        flag = '  ⚠ slower' if ratio > threshold else ('  ✓ faster' if ratio < 1 / threshold else '')
+        print(f"  {r['benchmark'] + ' [' + str(r['scale']) + ']':<62} "
+              f"{before['seconds_min'] * 1000:>9.1f} -> {r['seconds_min'] * 1000:>9.1f} ms  {ratio:5.2f}x{flag}")
+        if ratio > threshold:
+            regressions.append((r['benchmark'], r['scale'], ratio))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark analyzers on synthetic data")
+    parser.add_argument('--scale', type=int, nargs='+', default=[1, 10], choices=sorted(SCALES))
+    parser.add_argument('--only', nargs='+', default=None,
+                        help="Run benchmarks whose name contains any of these strings")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--no-pdf', action='store_true', help="Skip the PDF parser benchmarks")
+    parser.add_argument('--regenerate', action='store_true', help="Rewrite the synthetic data")
+    parser.add_argument('--output', default=None, help="Results JSON path (default: benchmarks/results/)")
+    parser.add_argument('--compare', default=None, help="Previous results JSON to compare against")
+    parser.add_argument('--threshold', type=float, default=1.2,
+                        help="Slowdown ratio reported as a regression (exit status 1)")
+    parser.add_argument('--list', action='store_true', help="List benchmarks and exit")
+    args = parser.parse_args()
+
+    def selected(names):
+        return [n for n in names if args.only is None or any(s in n for s in args.only)]
+
+    if args.list:
+        for name, (_, max_scale) in BENCHMARKS.items():
+            print(f"{name}{f'  (up to {max_scale}x)' if max_scale else ''}")
+        for name in PDF_BENCHMARKS:
+            print(f"{name}  (repository PDFs)")
+        return 0
+
+    print("="*80)
+    print("BENCHMARKS")
+    print("="*80)
+
+    results = []
+    for scale in args.scale:
+        print(f"\n{scale}x scale")
+        results += run_scale(scale, selected(BENCHMARKS), args.repeat, args.regenerate)
+
+    pdf_names = selected(PDF_BENCHMARKS)
+    if pdf_names and not args.no_pdf:
+        print("\nPDF parsers")
+        results += run_pdf(pdf_names, args.repeat)
+
+    path = save_results(results, args.repeat, args.output)
+    print(f"\n✓ Results saved to {path}")
+
+    if args.compare:
+        regressions = compare(args.compare, results, args.threshold)
+        if regressions:
+            print(f"\n⚠ {len(regressions)} benchmark(s) slower than {args.threshold:.2f}x")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,365 @@
+"""
+Synthetic Election Data for Benchmarks
+
+Writes a self-contained data root with the same files, columns and value
+conventions as texas_election_data/ (pdf_extracts race and
+statewide-by-district CSVs, VTD returns and a VTD assignment table, TEC
+spending), so every analyzer can run against it unchanged from the
+data root as working directory.
+
+Scales multiply the real data's size:
+    1x    150 House / 31 Senate / 38 Congressional districts, 4 cycles
+    10x   5x districts, 8 cycles
+    100x  25x districts, 8 cycles, 2x candidates per race
+
+Cycles before 2018 have no top-of-ticket mapping in the analyzers, so they
+are loaded, classified and joined but drop out of vs_top_ticket results,
+as they would for real data.
+
+Generation is seeded, so a scale's files are identical on every run and
+benchmark results stay comparable across commits.
+
+Usage:
+    python benchmarks/synthetic_data.py --scale 10 --output benchmarks/data/scale_10
+"""
+
+import sys
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# scale -> (district multiplier, cycles, candidate multiplier)
+SCALES = {
+    1: (1, 4, 1),
+    10: (5, 8, 1),
+    100: (25, 8, 2)
+}
+
+BASE_DISTRICTS = {'house': 150, 'senate': 31, 'congressional': 38}
+DISTRICT_OFFICES = {
+    'house': 'State Representative',
+    'senate': 'State Senator',
+    'congressional': 'U.S. Representative'
+}
+VTD_OFFICE_LABELS = {'house': 'State Rep', 'senate': 'State Sen', 'congressional': 'U.S. Rep'}
+TURNOUT = {'house': 60_000, 'senate': 280_000, 'congressional': 240_000}
+
+VTDS_PER_HOUSE_DISTRICT = 40
+VTD_YEAR = 2022
+
+SYLLABLES = ['al', 'ba', 'cor', 'da', 'el', 'fer', 'gar', 'han', 'is', 'jo', 'ka', 'lan',
+             'mor', 'nel', 'or', 'pa', 'quin', 'ros', 'san', 'tal', 'ur', 'var', 'wil', 'zan']
+
+
+def cycles(n):
+    """The n most recent even-year cycles ending in 2024"""
+    return list(range(2024 - 2 * (n - 1), 2025, 2))
+
+
+def statewide_offices(year):
+    """Statewide offices on the ballot (U.S. Senate every cycle, as the senate top ticket)"""
+    if year % 4 == 0:
+        return ['President', 'U.S. Senate']
+    return ['U.S. Senate', 'Governor', 'Lieutenant Governor', 'Attorney General']
+
+
+class SyntheticElections:
+    """Seeded generator of one synthetic data root"""
+
+    def __init__(self, scale=1, seed=0):
+        """
+        Parameters:
+        - scale: 1, 10 or 100 (see SCALES)
+        - seed: Random seed
+        """
+        if scale not in SCALES:
+            raise ValueError(f"scale must be one of {sorted(SCALES)}")
+        self.scale = scale
+        self.rng = np.random.default_rng(seed)
+
+        district_mult, n_cycles, self.candidate_mult = SCALES[scale]
+        self.districts = {level: n * district_mult for level, n in BASE_DISTRICTS.items()}
+        self.years = cycles(n_cycles)
+
+        # District D lean (D two-party share around which every race varies)
+        self.lean = {
+            level: np.clip(self.rng.normal(0.45, 0.15, n), 0.1, 0.9)
+            for level, n in self.districts.items()
+        }
+        # Statewide D environment per cycle
+        self.environment = dict(zip(self.years, self.rng.normal(0.0, 0.03, len(self.years))))
+
+        self._surnames = self._make_surnames(50_000 * self.candidate_mult)
+        self._next_name = 0
+
+        # Statewide candidates are the same on every level's breakdown
+        self.statewide_parties = ['R', 'D', 'L'] + (['G'] if self.candidate_mult > 1 else [])
+        self.statewide_names = {
+            (year, office): [self._surname() for _ in self.statewide_parties]
+            for year in self.years for office in statewide_offices(year)
+        }
+
+    def _make_surnames(self, n):
+        parts = self.rng.integers(0, len(SYLLABLES), size=(n, 3))
+        lengths = self.rng.integers(2, 4, size=n)
+        names = {''.join(SYLLABLES[p] for p in row[:k]).capitalize() for row, k in zip(parts, lengths)}
+        return list(self.rng.permutation(sorted(names)))
+
+    def _surname(self):
+        name = self._surnames[self._next_name % len(self._surnames)]
+        self._next_name += 1
+        return name
+
+    @staticmethod
+    def _percentages(votes):
+        return np.round(votes / votes.sum() * 100, 1)
+
+    def _race(self, d_share, turnout, parties):
+        """Votes and percentages for one race (major parties first)"""
+        minor = self.rng.uniform(0.005, 0.03, len(parties) - 2) if len(parties) > 2 else np.array([])
+        major = 1 - minor.sum()
+        shares = np.concatenate([[major * (1 - d_share), major * d_share], minor])
+        votes = np.maximum((shares * turnout).round().astype(np.int64), 1)
+        return votes, self._percentages(votes)
+
+    # ------------------------------------------------------------------
+    # District races
+    # ------------------------------------------------------------------
+
+    def district_races(self, level):
+        """Races for every district and cycle; incumbents usually run again"""
+        minor_parties = ['L', 'G', 'I', 'W'][:self.candidate_mult * 2 - 1]
+        rows = []
+        incumbents = {}
+
+        for year in self.years:
+            for i in range(self.districts[level]):
+                district = str(i + 1)
+                d_share = np.clip(self.lean[level][i] + self.environment[year] + self.rng.normal(0, 0.04), 0.02, 0.98)
+
+                winner_party = 'D' if d_share > 0.5 else 'R'
+                names = {}
+                if district in incumbents and self.rng.random() < 0.75:
+                    names[winner_party] = incumbents[district]
+
+                # Safe seats often go uncontested
+                uncontested = abs(d_share - 0.5) > 0.2 and self.rng.random() < 0.4
+                if uncontested:
+                    parties = [winner_party]
+                else:
+                    parties = ['R', 'D'] + [p for p in minor_parties if self.rng.random() < 0.4]
+
+                if uncontested:
+                    votes = np.array([int(TURNOUT[level] * self.rng.uniform(0.5, 1.0))])
+                    pcts = np.array([100.0])
+                else:
+                    votes, pcts = self._race(d_share, TURNOUT[level] * self.rng.uniform(0.6, 1.2), parties)
+
+                for party, v, pct in zip(parties, votes, pcts):
+                    name = names.get(party) or self._surname()
+                    rows.append((year, district, DISTRICT_OFFICES[level], name, party, int(v), float(pct)))
+                    if party == winner_party:
+                        incumbents[district] = name
+
+        return pd.DataFrame(rows, columns=['year', 'district', 'office', 'candidate', 'party', 'votes', 'percentage'])
+
+    # ------------------------------------------------------------------
+    # Statewide results by district
+    # ------------------------------------------------------------------
+
+    def statewide_by_district(self, level):
+        """Statewide races broken down by district, with a STATE row per candidate"""
+        frames = []
+        lean = self.lean[level]
+        n = len(lean)
+
+        for year in self.years:
+            for office in statewide_offices(year):
+                parties = self.statewide_parties
+                names = self.statewide_names[(year, office)]
+                office_effect = self.rng.normal(0, 0.02)
+
+                d_share = np.clip(lean + self.environment[year] + office_effect + self.rng.normal(0, 0.01, n), 0.02, 0.98)
+                minor = self.rng.uniform(0.005, 0.02, (n, len(parties) - 2))
+                major = 1 - minor.sum(axis=1)
+                shares = np.column_stack([major * (1 - d_share), major * d_share, minor])
+                turnout = TURNOUT[level] * self.rng.uniform(0.8, 1.3, n)
+                votes = (shares * turnout[:, None]).round().astype(np.int64)
+
+                state_votes = votes.sum(axis=0)
+                all_votes = np.vstack([state_votes, votes])
+                pcts = np.round(all_votes / all_votes.sum(axis=1, keepdims=True) * 100, 1)
+
+                districts = ['STATE'] + [str(i + 1) for i in range(n)]
+                frames.append(pd.DataFrame({
+                    'year': year,
+                    'district': np.repeat(districts, len(parties)),
+                    'office': office,
+                    'candidate': np.tile(names, len(districts)),
+                    'party': np.tile(parties, len(districts)),
+                    'votes': all_votes.ravel(),
+                    'percentage': pcts.ravel()
+                }))
+
+        return pd.concat(frames, ignore_index=True)
+
+    # ------------------------------------------------------------------
+    # VTD returns, assignment table and campaign finance
+    # ------------------------------------------------------------------
+
+    def vtd_returns(self, races, statewide):
+        """
+        VTD-level General_Election_Returns rows for VTD_YEAR
+
+        Each House district is split into VTDS_PER_HOUSE_DISTRICT VTDs;
+        Senate and Congressional districts are contiguous runs of VTDs.
+        Returns (returns frame, House assignment frame).
+        """
+        n_vtds = self.districts['house'] * VTDS_PER_HOUSE_DISTRICT
+        vtds = np.array([f"{48000 + i // 500:05d}{i % 500:04d}" for i in range(n_vtds)])
+        vtd_weight = self.rng.uniform(0.2, 1.8, n_vtds)
+
+        assignment = {
+            level: (np.arange(n_vtds) * self.districts[level] // n_vtds) + 1
+            for level in self.districts
+        }
+
+        frames = []
+        for level, label in VTD_OFFICE_LABELS.items():
+            year_races = races[level][races[level]['year'] == VTD_YEAR]
+            offices = label + ' ' + year_races['district']
+            frames.append(self._split_to_vtds(year_races, offices, assignment[level], vtds, vtd_weight))
+
+        house_statewide = statewide['house']
+        house_statewide = house_statewide[(house_statewide['year'] == VTD_YEAR) &
+                                          (house_statewide['district'] != 'STATE')]
+        offices = house_statewide['office'].replace({
+            'U.S. Senate': 'U.S. Sen', 'Lieutenant Governor': 'Lt. Governor', 'Attorney General': 'Attorney Gen'
+        })
+        frames.append(self._split_to_vtds(house_statewide, offices, assignment['house'], vtds, vtd_weight))
+
+        returns = pd.concat(frames, ignore_index=True)
+        house_assignment = pd.DataFrame({'cntyvtd': vtds, 'district': assignment['house']})
+        return returns, house_assignment
+
+    @staticmethod
+    def _split_to_vtds(district_rows, offices, vtd_district, vtds, vtd_weight):
+        """Spread each district row's votes over that district's (contiguous) VTDs by weight"""
+        n_districts = int(vtd_district.max())
+        starts = np.searchsorted(vtd_district, np.arange(1, n_districts + 2))
+        sizes = np.diff(starts)
+        share = vtd_weight / np.repeat(np.add.reduceat(vtd_weight, starts[:-1]), sizes)
+
+        district = district_rows['district'].astype(int).to_numpy() - 1
+        counts = sizes[district]
+        row = np.repeat(np.arange(len(district_rows)), counts)
+        offset = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        position = starts[district][row] + offset
+
+        return pd.DataFrame({
+            'cntyvtd': vtds[position],
+            'Office': offices.to_numpy()[row],
+            'Name': district_rows['candidate'].to_numpy()[row],
+            'Party': district_rows['party'].to_numpy()[row],
+            'Votes': (district_rows['votes'].to_numpy()[row] * share[position]).round().astype(np.int64)
+        })
+
+    def campaign_finance(self, races):
+        """TEC spending rows for State House and Senate candidates (one filer per candidate)"""
+        rows = []
+        filer_ids = {}
+        for level, office in [('house', 'STATEREP'), ('senate', 'STATESEN')]:
+            df = races[level]
+            df = df[df['party'].isin(['D', 'R']) & (df['year'] >= 2018)]
+            for r in df.itertuples(index=False):
+                key = (level, r.district, r.candidate)
+                filer = filer_ids.setdefault(key, 100000 + len(filer_ids))
+                district = f"HD {r.district}" if level == 'house' else f"SD{r.district}"
+                rows.append((filer, f"{r.candidate}, {self._surname()}", office, district,
+                             float(r.year), float(self.rng.integers(10_000, 2_000_000)),
+                             int(self.rng.integers(1, 12))))
+        return pd.DataFrame(rows, columns=['filer_id', 'candidate_name', 'office', 'district',
+                                           'year', 'total_expenditures', 'num_reports'])
+
+    # ------------------------------------------------------------------
+    # Write
+    # ------------------------------------------------------------------
+
+    def write(self, root):
+        """Write every file under root; returns dict of file -> row count"""
+        root = Path(root)
+        extracts = root / 'texas_election_data' / 'pdf_extracts'
+        vtd_dir = root / 'texas_election_data' / 'vtd_data'
+        finance_dir = root / 'texas_election_data' / 'campaign_finance'
+        for path in [extracts, vtd_dir / f'{VTD_YEAR}_data', vtd_dir / 'assignments', finance_dir]:
+            path.mkdir(parents=True, exist_ok=True)
+
+        races = {level: self.district_races(level) for level in self.districts}
+        statewide = {level: self.statewide_by_district(level) for level in self.districts}
+
+        files = {}
+
+        def save(df, path):
+            df.to_csv(path, index=False)
+            files[str(path.relative_to(root))] = len(df)
+
+        for level in ['house', 'senate']:
+            df = races[level]
+            save(df[df['year'] < 2024], extracts / f'2018_2022_{level}_races.csv')
+            save(df[df['year'] == 2024], extracts / f'2024_{level}_races.csv')
+        save(races['congressional'], extracts / '2018_2024_congressional_races.csv')
+
+        # Preferred (_CORRECT) and fallback statewide files hold the same rows
+        save(statewide['house'], extracts / '2018_2024_house_results_combined_CORRECT.csv')
+        save(statewide['house'], extracts / '2018_2024_house_district_results_all.csv')
+        for level in ['senate', 'congressional']:
+            save(statewide[level], extracts / f'2018_2024_{level}_results_combined_CORRECT.csv')
+            save(statewide[level], extracts / f'2018_2024_{level}_results_combined.csv')
+
+        returns, assignment = self.vtd_returns(races, statewide)
+        save(returns, vtd_dir / f'{VTD_YEAR}_data' / f'{VTD_YEAR}_General_Election_Returns.csv')
+        save(assignment, vtd_dir / 'assignments' / 'PLANH2316.csv')
+
+        save(self.campaign_finance(races), finance_dir / 'candidate_spending_2018_2024.csv')
+
+        return files
+
+
+def generate(root, scale=1, seed=0, force=False):
+    """
+    Write a synthetic data root unless one for this scale and seed exists
+
+    Returns the root as a Path.
+    """
+    root = Path(root)
+    marker = root / '.synthetic'
+    stamp = f"scale={scale} seed={seed}"
+    if not force and marker.exists() and marker.read_text() == stamp:
+        return root
+
+    print(f"Generating {scale}x synthetic data in {root}...")
+    files = SyntheticElections(scale, seed).write(root)
+    for path, rows in files.items():
+        print(f"  {rows:>10,} rows  {path}")
+    marker.write_text(stamp)
+    return root
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a synthetic election data root")
+    parser.add_argument('--scale', type=int, default=1, choices=sorted(SCALES))
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default=None, help="Data root (default: benchmarks/data/scale_N)")
+    args = parser.parse_args()
+
+    output = args.output or Path(__file__).parent / 'data' / f'scale_{args.scale}'
+    generate(output, args.scale, args.seed, force=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,31 @@
 """
 Texas Election Data Coverage Analysis
 Generates a comprehensive report of available election data for modeling
+
+By default CSV/TSV files are scanned without loading them into pandas:
+- the header line is sniffed for the delimiter and column names
+- rows are counted by scanning the file in 1 MB blocks for newlines
+- years and offices come from a reservoir sample of rows kept during the
+  same pass (exact for files with fewer rows than the sample size)
+- files are scanned concurrently in a thread pool
+- results are cached per file content hash in
+  texas_election_data/.coverage_cache.json, so unchanged files are not
+  read again (size + mtime are checked first to skip the hash)
+
+Use --full for the original pandas read of every file (exact years and
+offices, and rows counted as parsed records even with quoted newlines).
+Excel files are always read with pandas.
 """
 
 import pandas as pd
+import argparse
+import csv
+import hashlib
+import json
+import math
 import os
+import random
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import sys
 
@@ -12,22 +33,49 @@ import sys
 if sys.platform == 'win32':
     sys.stdout.reconfigure(encoding='utf-8')
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'analysis_tools'))
+from instrumentation import log, stage
+
+# Rows kept per file for year/office detection in fast mode
+SAMPLE_SIZE = 10000
+
+# Bytes read per block in fast mode
+BLOCK_SIZE = 1 << 20
+
+CACHE_FILE = '.coverage_cache.json'
+
+# Bump when the fast-mode metadata changes so cached entries are rescanned
+CACHE_VERSION = 1
+
+
 class DataCoverageAnalyzer:
-    def __init__(self, base_dir="texas_election_data"):
+    def __init__(self, base_dir="texas_election_data", fast=True, workers=None,
+                 use_cache=True, sample_size=SAMPLE_SIZE):
+        """
+        Parameters:
+        - base_dir: Data directory (clean/ and raw/ are scanned too)
+        - fast: Sniff/scan CSV and TSV files instead of loading them with pandas
+        - workers: Files scanned at once (default: CPU count + 4, capped at 16)
+        - use_cache: Reuse fast-mode results for files whose content is unchanged
+        - sample_size: Rows sampled per file for years and offices (fast mode)
+        """
         self.base_dir = base_dir
         self.clean_dir = os.path.join(base_dir, "clean")
         self.raw_dir = os.path.join(base_dir, "raw")
-
-    def analyze_file(self, filepath):
-        """Analyze a single data file and return metadata"""
+        self.fast = fast
+        self.workers = workers or min(16, (os.cpu_count() or 1) + 4)
+        self.use_cache = use_cache and fast
+        self.sample_size = sample_size
+        self.cache_path = os.path.join(base_dir, CACHE_FILE)
+        self.cache = self._load_cache() if self.use_cache else {'by_path': {}, 'by_hash': {}}
+
+    def _new_result(self, filepath):
         filename = os.path.basename(filepath)
-        ext = os.path.splitext(filename)[1].lower()
-
-        result = {
+        return {
             'filename': filename,
             'path': filepath,
             'size_kb': os.path.getsize(filepath) / 1024,
-            'type': ext,
+            'type': os.path.splitext(filename)[1].lower(),
             'rows': 0,
             'columns': 0,
             'column_names': [],
@@ -37,6 +85,11 @@ class DataCoverageAnalyzer:
             'issues': []
         }
 
+    def analyze_file(self, filepath):
+        """Analyze a single data file and return metadata"""
+        result = self._new_result(filepath)
+        ext = result['type']
+
         try:
             # Try to load as DataFrame
             if ext == '.csv':
@@ -90,6 +143,137 @@ class DataCoverageAnalyzer:
 
         return result
 
+    def analyze_file_fast(self, filepath):
+        """
+        Same metadata as analyze_file() for CSV/TSV files, without loading them
+
+        Reads the header line for the delimiter and column names, then one
+        pass over the rest in BLOCK_SIZE blocks counts non-blank lines and
+        keeps a reservoir sample of self.sample_size of them; years and
+        offices are taken from the sample. Other file types go through
+        analyze_file().
+        """
+        result = self._new_result(filepath)
+        ext = result['type']
+        if ext not in ('.csv', '.tsv'):
+            return self.analyze_file(filepath)
+
+        try:
+            with open(filepath, 'rb') as f:
+                first_line = f.readline()
+                if first_line.strip().startswith(b'<!'):
+                    result['issues'].append('File is HTML, not CSV')
+                    return result
+
+                header = first_line.decode('utf-8-sig', errors='ignore').rstrip('\r\n')
+                if not header.strip():
+                    result['issues'].append('Error reading file: No columns to parse from file')
+                    return result
+                delimiter = '\t' if ext == '.tsv' else sniff_delimiter(header)
+                columns = next(csv.reader([header], delimiter=delimiter))
+                rows, sample = reservoir_scan(f, self.sample_size)
+
+            result['rows'] = rows
+            result['columns'] = len(columns)
+            result['column_names'] = columns
+            result['sampled_rows'] = len(sample)
+            result['usable'] = True
+
+            lines = [line.decode('utf-8', errors='ignore').rstrip('\r') for line in sample]
+            records = list(csv.reader(lines, delimiter=delimiter))
+
+            year_col = find_column(columns, 'year')
+            if year_col is not None:
+                years = set()
+                for value in column_values(records, year_col):
+                    try:
+                        years.add(int(float(value)))
+                    except ValueError:
+                        continue
+                result['years_covered'] = sorted(years)
+
+            office_col = find_column(columns, 'office')
+            if office_col is not None:
+                offices = dict.fromkeys(column_values(records, office_col))
+                result['offices'] = list(offices)[:20]  # Limit to first 20
+
+            if result['rows'] == 0:
+                result['issues'].append('File is empty')
+                result['usable'] = False
+            elif result['rows'] < 10:
+                result['issues'].append(f'Very few rows ({result["rows"]})')
+
+        except Exception as e:
+            result['issues'].append(f'Error reading file: {str(e)}')
+            result['usable'] = False
+
+        return result
+
+    # ------------------------------------------------------------------
+    # Cache (fast mode): path -> [size, mtime_ns, sha256], sha256 -> metadata
+    # ------------------------------------------------------------------
+
+    def _load_cache(self):
+        empty = {'version': CACHE_VERSION, 'sample_size': self.sample_size, 'by_path': {}, 'by_hash': {}}
+        try:
+            with open(self.cache_path, encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return empty
+        if cache.get('version') != CACHE_VERSION or cache.get('sample_size') != self.sample_size:
+            return empty
+        return cache
+
+    def _save_cache(self, entries):
+        """Keep only the files just scanned, then write the cache atomically"""
+        by_path = {path: entry for path, entry, _ in entries}
+        by_hash = dict(self.cache['by_hash'])
+        for _, entry, metadata in entries:
+            if metadata is not None:
+                by_hash[entry[2]] = metadata
+        live = {entry[2] for entry in by_path.values()}
+        self.cache = {
+            'version': CACHE_VERSION,
+            'sample_size': self.sample_size,
+            'by_path': by_path,
+            'by_hash': {h: m for h, m in by_hash.items() if h in live}
+        }
+        tmp = self.cache_path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.cache, f)
+        os.replace(tmp, self.cache_path)
+
+    def _analyze(self, filepath):
+        """
+        Analyze one file, consulting the cache in fast mode
+
+        Returns (result, cached, cache_entry) where cache_entry is
+        (path, [size, mtime_ns, sha256], metadata to store or None).
+        """
+        if not self.fast:
+            return self.analyze_file(filepath), False, None
+        if not self.use_cache:
+            return self.analyze_file_fast(filepath), False, None
+
+        stat = os.stat(filepath)
+        known = self.cache['by_path'].get(filepath)
+        if known and known[:2] == [stat.st_size, stat.st_mtime_ns]:
+            digest = known[2]
+        else:
+            digest = sha256_file(filepath)
+        entry = [stat.st_size, stat.st_mtime_ns, digest]
+
+        metadata = self.cache['by_hash'].get(digest)
+        if metadata is not None:
+            result = dict(self._new_result(filepath), **metadata)
+            return result, True, (filepath, entry, None)
+
+        result = self.analyze_file_fast(filepath)
+        # Read errors may be environmental (e.g. a missing Excel engine); rescan next time
+        cacheable = not any(issue.startswith('Error reading file') for issue in result['issues'])
+        metadata = {k: v for k, v in result.items() if k not in ('filename', 'path', 'size_kb')}
+        return result, False, (filepath, entry, metadata if cacheable else None)
+
     def scan_directory(self):
         """Scan all data directories and analyze files"""
         all_files = []
@@ -117,12 +301,19 @@ class DataCoverageAnalyzer:
 
         print(f"Found {len(all_files)} data files to analyze...\n")
 
+        with stage('parse', 'DataCoverageAnalyzer', rows=len(all_files),
+                   fast=self.fast, workers=self.workers):
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                scanned = list(pool.map(self._analyze, all_files))
+
         results = []
-        for filepath in all_files:
-            print(f"Analyzing: {os.path.basename(filepath)}...")
-            result = self.analyze_file(filepath)
+        for result, cached, _ in scanned:
+            log(f"Analyzing: {result['filename']}..." + (" (cached)" if cached else ""))
             results.append(result)
 
+        if self.use_cache:
+            self._save_cache([entry for _, _, entry in scanned])
+
         return results
 
     def generate_report(self, results):
@@ -168,6 +359,8 @@ class DataCoverageAnalyzer:
 
             if r['years_covered']:
                 print(f"   Years: {', '.join(map(str, sorted(r['years_covered'])))}")
+            if r.get('sampled_rows', r['rows']) < r['rows']:
+                print(f"   (years and offices from a sample of {r['sampled_rows']:,} rows)")
 
             if r['offices']:
                 offices_display = r['offices'][:5]  # Show first 5
@@ -291,8 +484,106 @@ class DataCoverageAnalyzer:
 
         return usable, non_usable
 
-def main():
-    analyzer = DataCoverageAnalyzer()
+def sha256_file(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def sniff_delimiter(header):
+    """Delimiter of a header line (comma unless the sniffer finds another)"""
+    try:
+        return csv.Sniffer().sniff(header, delimiters=',\t;|').delimiter
+    except csv.Error:
+        return ','
+
+
+def find_column(columns, name):
+    """Index of the column called name, else of the first containing it (case-insensitive)"""
+    if name in columns:
+        return columns.index(name)
+    for i, col in enumerate(columns):
+        if name in str(col).lower():
+            return i
+    return None
+
+
+def column_values(records, index):
+    """Non-empty values of one column across parsed records"""
+    return [r[index].strip() for r in records if len(r) > index and r[index].strip()]
+
+
+def reservoir_scan(f, k, block_size=BLOCK_SIZE, seed=0):
+    """
+    Count the non-blank lines of a binary stream and sample k of them
+
+    One pass in block_size blocks; lines are sampled with Algorithm L
+    (geometric skips, so the cost of sampling does not grow with the file).
+    The seed is fixed so a file always yields the same sample.
+
+    Returns (line count, sampled lines in file order).
+    """
+    rng = random.Random(seed)
+
+    def uniform():
+        return rng.random() or 1e-300
+
+    reservoir = []               # (line index, line)
+    w = math.exp(math.log(uniform()) / k) if k else 0.0
+    next_index = None            # next line index to put into a full reservoir
+    count = 0
+    carry = b''
+
+    def take(lines):
+        nonlocal w, next_index, count
+        lines = [line for line in lines if line.strip()]
+        start = count
+        count += len(lines)
+
+        if k == 0:
+            return
+        fill = min(len(lines), k - len(reservoir))
+        reservoir.extend((start + i, lines[i]) for i in range(max(fill, 0)))
+        if len(reservoir) < k:
+            return
+
+        if next_index is None:
+            next_index = k + int(math.log(uniform()) / math.log1p(-min(w, 1 - 1e-12)))
+        while next_index < count:
+            reservoir[rng.randrange(k)] = (next_index, lines[next_index - start])
+            w *= math.exp(math.log(uniform()) / k)
+            next_index += 1 + int(math.log(uniform()) / math.log1p(-min(w, 1 - 1e-12)))
+
+    while True:
+        block = f.read(block_size)
+        if not block:
+            break
+        lines = (carry + block).split(b'\n')
+        carry = lines.pop()
+        take(lines)
+    if carry:
+        take([carry])
+
+    return count, [line for _, line in sorted(reservoir)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report which election data files are usable for modeling")
+    parser.add_argument('--base-dir', default="texas_election_data")
+    parser.add_argument('--full', action='store_true',
+                        help="Load every file with pandas (exact years/offices; slow on precinct files)")
+    parser.add_argument('--workers', type=int, default=None, help="Files scanned at once")
+    parser.add_argument('--no-cache', action='store_true', help="Rescan files even if unchanged")
+    parser.add_argument('--sample-size', type=int, default=SAMPLE_SIZE,
+                        help="Rows sampled per file for years and offices")
+    args = parser.parse_args(argv)
+
+    analyzer = DataCoverageAnalyzer(
+        args.base_dir, fast=not args.full, workers=args.workers,
+        use_cache=not args.no_cache, sample_size=args.sample_size
+    )
     results = analyzer.scan_directory()
     usable, non_usable = analyzer.generate_report(results)
 
@@ -12,6 +12,9 @@ import pdfplumber
 import re
 import os
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'analysis_tools'))
+from instrumentation import instrumented
+
 def clean_value(value):
     """Clean and normalize cell values"""
     if value is None:
@@ -59,6 +62,7 @@ def extract_candidate_data(cell_text):
 
     return cell_text, None
 
+@instrumented('parse')
 def parse_2020_pdf(pdf_path):
     """Parse 2020 election PDF (Presidential, US Senate, RR Commissioner)"""
 
@@ -176,6 +180,7 @@ def parse_2020_pdf(pdf_path):
     print(f"  Extracted {len(results)} records")
     return results
 
+@instrumented('parse')
 def parse_2022_pdf(pdf_path):
     """Parse 2022 election PDF (Governor, Lt Gov, Attorney General, etc.)"""
 
@@ -277,6 +282,7 @@ def parse_2022_pdf(pdf_path):
     print(f"  Extracted {len(results)} records")
     return results
 
+@instrumented('parse')
 def parse_2024_pdf(pdf_path):
     """Parse 2024 election PDF (Presidential, US Senate)"""
 
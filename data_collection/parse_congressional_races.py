@@ -10,8 +10,13 @@ if sys.platform == 'win32':
 
 import pandas as pd
 import re
+import os
 from pathlib import Path
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'analysis_tools'))
+from instrumentation import instrumented, stage
+
+@instrumented('aggregate', args=('year',))
 def extract_congressional_races_from_vtd(csv_path, year):
     """
     Extract U.S. House races from VTD data
@@ -26,7 +31,9 @@ def extract_congressional_races_from_vtd(csv_path, year):
     print(f"Processing {year} General Election...")
 
     # Read VTD data
-    df = pd.read_csv(csv_path)
+    with stage('load', 'vtd_returns', year=year) as s:
+        df = pd.read_csv(csv_path)
+        s.rows = len(df)
 
     # Filter to U.S. Rep races
     # Office format: "U.S. Rep 30", "U.S. Rep 1", etc.
@@ -13,8 +13,12 @@ if sys.platform == 'win32':
 import pdfplumber
 import pandas as pd
 import re
+import os
 from pathlib import Path
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'analysis_tools'))
+from instrumentation import instrumented, log, warn
+
 def extract_district_races(pdf_path, district_type):
     """
     Extract district race results from Red-226 PDF
@@ -116,6 +120,7 @@ def extract_district_races(pdf_path, district_type):
 
     return results
 
+@instrumented('parse')
 def parse_all_house_districts():
     """Parse all State House district races"""
     print("Parsing State House District Races...")
@@ -131,7 +136,7 @@ def parse_all_house_districts():
         pdf_path = house_dir / f"house_dist_{i:03d}_2024.pdf"
 
         if not pdf_path.exists():
-            print(f"✗ District {i}: File not found")
+            warn(f"✗ District {i}: File not found")
             failed_count += 1
             continue
 
@@ -141,19 +146,20 @@ def parse_all_house_districts():
             if len(results) > 0:
                 all_results.extend(results)
                 candidates = ', '.join([f"{r['candidate']} ({r['party']})" for r in results])
-                print(f"✓ District {i:3d}: {candidates}")
+                log(f"✓ District {i:3d}: {candidates}")
                 success_count += 1
             else:
-                print(f"○ District {i:3d}: No contested race (unopposed or vacant)")
+                log(f"○ District {i:3d}: No contested race (unopposed or vacant)")
                 unopposed_count += 1
         except Exception as e:
-            print(f"✗ District {i}: Error - {str(e)}")
+            warn(f"✗ District {i}: Error - {str(e)}")
             failed_count += 1
 
     print(f"\nSummary: {success_count} contested, {unopposed_count} unopposed/vacant, {failed_count} failed")
 
     return pd.DataFrame(all_results)
 
+@instrumented('parse')
 def parse_all_senate_districts():
     """Parse all State Senate district races"""
     print("Parsing State Senate District Races...")
@@ -169,7 +175,7 @@ def parse_all_senate_districts():
         pdf_path = senate_dir / f"senate_dist_{i:02d}_2024.pdf"
 
         if not pdf_path.exists():
-            print(f"✗ District {i}: File not found")
+            warn(f"✗ District {i}: File not found")
             failed_count += 1
             continue
 
@@ -179,13 +185,13 @@ def parse_all_senate_districts():
             if len(results) > 0:
                 all_results.extend(results)
                 candidates = ', '.join([f"{r['candidate']} ({r['party']})" for r in results])
-                print(f"✓ District {i:2d}: {candidates}")
+                log(f"✓ District {i:2d}: {candidates}")
                 success_count += 1
             else:
-                print(f"○ District {i:2d}: No contested race (unopposed or vacant)")
+                log(f"○ District {i:2d}: No contested race (unopposed or vacant)")
                 unopposed_count += 1
         except Exception as e:
-            print(f"✗ District {i}: Error - {str(e)}")
+            warn(f"✗ District {i}: Error - {str(e)}")
             failed_count += 1
 
     print(f"\nSummary: {success_count} contested, {unopposed_count} unopposed/vacant, {failed_count} failed")
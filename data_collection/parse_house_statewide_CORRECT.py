@@ -15,6 +15,10 @@ import pdfplumber
 import re
 import os
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'analysis_tools'))
+from instrumentation import instrumented, log, warn
+
+@instrumented('parse', args=('year', 'plan'))
 def parse_house_pdf_generic(pdf_path, year, plan):
     """
     Parse State House statewide results from Red-206 PDF
@@ -35,7 +39,7 @@ def parse_house_pdf_generic(pdf_path, year, plan):
             if 'U.S. SEN' not in text and 'PRESIDENT' not in text and 'GOVERNOR' not in text:
                 continue
 
-            print(f"  Found statewide races on page {page_num + 1}")
+            log(f"  Found statewide races on page {page_num + 1}")
 
             # Extract header from text
             lines = text.split('\n')
@@ -71,15 +75,15 @@ def parse_house_pdf_generic(pdf_path, year, plan):
                         columns.append({'candidate': candidate, 'party': party})
 
             if not columns:
-                print(f"  Warning: Could not parse candidates from header")
+                warn(f"  Warning: Could not parse candidates from header (page {page_num + 1})")
                 continue
 
-            print(f"  Parsed {len(columns)} candidates from header")
+            log(f"  Parsed {len(columns)} candidates from header")
 
             # Extract table
             table = page.extract_table()
             if not table:
-                print(f"  Warning: Could not extract table")
+                warn(f"  Warning: Could not extract table (page {page_num + 1})")
                 continue
 
             # Determine offices by grouping candidates sequentially
@@ -203,7 +207,7 @@ def main():
 
     for file_info in files_to_parse:
         if not os.path.exists(file_info['path']):
-            print(f"\n⚠ Warning: File not found: {file_info['path']}")
+            warn(f"\n⚠ Warning: File not found: {file_info['path']}")
             continue
 
         results = parse_house_pdf_generic(file_info['path'], file_info['year'], file_info['plan'])
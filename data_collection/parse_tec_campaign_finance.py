@@ -14,7 +14,11 @@ if sys.platform == 'win32':
 import pandas as pd
 import os
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'analysis_tools'))
+from instrumentation import instrumented
 
+
+@instrumented('load', 'tec_campaign_finance')
 def parse_tec_cover_data():
     """
     Parse TEC cover sheet data to get campaign finance totals
@@ -83,6 +87,7 @@ def parse_tec_cover_data():
     return df
 
 
+@instrumented('aggregate', 'tec_campaign_finance')
 def aggregate_spending_by_candidate(df):
     """
     Aggregate total spending by candidate for each election cycle
@@ -0,0 +1,739 @@
+"""
+Data Collection Pipeline
+
+Declarative description of the data_collection scripts: every stage lists
+the files it reads and writes, and dependencies between stages follow
+from those paths. The executor:
+- hashes each stage's inputs (cached by file size and mtime) together with
+  its script, and skips stages whose inputs did not change since their
+  last successful run and whose outputs still exist
+- runs independent stages concurrently (e.g. the house, senate and
+  congressional statewide parsers), each in its own process with output
+  captured to texas_election_data/pipeline/logs/<stage>.log
+- validates the datasets a stage wrote (validate_data.py) as soon as it
+  finishes; --strict turns validation errors into a failed stage
+- writes a run manifest (stage status, reason, time, input and output
+  hashes, validation counts) to texas_election_data/pipeline/runs/
+
+Download stages need the network and only run with --download; without
+it, their outputs are treated as source files. A stage whose required
+inputs are missing is reported as blocked; stages after it still run when
+their own inputs exist (e.g. VTD returns placed by hand).
+
+Not part of the pipeline: collect_texas_elections.py,
+scrape_recent_elections.py and extract_pdf_election_data.py (older
+sources superseded by the Capitol Data Portal PDFs and VTD returns).
+
+Usage:
+    python data_collection/pipeline.py                      # rebuild whatever is stale
+    python data_collection/pipeline.py materialize-senate   # one stage and what it needs
+    python data_collection/pipeline.py --dry-run            # show what would run
+    python data_collection/pipeline.py --download --jobs 4
+    python data_collection/pipeline.py --list
+"""
+
+import sys
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+import argparse
+import datetime
+import fnmatch
+import glob
+import hashlib
+import json
+import os
+import subprocess
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'analysis_tools'))
+
+from fact_paths import (
+    FACT_DIR, FACT_TABLE_VERSION, PDF_EXTRACTS, RACE_FILES, STATEWIDE_CANDIDATES, STATEWIDE_FILES
+)
+import instrumentation
+import validate_data
+
+VTD_DIR = 'texas_election_data/vtd_data'
+DISTRICT_RACES = 'texas_election_data/district_races'
+
+PIPELINE_DIR = 'texas_election_data/pipeline'
+VALIDATION_REPORT = f'{PIPELINE_DIR}/validation/all_datasets.json'
+
+# Bump when the up-to-date rule changes so every stage reruns once
+PIPELINE_VERSION = 1
+
+# Election year -> VTD returns file, and the portal zip it is extracted from
+VTD_RETURNS = {
+    2018: f'{VTD_DIR}/2020_data/2018_General_Election_Returns.csv',
+    2020: f'{VTD_DIR}/2020_data/2020_General_Election_Returns.csv',
+    2022: f'{VTD_DIR}/2022_data/2022_General_Election_Returns.csv',
+    2024: f'{VTD_DIR}/2024_data/2024_General_Election_Returns.csv'
+}
+VTD_ZIPS = {
+    2018: f'{VTD_DIR}/2020-general-vtd-election-data-2020.zip',
+    2020: f'{VTD_DIR}/2020-general-vtd-election-data-2020.zip',
+    2022: f'{VTD_DIR}/2022-general-vtds-election-data.zip',
+    2024: f'{VTD_DIR}/2024-general-vtds-election-data.zip'
+}
+
+CORRECT = STATEWIDE_FILES
+
+LEVELS = ['house', 'senate', 'congressional']
+
+
+# Stage name -> spec:
+# - kind: download, extract, parse, aggregate, import, verify, materialize or report
+# - script: data_collection script run as `python data_collection/<script>`;
+#   stages without one run a function from WORKERS in a subprocess
+# - args: Extra command-line arguments for the script
+# - inputs: Required paths/globs (each must match at least one file)
+# - optional: Paths/globs read when present (hashed, never required)
+# - outputs: Paths/globs the stage writes (each must exist after a run)
+# - version: Extra value folded into the stage hash
+STAGES = {
+    # Downloads (network; only with --download)
+    'download-district-races-2024': {
+        'kind': 'download',
+        'script': 'download_district_races_2024.py',
+        'inputs': [],
+        'outputs': [f'{DISTRICT_RACES}/house_2024/house_dist_*_2024.pdf',
+                    f'{DISTRICT_RACES}/senate_2024/senate_dist_*_2024.pdf']
+    },
+    'download-senate-pdfs': {
+        'kind': 'download',
+        'script': 'download_senate_pdfs_confirmed.py',
+        'inputs': [],
+        'outputs': [f'{PDF_EXTRACTS}/{year}_senate_s2168.pdf' for year in (2018, 2020, 2022, 2024)]
+    },
+    'download-vtd-datasets': {
+        'kind': 'download',
+        'script': 'download_vtd_datasets.py',
+        'inputs': [],
+        'outputs': sorted(set(VTD_ZIPS.values()))
+    },
+    'extract-vtd-returns': {
+        'kind': 'extract',
+        'inputs': sorted(set(VTD_ZIPS.values())),
+        'outputs': list(VTD_RETURNS.values())
+    },
+
+    # PDF parsers
+    'parse-district-races-2024': {
+        'kind': 'parse',
+        'script': 'parse_district_races_2024.py',
+        'inputs': [f'{DISTRICT_RACES}/house_2024/house_dist_*_2024.pdf',
+                   f'{DISTRICT_RACES}/senate_2024/senate_dist_*_2024.pdf'],
+        'outputs': [f'{PDF_EXTRACTS}/2024_house_races.csv', f'{PDF_EXTRACTS}/2024_senate_races.csv']
+    },
+    'parse-house-statewide': {
+        'kind': 'parse',
+        'script': 'parse_house_statewide_CORRECT.py',
+        'inputs': [f'{PDF_EXTRACTS}/{year}_planh2316.pdf' for year in (2018, 2020, 2022, 2024)],
+        'outputs': [CORRECT['house']]
+    },
+    'parse-senate-statewide': {
+        'kind': 'parse',
+        'script': 'parse_senate_districts_CORRECT.py',
+        'inputs': [f'{PDF_EXTRACTS}/2018_senate_PLANS172_r206.pdf',
+                   f'{PDF_EXTRACTS}/2020_senate_PLANS172_r206.pdf',
+                   f'{PDF_EXTRACTS}/2022_senate_PLANS2168_r206_CORRECT.pdf',
+                   f'{PDF_EXTRACTS}/2024_senate_PLANS2168_r206_CORRECT.pdf'],
+        'outputs': [CORRECT['senate']]
+    },
+    'parse-congressional-statewide': {
+        'kind': 'parse',
+        'script': 'parse_congressional_statewide_CORRECT.py',
+        'inputs': [f'{PDF_EXTRACTS}/2018_congressional_PLANC2100_r206.pdf',
+                   f'{PDF_EXTRACTS}/2020_congressional_PLANC2100_r206.pdf',
+                   f'{PDF_EXTRACTS}/2022_congressional_PLANC2193_r206.pdf',
+                   f'{PDF_EXTRACTS}/2024_congressional_PLANC2193_r206.pdf'],
+        'outputs': [CORRECT['congressional']]
+    },
+    'parse-house-legacy': {
+        'kind': 'parse',
+        'script': 'parse_all_years.py',
+        'inputs': [f'{PDF_EXTRACTS}/2020_planh2316.pdf',
+                   f'{PDF_EXTRACTS}/2022_planh2176_full.pdf',
+                   f'{PDF_EXTRACTS}/2024_planh2176_full.pdf'],
+        'outputs': [f'{PDF_EXTRACTS}/{year}_house_district_results.csv' for year in (2020, 2022, 2024)] +
+                   [f'{PDF_EXTRACTS}/2020_2024_house_district_results_combined.csv']
+    },
+
+    # VTD aggregation
+    'aggregate-vtd-district-races': {
+        'kind': 'aggregate',
+        'script': 'parse_vtd_district_races.py',
+        'inputs': [VTD_RETURNS[year] for year in (2018, 2020, 2022)],
+        'outputs': [f'{PDF_EXTRACTS}/2018_2022_house_races.csv', f'{PDF_EXTRACTS}/2018_2022_senate_races.csv']
+    },
+    'aggregate-vtd-congressional-races': {
+        'kind': 'aggregate',
+        'script': 'parse_congressional_races.py',
+        'inputs': list(VTD_RETURNS.values()),
+        'outputs': [f'{PDF_EXTRACTS}/2018_2024_congressional_races.csv']
+    },
+    'aggregate-vtd-crosswalk': {
+        'kind': 'aggregate',
+        'script': 'vtd_crosswalk.py',
+        'inputs': [f'{VTD_DIR}/assignments/PLAN*.csv'],
+        'optional': list(VTD_RETURNS.values()) + list(CORRECT.values()),
+        'outputs': [f'{PDF_EXTRACTS}/2018_2024_statewide_by_plan_vtd.csv']
+    },
+
+    # Imports
+    'import-daily-kos': {
+        'kind': 'import',
+        'script': 'import_daily_kos_congressional.py',
+        'inputs': [f'{PDF_EXTRACTS}/daily_kos_2020_2024_presidential_by_cd.csv'],
+        'outputs': [f'{PDF_EXTRACTS}/2020_2024_congressional_presidential_dailykos.csv']
+    },
+    'parse-campaign-finance': {
+        'kind': 'import',
+        'script': 'parse_tec_campaign_finance.py',
+        'inputs': ['texas_election_data/campaign_finance/cover.csv'],
+        'outputs': ['texas_election_data/campaign_finance/candidate_spending_2018_2024.csv']
+    },
+
+    # Whole-tree validation report (see validate_data.py)
+    'validate': {
+        'kind': 'verify',
+        'script': 'validate_data.py',
+        'args': ['--json', VALIDATION_REPORT],
+        'inputs': [],
+        'optional': sorted({path for spec in validate_data.DATASETS.values() for path in spec['files']}),
+        'outputs': [VALIDATION_REPORT]
+    },
+
+    # Fact tables (see analysis_tools/fact_tables.py)
+    **{
+        f'materialize-{level}': {
+            'kind': 'materialize',
+            'inputs': list(RACE_FILES[level]),
+            'optional': list(STATEWIDE_CANDIDATES[level]),
+            'outputs': [f'{FACT_DIR.as_posix()}/{level}_facts_*.parquet'],
+            'version': FACT_TABLE_VERSION
+        }
+        for level in LEVELS
+    },
+
+    'coverage-report': {
+        'kind': 'report',
+        'script': 'analyze_data_coverage.py',
+        'inputs': [],
+        'optional': ['texas_election_data/*.csv', 'texas_election_data/clean/*', 'texas_election_data/raw/*'],
+        'outputs': ['texas_election_data/DATA_COVERAGE_REPORT.txt']
+    }
+}
+
+
+# ----------------------------------------------------------------------
+# Stages without a script (run in a subprocess via --worker)
+# ----------------------------------------------------------------------
+
+def extract_vtd_returns():
+    """Unzip each year's General_Election_Returns.csv from the portal zips"""
+    for year, target in VTD_RETURNS.items():
+        zip_path = VTD_ZIPS[year]
+        if not os.path.exists(zip_path):
+            print(f"  ⚠ {zip_path} not found; {year} returns not extracted")
+            continue
+
+        wanted = os.path.basename(target)
+        with zipfile.ZipFile(zip_path) as archive:
+            members = [m for m in archive.namelist() if os.path.basename(m) == wanted]
+            if not members:
+                print(f"  ⚠ {wanted} not in {zip_path}")
+                continue
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with archive.open(members[0]) as src, open(target, 'wb') as dst:
+                while True:
+                    chunk = src.read(1 << 20)
+                    if not chunk:
+                        break
+                    dst.write(chunk)
+        print(f"  ✓ {members[0]} -> {target}")
+
+
+def materialize_level(level):
+    import fact_tables
+    fact_tables.materialize(level)
+
+
+WORKERS = {
+    'extract-vtd-returns': extract_vtd_returns,
+    **{f'materialize-{level}': (lambda level=level: materialize_level(level)) for level in LEVELS}
+}
+
+
+# ----------------------------------------------------------------------
+# Hashing
+# ----------------------------------------------------------------------
+
+def sha256_file(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class FileHashes:
+    """Content hashes cached by (size, mtime) so unchanged files are not re-read"""
+
+    def __init__(self, cache=None):
+        self.cache = cache or {}
+
+    def __call__(self, path):
+        stat = os.stat(path)
+        key = [stat.st_size, stat.st_mtime_ns]
+        cached = self.cache.get(path)
+        if cached and cached[:2] == key:
+            return cached[2]
+        value = sha256_file(path)
+        self.cache[path] = key + [value]
+        return value
+
+
+def _patterns_overlap(a, b):
+    """True if two path patterns can name the same file"""
+    return a == b or fnmatch.fnmatchcase(a, b) or fnmatch.fnmatchcase(b, a)
+
+
+# ----------------------------------------------------------------------
+# Pipeline
+# ----------------------------------------------------------------------
+
+class Pipeline:
+    """Dependency graph over STAGES with hash-based up-to-date checks"""
+
+    def __init__(self, stages=None, root=ROOT, state_dir=PIPELINE_DIR):
+        """
+        Parameters:
+        - stages: Stage specs (default: STAGES)
+        - root: Directory the scripts run from (all paths are relative to it)
+        - state_dir: Where state, run manifests and logs are written
+        """
+        self.stages = stages or STAGES
+        self.root = Path(root)
+        self.state_dir = self.root / state_dir
+        self.state_path = self.state_dir / 'state.json'
+
+        self.state = {'version': PIPELINE_VERSION, 'files': {}, 'stages': {}}
+        if self.state_path.exists():
+            with open(self.state_path, encoding='utf-8') as f:
+                state = json.load(f)
+            if state.get('version') == PIPELINE_VERSION:
+                self.state = state
+        self.hash_file = FileHashes(self.state['files'])
+
+        self.dependencies = self._dependencies()
+        self.order = self._topological_order()
+
+    # ------------------------------------------------------------------
+    # Graph
+    # ------------------------------------------------------------------
+
+    def _dependencies(self):
+        """Stage -> set of stages writing one of its inputs"""
+        deps = {name: set() for name in self.stages}
+        for name, spec in self.stages.items():
+            reads = spec['inputs'] + spec.get('optional', [])
+            for other, other_spec in self.stages.items():
+                if other != name and any(
+                    _patterns_overlap(pattern, output)
+                    for pattern in reads for output in other_spec['outputs']
+                ):
+                    deps[name].add(other)
+        return deps
+
+    def _topological_order(self):
+        order, visiting, done = [], set(), set()
+
+        def visit(name):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Pipeline has a dependency cycle through '{name}'")
+            visiting.add(name)
+            for dep in sorted(self.dependencies[name]):
+                visit(dep)
+            visiting.discard(name)
+            done.add(name)
+            order.append(name)
+
+        for name in self.stages:
+            visit(name)
+        return order
+
+    def select(self, targets=None, include_downloads=False):
+        """Stages to consider: the targets and everything upstream of them, in order"""
+        unknown = sorted(set(targets or []) - set(self.stages))
+        if unknown:
+            raise ValueError(f"Unknown stage(s): {', '.join(unknown)}")
+
+        selected = set(self.stages) if not targets else set()
+        stack = list(targets or [])
+        while stack:
+            name = stack.pop()
+            if name not in selected:
+                selected.add(name)
+                stack.extend(self.dependencies[name])
+
+        return [
+            name for name in self.order
+            if name in selected
+            and (include_downloads or self.stages[name]['kind'] != 'download' or name in (targets or []))
+        ]
+
+    # ------------------------------------------------------------------
+    # Up-to-date checks
+    # ------------------------------------------------------------------
+
+    def _resolve(self, pattern):
+        """Files matching a path or glob, relative to root"""
+        if glob.has_magic(pattern):
+            return sorted(
+                Path(p).relative_to(self.root).as_posix()
+                for p in glob.glob(str(self.root / pattern))
+            )
+        return [pattern] if (self.root / pattern).exists() else []
+
+    def missing_inputs(self, name):
+        return [p for p in self.stages[name]['inputs'] if not self._resolve(p)]
+
+    def missing_outputs(self, name):
+        return [p for p in self.stages[name]['outputs'] if not self._resolve(p)]
+
+    def _hash_paths(self, patterns):
+        hashes = {}
+        for pattern in patterns:
+            for path in self._resolve(pattern):
+                hashes[path] = self.hash_file(str(self.root / path))
+        return hashes
+
+    def input_hashes(self, name):
+        spec = self.stages[name]
+        return self._hash_paths(spec['inputs'] + spec.get('optional', []))
+
+    def stage_key(self, name, input_hashes=None):
+        """Hash of the stage's inputs, code and version"""
+        spec = self.stages[name]
+        code = Path(__file__).resolve() if 'script' not in spec else (
+            Path(__file__).resolve().parent / spec['script']
+        )
+        digest = hashlib.sha256(
+            f"{PIPELINE_VERSION}|{name}|{spec.get('version', '')}|{spec.get('args', [])}|"
+            f"{sha256_file(code)}".encode('utf-8')
+        )
+        for path, value in sorted((input_hashes or self.input_hashes(name)).items()):
+            digest.update(f"|{path}={value}".encode('utf-8'))
+        return digest.hexdigest()
+
+    def status(self, name, key=None):
+        """(up_to_date, reason) for one stage given its current inputs"""
+        previous = self.state['stages'].get(name)
+        if previous is None:
+            return False, 'never run'
+        if previous.get('status') != 'ok':
+            return False, 'last run failed'
+        missing = self.missing_outputs(name)
+        if missing:
+            return False, f"missing output {missing[0]}"
+        if previous.get('key') != (key or self.stage_key(name)):
+            return False, 'inputs or code changed'
+        return True, 'up to date'
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    def _command(self, name):
+        spec = self.stages[name]
+        if 'script' in spec:
+            return [sys.executable, str(Path(__file__).resolve().parent / spec['script'])] + spec.get('args', [])
+        return [sys.executable, str(Path(__file__).resolve()), '--worker', name]
+
+    def _execute(self, name, env):
+        """Run one stage in a subprocess; returns (returncode, seconds, log path)"""
+        log_path = self.state_dir / 'logs' / f'{name}.log'
+        start = time.perf_counter()
+        with instrumentation.stage('pipeline', name, kind=self.stages[name]['kind']):
+            with open(log_path, 'w', encoding='utf-8') as log_file:
+                returncode = subprocess.run(
+                    self._command(name), cwd=self.root, env=env,
+                    stdout=log_file, stderr=subprocess.STDOUT
+                ).returncode
+        return returncode, time.perf_counter() - start, log_path
+
+    def _environment(self, quiet, events):
+        env = dict(os.environ, PYTHONIOENCODING='utf-8')
+        if quiet:
+            env['TEXAS_ELECTION_QUIET'] = '1'
+        if events:
+            env['TEXAS_ELECTION_EVENTS'] = str(Path(events).resolve())
+        return env
+
+    def run(self, targets=None, jobs=None, force=False, include_downloads=False,
+            dry_run=False, quiet=False, events=None, validate=True, strict=False):
+        """
+        Run every stale stage among the targets and their upstream stages
+
+        Parameters:
+        - targets: Stage names (default: all)
+        - jobs: Stages run at once (default: CPU count)
+        - force: Rerun selected stages even if up to date
+        - include_downloads: Run download stages (network)
+        - dry_run: Only report what would run
+        - quiet: Pass quiet mode to the scripts (no per-page/per-district output)
+        - events: JSON Lines file for stage events from the executor and scripts
+        - validate: Check each stage's outputs against validate_data.RULES
+          after it runs (report in state_dir/validation/<stage>.json)
+        - strict: Fail a stage whose outputs have validation errors
+
+        Returns list of dicts (stage, kind, status, reason, seconds, log,
+        validation), in pipeline order. Status is one of ran, up-to-date,
+        failed, blocked or would-run (dry run); validation is the error and
+        warning counts for stages that were validated.
+        """
+        selected = self.select(targets, include_downloads)
+        jobs = jobs or os.cpu_count() or 1
+        env = self._environment(quiet, events)
+        (self.state_dir / 'logs').mkdir(parents=True, exist_ok=True)
+
+        started = datetime.datetime.now()
+        results = {}
+        keys = {}
+        pending = list(selected)
+        running = {}
+
+        def finish(name, status, reason, seconds=None, log=None, validation=None):
+            results[name] = {
+                'stage': name, 'kind': self.stages[name]['kind'], 'status': status,
+                'reason': reason, 'seconds': None if seconds is None else round(seconds, 3),
+                'log': None if log is None else Path(log).relative_to(self.root).as_posix(),
+                'validation': validation
+            }
+            marks = {'ran': '✓', 'up-to-date': '·', 'would-run': '→', 'failed': '✗', 'blocked': '⚠'}
+            timing = '' if seconds is None else f" ({seconds:.1f}s)"
+            print(f"  {marks[status]} {name:<36} {status:<10} {reason}{timing}")
+            if validation and (validation['errors'] or validation['warnings']):
+                print(f"      validation: {validation['errors']} error(s), {validation['warnings']} warning(s)"
+                      f" - see {validation['report']}")
+
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            while pending or running:
+                for name in list(pending):
+                    deps = self.dependencies[name] & set(selected)
+                    if any(results.get(d, {}).get('status') == 'failed' for d in deps):
+                        pending.remove(name)
+                        finish(name, 'blocked', 'upstream stage failed')
+                        continue
+                    if not all(d in results for d in deps):
+                        continue
+
+                    pending.remove(name)
+                    missing = self.missing_inputs(name)
+                    if dry_run:
+                        # Inputs a stage that would run is going to write
+                        upcoming = [o for d in deps if results[d]['status'] == 'would-run'
+                                    for o in self.stages[d]['outputs']]
+                        missing = [p for p in missing
+                                   if not any(_patterns_overlap(p, o) for o in upcoming)]
+                    if missing:
+                        finish(name, 'blocked', f"missing input {missing[0]}")
+                        continue
+
+                    if dry_run:
+                        upstream = any(results[d]['status'] == 'would-run' for d in deps)
+                        fresh, reason = (False, 'upstream stage will run') if upstream else self.status(name)
+                        if force and fresh:
+                            fresh, reason = False, 'forced'
+                        finish(name, 'up-to-date' if fresh else 'would-run', reason)
+                        continue
+
+                    inputs = self.input_hashes(name)
+                    keys[name] = (self.stage_key(name, inputs), inputs)
+                    fresh, reason = self.status(name, keys[name][0])
+                    if fresh and not force:
+                        finish(name, 'up-to-date', reason)
+                        continue
+
+                    running[pool.submit(self._execute, name, env)] = (name, 'forced' if fresh else reason)
+
+                if not running:
+                    continue
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name, reason = running.pop(future)
+                    returncode, seconds, log_path = future.result()
+                    self._record(name, returncode, seconds, keys[name], reason, finish, log_path,
+                                 validate, strict)
+
+        results = [results[name] for name in selected]
+        if not dry_run:
+            self._write_run_manifest(started, results, targets, jobs, force)
+        return results
+
+    def _record(self, name, returncode, seconds, key_inputs, reason, finish, log_path,
+                validate=True, strict=False):
+        """Update state for a finished stage (validating its outputs) and report it"""
+        key, inputs = key_inputs
+        missing = self.missing_outputs(name)
+        validation = None
+        if returncode != 0:
+            status, reason = 'failed', f"exit status {returncode}"
+        elif missing:
+            status, reason = 'failed', f"did not write {missing[0]}"
+        else:
+            status = 'ran'
+            validation = self.validate_outputs(name) if validate else None
+            if strict and validation and validation['errors']:
+                status, reason = 'failed', f"{validation['errors']} validation error(s)"
+
+        outputs = self._hash_paths(self.stages[name]['outputs'])
+        self.state['stages'][name] = {
+            'status': 'ok' if status == 'ran' else 'failed',
+            'key': key,
+            'finished': datetime.datetime.now().isoformat(timespec='seconds'),
+            'seconds': round(seconds, 3),
+            'inputs': inputs,
+            'outputs': outputs,
+            'validation': validation
+        }
+        self._save_state()
+        finish(name, status, reason, seconds, log_path, validation)
+
+        if status == 'failed' and returncode != 0:
+            with open(log_path, encoding='utf-8', errors='replace') as f:
+                tail = f.readlines()[-10:]
+            for line in tail:
+                print(f"      {line.rstrip()}")
+
+    def validate_outputs(self, name):
+        """
+        Run validate_data over the datasets a stage writes
+
+        Returns {'errors', 'warnings', 'report'} or None if the stage writes
+        no registered dataset. The full report goes to
+        state_dir/validation/<stage>.json.
+        """
+        outputs = [path for pattern in self.stages[name]['outputs'] for path in self._resolve(pattern)]
+        datasets = validate_data.datasets_for_files(outputs)
+        if not datasets:
+            return None
+
+        with instrumentation.stage('pipeline', f'{name}:validate', datasets=len(datasets)):
+            report = validate_data.validate(datasets, root=self.root)
+        path = self.state_dir / 'validation' / f'{name}.json'
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        return {
+            'errors': report['summary']['errors'],
+            'warnings': report['summary']['warnings'],
+            'report': path.relative_to(self.root).as_posix()
+        }
+
+    def _save_state(self):
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.state_path.with_suffix('.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, indent=2, sort_keys=True)
+        os.replace(tmp, self.state_path)
+
+    def _write_run_manifest(self, started, results, targets, jobs, force):
+        runs_dir = self.state_dir / 'runs'
+        runs_dir.mkdir(parents=True, exist_ok=True)
+        finished = datetime.datetime.now()
+        manifest = {
+            'started': started.isoformat(timespec='seconds'),
+            'finished': finished.isoformat(timespec='seconds'),
+            'seconds': round((finished - started).total_seconds(), 3),
+            'targets': targets or [],
+            'jobs': jobs,
+            'force': force,
+            'stages': [
+                dict(r, **{k: self.state['stages'].get(r['stage'], {}).get(k)
+                           for k in ('key', 'inputs', 'outputs')})
+                if r['status'] in ('ran', 'failed') else r
+                for r in results
+            ]
+        }
+        stamp = started.strftime('%Y%m%d_%H%M%S')
+        path = runs_dir / f"{stamp}.json"
+        suffix = 1
+        while path.exists():
+            suffix += 1
+            path = runs_dir / f"{stamp}_{suffix}.json"
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+        print(f"\n  Run manifest: {path.relative_to(self.root).as_posix()}")
+        return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rebuild the election datasets, skipping up-to-date stages")
+    parser.add_argument('targets', nargs='*', metavar='stage',
+                        help="Stages to bring up to date, with everything they need (default: all)")
+    parser.add_argument('--jobs', '-j', type=int, default=None, help="Stages run at once (default: CPU count)")
+    parser.add_argument('--force', action='store_true', help="Rerun selected stages even if up to date")
+    parser.add_argument('--download', action='store_true', help="Include download stages (network)")
+    parser.add_argument('--dry-run', '-n', action='store_true', help="Show what would run")
+    parser.add_argument('--list', action='store_true', help="List stages with their dependencies")
+    parser.add_argument('--quiet', '-q', action='store_true',
+                        help="Drop per-page and per-district progress output in the scripts")
+    parser.add_argument('--events', metavar='FILE', help="Append stage events to FILE as JSON Lines")
+    parser.add_argument('--no-validate', action='store_true',
+                        help="Skip validating each stage's output datasets after it runs")
+    parser.add_argument('--strict', action='store_true',
+                        help="Fail stages whose output datasets have validation errors")
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        WORKERS[args.worker]()
+        return
+
+    pipeline = Pipeline()
+
+    if args.list:
+        for name in pipeline.order:
+            spec = pipeline.stages[name]
+            deps = ', '.join(sorted(pipeline.dependencies[name])) or '-'
+            print(f"  {name:<36} {spec['kind']:<12} after: {deps}")
+        return
+
+    print("="*80)
+    print("DATA COLLECTION PIPELINE" + (" (DRY RUN)" if args.dry_run else ""))
+    print("="*80)
+
+    sink = instrumentation.add_sink(instrumentation.JsonLinesSink(args.events)) if args.events else None
+    try:
+        results = pipeline.run(
+            args.targets, jobs=args.jobs, force=args.force, include_downloads=args.download,
+            dry_run=args.dry_run, quiet=args.quiet, events=args.events,
+            validate=not args.no_validate, strict=args.strict
+        )
+    except ValueError as e:
+        parser.error(str(e))
+    finally:
+        if sink:
+            instrumentation.remove_sink(sink)
+
+    counts = {}
+    for r in results:
+        counts[r['status']] = counts.get(r['status'], 0) + 1
+    print("\n" + ", ".join(f"{n} {status}" for status, n in counts.items()))
+
+    if counts.get('failed'):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
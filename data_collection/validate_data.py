@@ -0,0 +1,487 @@
+"""
+Election Data Validation Engine
+
+Declarative checks over every results dataset in pdf_extracts/ (year,
+district, office, candidate, party, votes, percentage). All registered
+datasets are loaded into one frame and each rule is a handful of grouped
+operations over it, so a full run takes well under a second and the
+pipeline can validate a stage's outputs right after it writes them.
+
+Rules:
+- coverage: every district of the plan (plus the STATE row where the
+  dataset has one) is present for each (level, year, plan), and no
+  district outside the plan appears
+- percent_sum: percentages within a race sum to ~100
+- state_total: the STATE row equals the sum of the district rows
+- duplicate_rows: no repeated (year, district, office, candidate, party)
+- ambiguous_keys: no (year, district, office, candidate) shared by
+  candidates of different parties (namesakes that name-based joins merge)
+- vote_share: percentage agrees with votes / race total (races whose
+  percentages sum to ~100 only; incomplete races fail percent_sum instead)
+
+The report is a JSON-ready dict: datasets read, then per rule its
+severity, number of units checked, number of violations and the first
+violations as examples.
+
+Replaces verify_data.py, verify_senate_data.py and
+verify_congressional_data.py.
+
+Usage:
+    python data_collection/validate_data.py
+    python data_collection/validate_data.py --level senate
+    python data_collection/validate_data.py --files texas_election_data/pdf_extracts/2024_house_races.csv
+    python data_collection/validate_data.py --json report.json --strict
+"""
+
+import sys
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+import argparse
+import datetime
+import json
+import os
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'analysis_tools'))
+from instrumentation import stage
+from fact_paths import PDF_EXTRACTS, RACE_FILES, RACE_PLANS, STATEWIDE_FILES, STATEWIDE_PLANS
+
+# Number of districts in each plan
+PLAN_SIZES = {
+    'PLANH358': 150, 'PLANH2176': 150, 'PLANH2316': 150,
+    'PLANS172': 31, 'PLANS2168': 31,
+    'PLANC2100': 36, 'PLANC2193': 38
+}
+
+# Dataset name -> spec:
+# - files: CSVs making up the dataset
+# - level: house, senate or congressional
+# - plans: Year -> district plan the results are reported under
+# - complete: Every district of the plan should be present (statewide
+#   races by district); False for district races, which skip uncontested seats
+# - state_row: Dataset carries a district == 'STATE' total row
+# - percent_tolerance: Allowed |sum - 100| within a race (default DEFAULT_TOLERANCES)
+DATASETS = {
+    'house-statewide': {
+        'files': [STATEWIDE_FILES['house']],
+        'level': 'house',
+        'plans': STATEWIDE_PLANS['house'],
+        'complete': True,
+        'state_row': True
+    },
+    'senate-statewide': {
+        'files': [STATEWIDE_FILES['senate']],
+        'level': 'senate',
+        'plans': STATEWIDE_PLANS['senate'],
+        'complete': True,
+        'state_row': True
+    },
+    'congressional-statewide': {
+        'files': [STATEWIDE_FILES['congressional']],
+        'level': 'congressional',
+        'plans': STATEWIDE_PLANS['congressional'],
+        'complete': True,
+        'state_row': True
+    },
+    'house-statewide-h2176': {
+        'files': [f'{PDF_EXTRACTS}/2022_house_district_results.csv',
+                  f'{PDF_EXTRACTS}/2024_house_district_results.csv'],
+        'level': 'house',
+        'plans': {2022: 'PLANH2176', 2024: 'PLANH2176'},
+        'complete': True,
+        'state_row': True
+    },
+    'house-statewide-2020': {
+        'files': [f'{PDF_EXTRACTS}/2020_house_district_results.csv'],
+        'level': 'house',
+        # Parsed from 2020_planh2316.pdf
+        'plans': {2020: 'PLANH2316'},
+        'complete': True,
+        'state_row': True
+    },
+    'house-statewide-legacy-combined': {
+        'files': [f'{PDF_EXTRACTS}/2020_2024_house_district_results_combined.csv'],
+        'level': 'house',
+        'plans': {2020: 'PLANH2316', 2022: 'PLANH2176', 2024: 'PLANH2176'},
+        'complete': True,
+        'state_row': True
+    },
+    'congressional-presidential-dailykos': {
+        'files': [f'{PDF_EXTRACTS}/2020_2024_congressional_presidential_dailykos.csv'],
+        'level': 'congressional',
+        # Daily Kos reports 2020 results under the current districts
+        'plans': {2020: 'PLANC2193', 2024: 'PLANC2193'},
+        'complete': True,
+        'state_row': False,
+        # Whole percents, minor candidates omitted
+        'percent_tolerance': 3.0
+    },
+    'house-races': {
+        'files': RACE_FILES['house'],
+        'level': 'house',
+        'plans': RACE_PLANS['house'],
+        'complete': False,
+        'state_row': False
+    },
+    'senate-races': {
+        'files': RACE_FILES['senate'],
+        'level': 'senate',
+        'plans': RACE_PLANS['senate'],
+        'complete': False,
+        'state_row': False
+    },
+    'congressional-races': {
+        'files': RACE_FILES['congressional'],
+        'level': 'congressional',
+        'plans': RACE_PLANS['congressional'],
+        'complete': False,
+        'state_row': False
+    }
+}
+
+# Rule name -> (severity, description); each is checked by DataValidator._check_<name>
+RULES = {
+    'coverage': ('error', "Every district of the plan present for each (level, year, plan)"),
+    'percent_sum': ('warning', "Percentages within a race sum to ~100"),
+    'state_total': ('error', "STATE row equals the sum of the district rows"),
+    'duplicate_rows': ('error', "No repeated (year, district, office, candidate, party)"),
+    'ambiguous_keys': ('warning', "No (year, district, office, candidate) shared across parties"),
+    'vote_share': ('warning', "Percentage agrees with votes / race total")
+}
+
+DEFAULT_TOLERANCES = {
+    'percent_sum': 0.5,     # percentage points
+    'vote_share': 0.15,     # percentage points (results are rounded to 0.1)
+    'state_total': 0.001    # relative difference
+}
+
+# Violations listed per rule in the report
+MAX_EXAMPLES = 20
+
+RACE_KEY = ['dataset', 'year', 'district', 'office']
+COLUMNS = ['year', 'district', 'office', 'candidate', 'party', 'votes', 'percentage']
+
+
+def datasets_for_files(paths):
+    """Names of the datasets that read any of the given files"""
+    wanted = {Path(p).as_posix() for p in paths}
+    return [name for name, spec in DATASETS.items() if wanted & set(spec['files'])]
+
+
+def datasets_for_level(level):
+    return [name for name, spec in DATASETS.items() if spec['level'] == level]
+
+
+class DataValidator:
+    """Evaluate RULES over a set of datasets in one pass"""
+
+    def __init__(self, datasets=None, rules=None, tolerances=None, root='.'):
+        """
+        Parameters:
+        - datasets: Dataset names from DATASETS (default: all)
+        - rules: Rule names from RULES (default: all)
+        - tolerances: Overrides for DEFAULT_TOLERANCES
+        - root: Directory the dataset paths are relative to
+        """
+        unknown = sorted(set(datasets or []) - set(DATASETS)) + sorted(set(rules or []) - set(RULES))
+        if unknown:
+            raise ValueError(f"Unknown dataset or rule: {', '.join(unknown)}")
+
+        self.datasets = list(datasets or DATASETS)
+        self.rules = list(rules or RULES)
+        self.tolerances = dict(DEFAULT_TOLERANCES, **(tolerances or {}))
+        self.root = Path(root)
+        self.sources = []
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    def load(self):
+        """All datasets as one frame with dataset, level and plan columns"""
+        frames = []
+        self.sources = []
+        with stage('load', 'DataValidator') as s:
+            for name in self.datasets:
+                spec = DATASETS[name]
+                rows, missing = 0, []
+                for path in spec['files']:
+                    if not (self.root / path).exists():
+                        missing.append(path)
+                        continue
+                    df = pd.read_csv(self.root / path, usecols=COLUMNS, dtype={'district': str})
+                    df['dataset'] = name
+                    frames.append(df)
+                    rows += len(df)
+                self.sources.append({
+                    'dataset': name, 'level': spec['level'], 'files': spec['files'],
+                    'missing_files': missing, 'rows': rows
+                })
+
+            if not frames:
+                return pd.DataFrame(columns=COLUMNS + ['dataset', 'level', 'plan'])
+
+            data = pd.concat(frames, ignore_index=True)
+            # Daily Kos writes '01'; everything else '1'
+            data['district'] = data['district'].str.strip().str.lstrip('0')
+            data = data.merge(self._plan_frame(), on=['dataset', 'year'], how='left')
+            data['level'] = data['dataset'].map({n: DATASETS[n]['level'] for n in self.datasets})
+            s.set(rows=len(data))
+        return data
+
+    def _plan_frame(self):
+        """(dataset, year, plan) for every year a dataset declares"""
+        return pd.DataFrame(
+            [(name, year, plan) for name in self.datasets for year, plan in DATASETS[name]['plans'].items()],
+            columns=['dataset', 'year', 'plan']
+        )
+
+    # ------------------------------------------------------------------
+    # Rules (each returns (units checked, violations frame))
+    # ------------------------------------------------------------------
+
+    def _check_coverage(self, data):
+        declared = self._plan_frame()
+        declared = declared[declared['dataset'].map(lambda n: DATASETS[n]['complete'])]
+        declared['level'] = declared['dataset'].map(lambda n: DATASETS[n]['level'])
+        districts = pd.DataFrame(
+            [(plan, str(d)) for plan, size in PLAN_SIZES.items() for d in range(1, size + 1)],
+            columns=['plan', 'district']
+        )
+        expected = declared.merge(districts, on='plan')
+        state_rows = declared[declared['dataset'].map(lambda n: DATASETS[n]['state_row'])]
+        expected = pd.concat([expected, state_rows.assign(district='STATE')], ignore_index=True)
+
+        present = data[['dataset', 'level', 'year', 'plan', 'district']].drop_duplicates()
+        merged = expected.merge(present, on=['dataset', 'level', 'year', 'plan', 'district'],
+                                how='outer', indicator=True)
+
+        # Districts outside the plan, in undeclared years, or a STATE row where none belongs
+        size = merged['plan'].map(PLAN_SIZES)
+        number = pd.to_numeric(merged['district'], errors='coerce')
+        has_state = merged['dataset'].map(lambda n: DATASETS[n]['state_row'])
+        valid = ((number >= 1) & (number <= size)) | ((merged['district'] == 'STATE') & has_state)
+        merged['missing'] = merged['_merge'] == 'left_only'
+        merged['unexpected'] = (merged['_merge'] == 'right_only') & ~valid
+
+        keys = ['dataset', 'level', 'year', 'plan']
+        merged['plan'] = merged['plan'].fillna('(undeclared year)')
+        checked = merged[keys].drop_duplicates()
+        flagged = merged[merged['missing'] | merged['unexpected']]
+        if flagged.empty:
+            return len(checked), flagged[keys]
+
+        violations = flagged.groupby(keys, sort=True).agg(
+            missing=('missing', 'sum'),
+            unexpected=('unexpected', 'sum'),
+            missing_districts=('district', lambda d: _district_sample(d[flagged.loc[d.index, 'missing']])),
+            unexpected_districts=('district', lambda d: _district_sample(d[flagged.loc[d.index, 'unexpected']]))
+        ).reset_index()
+        return len(checked), violations
+
+    def _check_percent_sum(self, data):
+        races = data.groupby(RACE_KEY, sort=True)['percentage'].agg(total='sum', candidates='count').reset_index()
+        tolerance = races['dataset'].map(
+            lambda n: DATASETS[n].get('percent_tolerance', self.tolerances['percent_sum'])
+        )
+        races['total'] = races['total'].round(2)
+        return len(races), races[(races['total'] - 100).abs() > tolerance]
+
+    def _check_state_total(self, data):
+        with_state = data[data['dataset'].map(lambda n: DATASETS[n]['state_row'])]
+        keys = ['dataset', 'year', 'office', 'candidate', 'party']
+        state = with_state[with_state['district'] == 'STATE'].groupby(keys)['votes'].sum(min_count=1)
+        districts = with_state[with_state['district'] != 'STATE'].groupby(keys)['votes'].sum(min_count=1)
+
+        totals = pd.DataFrame({'state_votes': state, 'district_sum': districts}).reset_index()
+        totals = totals[totals['state_votes'].notna()]
+        totals['difference'] = totals['district_sum'] - totals['state_votes']
+        relative = (totals['difference'] / totals['state_votes'].where(totals['state_votes'] != 0)).abs()
+        bad = totals['district_sum'].isna() | (relative > self.tolerances['state_total'])
+        return len(totals), totals[bad]
+
+    def _check_duplicate_rows(self, data):
+        keys = RACE_KEY + ['candidate', 'party']
+        repeated = data[data.duplicated(keys, keep=False)]
+        violations = repeated.groupby(keys, sort=True).size().rename('rows').reset_index()
+        return len(data), violations
+
+    def _check_ambiguous_keys(self, data):
+        keys = RACE_KEY + ['candidate']
+        counts = data.groupby(keys, sort=True)['party'].nunique()
+        shared = counts[counts > 1].reset_index()[keys]
+        if shared.empty:
+            return len(counts), shared
+
+        rows = data.merge(shared, on=keys)[keys + ['party']].drop_duplicates().sort_values('party')
+        violations = rows.groupby(keys, sort=True)['party'].agg(list).rename('parties').reset_index()
+        return len(counts), violations
+
+    def _check_vote_share(self, data):
+        race = data.groupby(RACE_KEY, sort=False)
+        complete = (race['percentage'].transform('sum') - 100).abs() <= self.tolerances['percent_sum']
+        total = race['votes'].transform('sum')
+        counted = race['votes'].transform('count') == race['votes'].transform('size')
+
+        rows = data[complete & counted & (total > 0)].copy()
+        rows['share'] = (rows['votes'] / total[rows.index] * 100).round(2)
+        rows['difference'] = (rows['share'] - rows['percentage']).round(2)
+        bad = rows['difference'].abs() > self.tolerances['vote_share']
+        return len(rows), rows.loc[bad, RACE_KEY + ['candidate', 'votes', 'percentage', 'share', 'difference']]
+
+    # ------------------------------------------------------------------
+    # Report
+    # ------------------------------------------------------------------
+
+    def run(self, data=None):
+        """
+        Evaluate every rule
+
+        Parameters:
+        - data: Pre-loaded frame from load() (default: load now)
+
+        Returns report dict (JSON-serializable): generated, seconds,
+        datasets, rules (rule -> severity, description, checked,
+        violations, examples) and summary (errors, warnings, ok).
+        """
+        start = time.perf_counter()
+        if data is None:
+            data = self.load()
+
+        rules = {}
+        for rule in self.rules:
+            severity, description = RULES[rule]
+            with stage('aggregate', f'DataValidator.{rule}') as s:
+                checked, violations = getattr(self, f'_check_{rule}')(data)
+                s.set(rows=checked)
+            rules[rule] = {
+                'severity': severity,
+                'description': description,
+                'checked': int(checked),
+                'violations': int(len(violations)),
+                'examples': _records(violations.head(MAX_EXAMPLES))
+            }
+
+        missing_files = [p for source in self.sources for p in source['missing_files']]
+        errors = sum(r['violations'] for r in rules.values() if r['severity'] == 'error')
+        warnings = sum(r['violations'] for r in rules.values() if r['severity'] == 'warning')
+        return {
+            'generated': datetime.datetime.now().isoformat(timespec='seconds'),
+            'seconds': round(time.perf_counter() - start, 3),
+            'tolerances': self.tolerances,
+            'datasets': self.sources,
+            'rules': rules,
+            'summary': {
+                'rows': int(len(data)),
+                'errors': int(errors),
+                'warnings': int(warnings),
+                'missing_files': missing_files,
+                'ok': errors == 0
+            }
+        }
+
+
+def _district_sample(districts, limit=10):
+    """Sorted (numerically) district labels, at most limit of them"""
+    labels = sorted(districts.astype(str).unique(), key=lambda d: (not d.isdigit(), int(d) if d.isdigit() else 0, d))
+    return labels[:limit]
+
+
+def _records(frame):
+    """Frame rows as plain-Python dicts (NaN -> None)"""
+    frame = frame.astype(object).where(frame.notna(), None)
+    return [
+        {k: (v.item() if hasattr(v, 'item') else v) for k, v in row.items()}
+        for row in frame.to_dict('records')
+    ]
+
+
+def validate(datasets=None, root='.', **kwargs):
+    """Validate datasets and return the report (see DataValidator.run)"""
+    return DataValidator(datasets, root=root, **kwargs).run()
+
+
+def print_report(report, examples=5):
+    """Human-readable summary of a report"""
+    print("="*80)
+    print("DATA VALIDATION")
+    print("="*80)
+
+    print(f"\nDatasets ({report['summary']['rows']:,} rows):")
+    for source in report['datasets']:
+        mark = '⚠' if source['missing_files'] else '✓'
+        print(f"  {mark} {source['dataset']:<38} {source['level']:<14} {source['rows']:>6,} rows")
+        for path in source['missing_files']:
+            print(f"      missing {path}")
+
+    print("\nRules:")
+    for rule, result in report['rules'].items():
+        if result['violations'] == 0:
+            print(f"  ✓ {rule:<16} {result['checked']:>7,} checked  {result['description']}")
+            continue
+        mark = '✗' if result['severity'] == 'error' else '⚠'
+        print(f"  {mark} {rule:<16} {result['checked']:>7,} checked  "
+              f"{result['violations']:,} {result['severity']}(s): {result['description']}")
+        for example in result['examples'][:examples]:
+            print(f"      {', '.join(f'{k}={v}' for k, v in example.items())}")
+        if result['violations'] > examples:
+            print(f"      ... {result['violations'] - examples:,} more")
+
+    summary = report['summary']
+    print(f"\n{summary['errors']:,} error(s), {summary['warnings']:,} warning(s) in {report['seconds']:.2f}s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate the election results datasets")
+    parser.add_argument('--level', choices=['house', 'senate', 'congressional'],
+                        help="Only datasets for one level")
+    parser.add_argument('--dataset', action='append', choices=sorted(DATASETS),
+                        help="Only these datasets (repeatable)")
+    parser.add_argument('--files', nargs='+', metavar='CSV', help="Only datasets that read these files")
+    parser.add_argument('--rule', action='append', choices=list(RULES), help="Only these rules (repeatable)")
+    parser.add_argument('--json', metavar='FILE', help="Write the report as JSON ('-' for stdout)")
+    parser.add_argument('--examples', type=int, default=5, help="Violations printed per rule")
+    parser.add_argument('--strict', action='store_true', help="Exit with status 1 on any error")
+    parser.add_argument('--list', action='store_true', help="List datasets and rules")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, spec in DATASETS.items():
+            years = ', '.join(f"{y}:{p}" for y, p in spec['plans'].items())
+            print(f"  {name:<38} {spec['level']:<14} {years}")
+        print()
+        for rule, (severity, description) in RULES.items():
+            print(f"  {rule:<16} {severity:<8} {description}")
+        return
+
+    datasets = args.dataset or list(DATASETS)
+    if args.level:
+        datasets = [d for d in datasets if d in datasets_for_level(args.level)]
+    if args.files:
+        datasets = [d for d in datasets if d in datasets_for_files(args.files)]
+    if not datasets:
+        parser.error("no datasets selected")
+
+    report = validate(datasets, rules=args.rule)
+
+    if args.json == '-':
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        print_report(report, examples=args.examples)
+        if args.json:
+            Path(args.json).parent.mkdir(parents=True, exist_ok=True)
+            with open(args.json, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+            print(f"✓ Report saved to {args.json}")
+
+    if args.strict and not report['summary']['ok']:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
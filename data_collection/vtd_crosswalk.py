@@ -0,0 +1,284 @@
+"""
+Sparse VTD -> District Crosswalk for Re-Aggregating Any Race Under Any Plan
+
+Recasts VTD-level election returns onto any district plan without parsing
+Red-206 PDFs:
+1. Load a plan's VTD -> district assignment table as a sparse
+   (VTDs x districts) matrix. Split VTDs can carry fractional weights.
+2. Pivot the VTD returns into a sparse (VTDs x candidates) vote matrix
+   covering every office on the ballot.
+3. One sparse matmul (assignment.T @ votes) yields district totals for
+   every candidate of every office at once.
+
+Results use the standard format (year, district, office, candidate, party,
+votes, percentage) and can be validated against the *_CORRECT.csv outputs.
+
+Assignment tables are local CSVs exported from the plan's block/VTD
+equivalency files, e.g. texas_election_data/vtd_data/assignments/PLANH2316.csv
+with columns: cntyvtd, district[, weight]
+"""
+
+import sys
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+import pandas as pd
+import numpy as np
+import scipy.sparse as sp
+import os
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'analysis_tools'))
+from instrumentation import instrumented
+
+VTD_DIR = Path("texas_election_data/vtd_data")
+ASSIGNMENT_DIR = VTD_DIR / "assignments"
+OUTPUT_DIR = Path("texas_election_data/pdf_extracts")
+
+# VTD return files for each election year
+VTD_RETURNS = {
+    2018: VTD_DIR / "2020_data" / "2018_General_Election_Returns.csv",
+    2020: VTD_DIR / "2020_data" / "2020_General_Election_Returns.csv",
+    2022: VTD_DIR / "2022_data" / "2022_General_Election_Returns.csv",
+    2024: VTD_DIR / "2024_data" / "2024_General_Election_Returns.csv"
+}
+
+# Office labels in VTD returns -> our standard office names
+STATEWIDE_OFFICES = {
+    'President': 'President',
+    'U.S. Sen': 'U.S. Senate',
+    'Governor': 'Governor',
+    'Lt. Governor': 'Lieutenant Governor',
+    'Attorney Gen': 'Attorney General'
+}
+
+# Validation targets: plan -> (level, CORRECT csv, years reported under the plan)
+CORRECT_OUTPUTS = {
+    'PLANH2316': ('house', OUTPUT_DIR / "2018_2024_house_results_combined_CORRECT.csv", [2018, 2020, 2022, 2024]),
+    'PLANS172': ('senate', OUTPUT_DIR / "2018_2024_senate_results_combined_CORRECT.csv", [2018, 2020]),
+    'PLANS2168': ('senate', OUTPUT_DIR / "2018_2024_senate_results_combined_CORRECT.csv", [2022, 2024]),
+    'PLANC2100': ('congressional', OUTPUT_DIR / "2018_2024_congressional_results_combined_CORRECT.csv", [2018, 2020]),
+    'PLANC2193': ('congressional', OUTPUT_DIR / "2018_2024_congressional_results_combined_CORRECT.csv", [2022, 2024])
+}
+
+
+class VTDCrosswalk:
+    """Sparse VTD -> district assignment for one district plan"""
+
+    def __init__(self, plan, matrix, vtds, districts):
+        """
+        Parameters:
+        - plan: Plan name (e.g. 'PLANH2316')
+        - matrix: scipy.sparse CSR matrix (VTDs x districts) of assignment weights
+        - vtds: VTD keys for the matrix rows
+        - districts: District labels for the matrix columns
+        """
+        self.plan = plan
+        self.matrix = matrix
+        self.vtds = pd.Index(vtds)
+        self.districts = pd.Index(districts)
+
+    @classmethod
+    def from_csv(cls, path, plan=None, vtd_col='cntyvtd', district_col='district',
+                 weight_col=None):
+        """
+        Load an assignment table into a sparse crosswalk
+
+        Parameters:
+        - path: CSV with one row per (VTD, district) assignment
+        - plan: Plan name (defaults to the file stem)
+        - vtd_col: Column holding the VTD key
+        - district_col: Column holding the district number
+        - weight_col: Optional share of the VTD's votes assigned to the district
+          (for split VTDs); uses a 'weight' column if present, otherwise 1
+        """
+        path = Path(path)
+        table = pd.read_csv(path, dtype={vtd_col: str, district_col: str})
+        if weight_col is None and 'weight' in table.columns:
+            weight_col = 'weight'
+
+        vtd_codes, vtds = pd.factorize(table[vtd_col])
+        district_codes, districts = pd.factorize(table[district_col])
+        weights = table[weight_col].to_numpy(dtype=float) if weight_col else np.ones(len(table))
+
+        matrix = sp.csr_matrix(
+            (weights, (vtd_codes, district_codes)),
+            shape=(len(vtds), len(districts))
+        )
+
+        return cls(plan or path.stem, matrix, vtds, districts)
+
+    def aggregate(self, vote_matrix, vtds):
+        """
+        Re-aggregate a VTD x candidate vote matrix to districts
+
+        Parameters:
+        - vote_matrix: scipy.sparse matrix (VTDs x candidates)
+        - vtds: VTD keys for the vote matrix rows
+
+        Returns dense (districts x candidates) array of vote totals.
+        VTDs missing from the assignment table are dropped.
+        """
+        # Align crosswalk rows to the returns' VTD order
+        rows = self.vtds.get_indexer(pd.Index(vtds))
+        present = rows >= 0
+        if not present.all():
+            print(f"  ⚠ {int((~present).sum())} VTDs in returns not found in {self.plan}")
+
+        assignment = self.matrix[rows[present]]
+        votes = vote_matrix[np.flatnonzero(present)]
+
+        return (assignment.T @ votes).toarray()
+
+
+@instrumented('load', 'vtd_crosswalk')
+def load_vtd_returns(csv_path, offices=STATEWIDE_OFFICES):
+    """
+    Load VTD returns as a sparse VTD x candidate vote matrix
+
+    Parameters:
+    - csv_path: Path to a General_Election_Returns.csv file
+    - offices: Mapping of VTD office labels to standard office names
+
+    Returns (vote_matrix, vtds, candidates) where candidates is a DataFrame
+    of (office, candidate, party) for each matrix column.
+    """
+    df = pd.read_csv(
+        csv_path,
+        usecols=['cntyvtd', 'Office', 'Name', 'Party', 'Votes'],
+        dtype={'cntyvtd': str, 'Office': 'category', 'Name': 'category', 'Party': 'category'}
+    )
+    df = df[df['Office'].isin(list(offices))]
+    df['Office'] = df['Office'].astype(str).map(offices)
+
+    vtd_codes, vtds = pd.factorize(df['cntyvtd'])
+    cand_keys = pd.MultiIndex.from_frame(df[['Office', 'Name', 'Party']].astype(str))
+    cand_codes, candidates = pd.factorize(cand_keys)
+    candidates = pd.DataFrame(list(candidates), columns=['office', 'candidate', 'party'])
+
+    # Duplicate (VTD, candidate) entries are summed by the COO -> CSR conversion
+    vote_matrix = sp.csr_matrix(
+        (df['Votes'].to_numpy(dtype=float), (vtd_codes, cand_codes)),
+        shape=(len(vtds), len(candidates))
+    )
+
+    return vote_matrix, vtds, candidates
+
+
+@instrumented('aggregate', 'vtd_crosswalk', args=('year',))
+def reaggregate(crosswalk, vote_matrix, vtds, candidates, year):
+    """
+    Produce district results for every office under a crosswalk's plan
+
+    Returns DataFrame in the standard statewide-by-district format,
+    including a STATE row for each candidate.
+    """
+    totals = crosswalk.aggregate(vote_matrix, vtds)
+
+    districts = list(crosswalk.districts) + ['STATE']
+    totals = np.vstack([totals, totals.sum(axis=0)])
+
+    result = pd.DataFrame({
+        'year': year,
+        'district': np.repeat(districts, len(candidates)),
+        'office': np.tile(candidates['office'].to_numpy(), len(districts)),
+        'candidate': np.tile(candidates['candidate'].to_numpy(), len(districts)),
+        'party': np.tile(candidates['party'].to_numpy(), len(districts)),
+        'votes': totals.ravel().round().astype(np.int64)
+    })
+
+    office_totals = result.groupby(['district', 'office'])['votes'].transform('sum')
+    result['percentage'] = (result['votes'] / office_totals.where(office_totals > 0) * 100).round(1)
+
+    return result
+
+
+def validate_against_correct(result, correct_csv, years=None):
+    """
+    Compare re-aggregated totals with a parsed *_CORRECT.csv file
+
+    Matches on (year, district, office, party) since candidate name
+    spellings differ between sources.
+
+    Returns dict with match counts and the largest vote differences.
+    """
+    correct = pd.read_csv(correct_csv, dtype={'district': str})
+    if years is not None:
+        correct = correct[correct['year'].isin(years)]
+
+    keys = ['year', 'district', 'office', 'party']
+    merged = correct.groupby(keys, as_index=False)['votes'].sum().merge(
+        result.groupby(keys, as_index=False)['votes'].sum(),
+        on=keys, how='inner', suffixes=('_correct', '_vtd')
+    )
+    merged['diff'] = merged['votes_vtd'] - merged['votes_correct']
+
+    return {
+        'compared': len(merged),
+        'exact_matches': int((merged['diff'] == 0).sum()),
+        'within_0_5pct': int((merged['diff'].abs() <= 0.005 * merged['votes_correct'].abs()).sum()),
+        'max_abs_diff': int(merged['diff'].abs().max()) if len(merged) else 0,
+        'worst': merged.reindex(merged['diff'].abs().sort_values(ascending=False).index).head(10)
+    }
+
+
+def main():
+    print("="*80)
+    print("RE-AGGREGATING VTD RETURNS UNDER EVERY DISTRICT PLAN")
+    print("="*80)
+
+    assignment_files = sorted(ASSIGNMENT_DIR.glob("PLAN*.csv")) if ASSIGNMENT_DIR.exists() else []
+    if not assignment_files:
+        print(f"\n✗ No assignment tables found in {ASSIGNMENT_DIR}/")
+        print("  Export each plan's VTD assignment (cntyvtd, district[, weight]) as PLANxxxx.csv")
+        return None
+
+    crosswalks = {}
+    for path in assignment_files:
+        crosswalk = VTDCrosswalk.from_csv(path)
+        crosswalks[crosswalk.plan] = crosswalk
+        print(f"  Loaded {crosswalk.plan}: {len(crosswalk.vtds):,} VTDs -> {len(crosswalk.districts)} districts")
+
+    all_results = []
+
+    for year, csv_path in VTD_RETURNS.items():
+        if not csv_path.exists():
+            print(f"\n  ✗ File not found: {csv_path}")
+            continue
+
+        print(f"\n{'='*80}")
+        print(f"YEAR: {year}")
+        print(f"{'='*80}")
+
+        vote_matrix, vtds, candidates = load_vtd_returns(csv_path)
+        print(f"  Vote matrix: {len(vtds):,} VTDs x {len(candidates)} candidates "
+              f"({vote_matrix.nnz:,} nonzero)")
+
+        for plan, crosswalk in crosswalks.items():
+            result = reaggregate(crosswalk, vote_matrix, vtds, candidates, year)
+            result.insert(1, 'plan', plan)
+            all_results.append(result)
+
+            if plan in CORRECT_OUTPUTS and year in CORRECT_OUTPUTS[plan][2]:
+                check = validate_against_correct(result, CORRECT_OUTPUTS[plan][1], years=[year])
+                print(f"  {plan}: {check['exact_matches']}/{check['compared']} exact, "
+                      f"{check['within_0_5pct']}/{check['compared']} within 0.5%, "
+                      f"max diff {check['max_abs_diff']:,} votes")
+
+    if not all_results:
+        print("\n✗ No VTD returns available")
+        return None
+
+    combined = pd.concat(all_results, ignore_index=True)
+    output = OUTPUT_DIR / "2018_2024_statewide_by_plan_vtd.csv"
+    combined.to_csv(output, index=False)
+
+    print(f"\n✓ Saved to: {output}")
+    print(f"  Total records: {len(combined):,}")
+    print(f"  Plans: {sorted(combined['plan'].unique())}")
+
+    return combined
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,7 @@
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+for path in ('analysis_tools', 'data_collection'):
+    sys.path.insert(0, os.path.join(ROOT, path))
@@ -0,0 +1,106 @@
+"""texas-election strong/crossover match the analyzer on a synthetic vs_top_ticket table"""
+
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+import texas_election
+from district_candidate_analyzer_multiyear import MultiYearDistrictCandidateAnalyzer
+from fact_paths import VS_TOP_TICKET_COLUMNS
+
+# year, district, candidate, party, percentage, vs_top_ticket, partisan_lean,
+# favorable_district, has_major_party_opponent, is_contested
+ROWS = [
+    (2022, '1', 'Able', 'D', 55.0, 6.0, -4.0, False, True, True),
+    (2022, '1', 'Baker', 'R', 45.0, -6.0, -4.0, True, True, True),
+    (2022, '2', 'Cruz', 'R', 100.0, 30.0, -10.0, True, False, False),
+    (2022, '3', 'Diaz', 'D', 48.0, 5.5, -12.0, False, True, True),
+    (2022, '3', 'Ellis', 'R', 52.0, -5.5, -12.0, True, True, True),
+    (2022, '4', 'Ford', 'L', 8.0, float('nan'), 3.0, None, False, True),
+    (2024, '1', 'Able', 'D', 51.0, 2.0, -3.0, False, True, True),
+    (2024, '1', 'Gray', 'R', 49.0, -2.0, -3.0, True, True, True),
+    (2024, '5', 'Hale', 'R', 60.0, 2.0, 8.0, False, False, True),
+    (2024, '5', 'Irwin', 'G', 40.0, 1.0, 8.0, None, False, True),
+]
+
+
+@pytest.fixture
+def table():
+    df = pd.DataFrame(ROWS, columns=[
+        'year', 'district', 'candidate', 'party', 'percentage', 'vs_top_ticket', 'partisan_lean',
+        'favorable_district', 'has_major_party_opponent', 'is_contested'
+    ])
+    df['district_type'] = 'house'
+    df['votes'] = (df['percentage'] * 1000).astype(int)
+    df['top_ticket_candidate'] = 'Top'
+    df['top_ticket_pct'] = df['percentage'] - df['vs_top_ticket']
+    df['partisan_lean_strength'] = df['partisan_lean'].abs()
+    df['is_competitive'] = True
+    df['winning_margin'] = 10.0
+    df['opposition_strength'] = 'moderate'
+    df['favorable_district'] = df['favorable_district'].astype(object)
+    return df[VS_TOP_TICKET_COLUMNS]
+
+
+def analyzer_for(table, use_fact_tables):
+    analyzer = MultiYearDistrictCandidateAnalyzer(use_fact_tables=True)
+    analyzer.use_fact_tables = use_fact_tables
+    analyzer.calculate_vs_top_ticket = lambda district_level='house', year=None, include_rolloff=False: (
+        table[table['year'] == year] if year else table
+    ).reset_index(drop=True)
+    return analyzer
+
+
+def run_cli(monkeypatch, table, command, **options):
+    """(year, district, candidate) rows a texas-election command writes for the table"""
+    rows = table.to_dict('records')
+    monkeypatch.setattr(texas_election, 'vs_top_ticket_rows', lambda level, year=None: [
+        dict(r) for r in rows if not year or r['year'] == year
+    ])
+    written = []
+    monkeypatch.setattr(texas_election, 'write_rows', lambda rows, *a: written.extend(rows))
+
+    args = dict(level='house', year=None, party=None, format='csv', output=None,
+                include_unopposed=False, include_uncontested=False, min_vs_top_ticket=2.0)
+    args.update(options)
+    command(SimpleNamespace(**args))
+    return [(r['year'], r['district'], r['candidate']) for r in written]
+
+
+def keys(df):
+    return list(zip(df['year'], df['district'], df['candidate']))
+
+
+@pytest.mark.parametrize('use_fact_tables', [True, False])
+@pytest.mark.parametrize('options', [
+    {},
+    {'party': 'D'},
+    {'year': 2024},
+    {'include_unopposed': True, 'include_uncontested': True},
+    {'min_vs_top_ticket': 5.5},
+])
+def test_strong_matches_analyzer(monkeypatch, table, use_fact_tables, options):
+    args = {'year': None, 'party': None, 'min_vs_top_ticket': 2.0,
+            'include_unopposed': False, 'include_uncontested': False, **options}
+    expected = analyzer_for(table, use_fact_tables).identify_strong_candidates(
+        year=args['year'], party=args['party'], min_vs_top_ticket=args['min_vs_top_ticket'],
+        require_major_party_opponent=not args['include_unopposed'],
+        require_contested=not args['include_uncontested']
+    )
+    cli = run_cli(monkeypatch, table, texas_election.cmd_strong, **options)
+
+    assert cli
+    assert keys(expected) == cli
+
+
+@pytest.mark.parametrize('use_fact_tables', [True, False])
+@pytest.mark.parametrize('include_unopposed', [False, True])
+def test_crossover_matches_analyzer(monkeypatch, table, use_fact_tables, include_unopposed):
+    expected = analyzer_for(table, use_fact_tables).identify_crossover_appeal_candidates(
+        require_major_party_opponent=not include_unopposed
+    )
+    cli = run_cli(monkeypatch, table, texas_election.cmd_crossover, include_unopposed=include_unopposed)
+
+    assert cli
+    assert keys(expected) == cli
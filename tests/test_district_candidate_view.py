@@ -0,0 +1,64 @@
+"""DistrictCandidateAnalyzer (fact tables) matches the multi-year row-by-row path on the shipped data"""
+
+import contextlib
+import io
+import os
+
+import pandas as pd
+import pytest
+
+from conftest import ROOT
+from district_candidate_analyzer import DistrictCandidateAnalyzer
+from district_candidate_analyzer_multiyear import MultiYearDistrictCandidateAnalyzer
+from fact_paths import RACE_FILES, STATEWIDE_FILES
+
+LEVELS = ['house', 'senate']
+
+QUERIES = {
+    'calculate_vs_top_ticket': lambda a, level, party: a.calculate_vs_top_ticket(level),
+    'identify_strong_candidates': lambda a, level, party: a.identify_strong_candidates(level, party=party),
+    'identify_crossover_appeal_candidates':
+        lambda a, level, party: a.identify_crossover_appeal_candidates(level, party),
+    'generate_recruitment_report': lambda a, level, party: a.generate_recruitment_report(party, level),
+}
+
+CASES = (
+    [('calculate_vs_top_ticket', None)] +
+    [(query, party) for query in ('identify_strong_candidates', 'identify_crossover_appeal_candidates')
+     for party in ('D', 'R', None)] +
+    [('generate_recruitment_report', party) for party in ('D', 'R')]
+)
+
+pytestmark = pytest.mark.skipif(
+    not all(os.path.exists(os.path.join(ROOT, path))
+            for level in LEVELS for path in RACE_FILES[level] + [STATEWIDE_FILES[level]]),
+    reason="results CSVs not available"
+)
+
+
+@pytest.fixture(scope='module')
+def engines():
+    """Fact-table and row-by-row multi-year engines, shared by every view"""
+    cwd = os.getcwd()
+    os.chdir(ROOT)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield (MultiYearDistrictCandidateAnalyzer(),
+                   MultiYearDistrictCandidateAnalyzer(use_fact_tables=False))
+    finally:
+        os.chdir(cwd)
+
+
+@pytest.mark.parametrize('year', [2020, 2024])
+@pytest.mark.parametrize('level', LEVELS)
+@pytest.mark.parametrize('query, party', CASES)
+def test_view_matches_row_path(engines, year, level, party, query):
+    fast_engine, slow_engine = engines
+    fast = DistrictCandidateAnalyzer(year, fast_engine)
+    slow = DistrictCandidateAnalyzer(year, slow_engine)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        expected = QUERIES[query](slow, level, party).reset_index(drop=True)
+        actual = QUERIES[query](fast, level, party).reset_index(drop=True)
+
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
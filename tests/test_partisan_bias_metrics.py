@@ -0,0 +1,25 @@
+"""Partisan bias metrics against hand-computed values"""
+
+import numpy as np
+import pytest
+
+from partisan_bias_metrics import declination
+
+
+def test_declination_hand_computed():
+    # D wins 2 of 6 (mean 0.725), R wins 4 (mean D share 0.375):
+    # theta_D = atan(0.45 / (2/6)), theta_R = atan(0.25 / (4/6))
+    shares = np.array([[0.30, 0.35, 0.40, 0.45, 0.70, 0.75]])
+    expected = 2 * (np.arctan(1.35) - np.arctan(0.375)) / np.pi
+    assert declination(shares)[0] == pytest.approx(expected)
+    assert declination(shares)[0] == pytest.approx(0.3657, abs=1e-4)
+
+
+def test_declination_symmetric_plan_is_zero():
+    shares = np.array([[0.30, 0.40, 0.60, 0.70]])
+    assert declination(shares)[0] == pytest.approx(0.0)
+
+
+def test_declination_nan_when_one_party_wins_everything():
+    shares = np.array([[0.55, 0.60, 0.70]])
+    assert np.isnan(declination(shares)[0])
@@ -0,0 +1,41 @@
+"""RankingIndex / top_k ordering and top_n bounds"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ranking_index import RankingIndex, top_k
+
+
+@pytest.fixture
+def index():
+    df = pd.DataFrame({
+        'party': ['D', 'R', 'D', 'R'],
+        'year': [2022, 2022, 2024, 2024],
+        'score': [3.0, np.nan, 5.0, 1.0]
+    })
+    return RankingIndex(df, 'score', masks={'positive': df['score'] > 2})
+
+
+def test_positions_order_and_filters(index):
+    assert list(index.positions()) == [2, 0, 3, 1]
+    assert list(index.positions(top_n=2)) == [2, 0]
+    assert list(index.positions(party='R')) == [3, 1]
+    assert list(index.positions(year=2024, min_score=2)) == [2]
+    assert list(index.positions(where=['positive'])) == [2, 0]
+
+
+@pytest.mark.parametrize('top_n', [0, -1])
+def test_positions_rejects_top_n_below_one(index, top_n):
+    with pytest.raises(ValueError, match='top_n'):
+        index.positions(top_n=top_n)
+
+
+def test_top_k():
+    values = [1.0, np.nan, 3.0, 3.0, 2.0]
+    assert list(top_k(values)) == [2, 3, 4, 0, 1]
+    assert list(top_k(values, 2)) == [2, 3]
+    assert list(top_k(values, 10)) == [2, 3, 4, 0, 1]
+    for k in (0, -1):
+        with pytest.raises(ValueError, match='k'):
+            top_k(values, k)
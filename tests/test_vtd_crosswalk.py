@@ -0,0 +1,85 @@
+"""Synthetic VTD returns / assignment fixture for vtd_crosswalk"""
+
+import pandas as pd
+import pytest
+
+from vtd_crosswalk import VTDCrosswalk, load_vtd_returns, reaggregate, validate_against_correct
+
+# Same layout and office labels as the TLC General_Election_Returns.csv files
+RETURNS = [
+    # cntyvtd, Office, Name, Party, Votes
+    ('0010001', 'President', 'Biden', 'D', 100),
+    ('0010001', 'President', 'Trump', 'R', 300),
+    ('0010001', 'U.S. Sen', 'Hegar', 'D', 90),
+    ('0010001', 'U.S. Sen', 'Cornyn', 'R', 310),
+    ('0010001', 'U.S. Rep 1', 'Gohmert', 'R', 305),
+    ('0010002', 'President', 'Biden', 'D', 200),
+    ('0010002', 'President', 'Trump', 'R', 200),
+    ('0010002', 'U.S. Sen', 'Hegar', 'D', 180),
+    ('0010002', 'U.S. Sen', 'Cornyn', 'R', 220),
+    ('0010003', 'President', 'Biden', 'D', 400),
+    ('0010003', 'President', 'Trump', 'R', 100),
+    ('0010003', 'Lt. Governor', 'Collier', 'D', 50),
+    ('0010003', 'Attorney Gen', 'Garza', 'D', 40),
+    ('0010003', 'Governor', 'Valdez', 'D', 30),
+]
+
+# VTD 0010002 is split evenly between districts 1 and 2
+ASSIGNMENT = [
+    ('0010001', '1', 1.0),
+    ('0010002', '1', 0.5),
+    ('0010002', '2', 0.5),
+    ('0010003', '2', 1.0),
+]
+
+
+@pytest.fixture
+def crosswalk_inputs(tmp_path):
+    returns_csv = tmp_path / '2020_General_Election_Returns.csv'
+    pd.DataFrame(RETURNS, columns=['cntyvtd', 'Office', 'Name', 'Party', 'Votes']).to_csv(returns_csv, index=False)
+    assignment_csv = tmp_path / 'PLANTEST.csv'
+    pd.DataFrame(ASSIGNMENT, columns=['cntyvtd', 'district', 'weight']).to_csv(assignment_csv, index=False)
+    return returns_csv, assignment_csv
+
+
+def test_reaggregate_maps_offices_and_splits_vtds(crosswalk_inputs):
+    returns_csv, assignment_csv = crosswalk_inputs
+    crosswalk = VTDCrosswalk.from_csv(assignment_csv)
+    vote_matrix, vtds, candidates = load_vtd_returns(returns_csv)
+
+    assert crosswalk.plan == 'PLANTEST'
+    assert set(candidates['office']) == {
+        'President', 'U.S. Senate', 'Lieutenant Governor', 'Attorney General', 'Governor'
+    }
+
+    result = reaggregate(crosswalk, vote_matrix, vtds, candidates, 2020)
+    votes = result.set_index(['district', 'office', 'candidate'])['votes']
+
+    assert votes[('1', 'President', 'Biden')] == 200
+    assert votes[('2', 'President', 'Biden')] == 500
+    assert votes[('STATE', 'President', 'Biden')] == 700
+    assert votes[('1', 'U.S. Senate', 'Cornyn')] == 420
+    assert votes[('2', 'Lieutenant Governor', 'Collier')] == 50
+
+    pct = result.set_index(['district', 'office', 'candidate'])['percentage']
+    assert pct[('1', 'President', 'Trump')] == pytest.approx(66.7)
+
+
+def test_validate_against_correct(crosswalk_inputs, tmp_path):
+    returns_csv, assignment_csv = crosswalk_inputs
+    crosswalk = VTDCrosswalk.from_csv(assignment_csv)
+    result = reaggregate(crosswalk, *load_vtd_returns(returns_csv), 2020)
+
+    # Parsed file spells candidates differently; matching is on party
+    correct = result.assign(candidate=result['candidate'].str.upper())
+    correct.loc[(correct['district'] == '2') & (correct['candidate'] == 'TRUMP'), 'votes'] += 7
+    correct = pd.concat([correct, correct.assign(year=2018)], ignore_index=True)
+    correct_csv = tmp_path / 'CORRECT.csv'
+    correct.to_csv(correct_csv, index=False)
+
+    check = validate_against_correct(result, correct_csv, years=[2020])
+
+    assert check['compared'] == result.groupby(['district', 'office', 'party']).ngroups
+    assert check['exact_matches'] == check['compared'] - 1
+    assert check['max_abs_diff'] == 7
+    assert check['worst'].iloc[0]['district'] == '2'
@@ -0,0 +1,451 @@
+"""
+texas-election: Command-Line Entry Point
+
+One CLI over the analysis tools and data collection scripts:
+
+    python texas_election.py strong --level house --year 2024 --party D
+    python texas_election.py crossover --year 2022 --format json
+    python texas_election.py track Talarico
+    python texas_election.py war --party D --top-n 10
+    python texas_election.py war --career --min-races 2
+    python texas_election.py compare-years 2018 2022 --party D
+    python texas_election.py parse house-statewide senate-statewide
+    python texas_election.py verify senate --strict
+
+Lookups (strong, crossover, track) read the materialized fact tables with
+pyarrow only, so they never import pandas, numpy or sklearn. Every other
+module is imported inside the subcommand that needs it. Run from the
+repository root, like the other scripts.
+
+Results go to stdout as CSV (default) or JSON, or to --output as CSV, JSON
+or Parquet. Progress messages from the analyzers go to stderr.
+
+--profile-imports prints how long each lazy import took and the total
+wall time to stderr. --events FILE appends per-stage timing/memory events
+(see analysis_tools/instrumentation.py) as JSON Lines, --stage-summary
+prints where the run spent its time, and --quiet drops per-page and
+per-district progress messages.
+"""
+
+import sys
+import time
+
+_START = time.perf_counter()
+
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+import argparse
+import contextlib
+import importlib
+import importlib.util
+import math
+import os
+import re
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+ANALYSIS_TOOLS = os.path.join(ROOT, 'analysis_tools')
+DATA_COLLECTION = os.path.join(ROOT, 'data_collection')
+sys.path.insert(0, ANALYSIS_TOOLS)
+
+LEVELS = ['house', 'senate', 'congressional']
+FORMATS = ['csv', 'json', 'parquet']
+
+# parse target -> data_collection script
+PARSERS = {
+    'house-statewide': 'parse_house_statewide_CORRECT.py',
+    'senate-statewide': 'parse_senate_districts_CORRECT.py',
+    'congressional-statewide': 'parse_congressional_statewide_CORRECT.py',
+    'district-races-2024': 'parse_district_races_2024.py',
+    'district-races-vtd': 'parse_vtd_district_races.py',
+    'congressional-races': 'parse_congressional_races.py',
+    'campaign-finance': 'parse_tec_campaign_finance.py'
+}
+
+TRACK_COLUMNS = [
+    'year', 'district', 'candidate', 'party', 'percentage',
+    'top_ticket_candidate', 'top_ticket_pct', 'vs_top_ticket',
+    'partisan_lean', 'has_major_party_opponent', 'opposition_strength',
+    'winning_margin'
+]
+
+_import_times = []
+
+
+def lazy_import(name):
+    """Import a module on first use, recording how long it took"""
+    if name in sys.modules:
+        return sys.modules[name]
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    _import_times.append((name, time.perf_counter() - start))
+    return module
+
+
+def report_imports():
+    """Print lazy import times and total wall time to stderr"""
+    print("\nImport profile:", file=sys.stderr)
+    for name, seconds in _import_times:
+        print(f"  {seconds * 1000:8.1f} ms  {name}", file=sys.stderr)
+    heavy = [m for m in ('pandas', 'numpy', 'sklearn') if m in sys.modules]
+    print(f"  Heavy modules loaded: {', '.join(heavy) or 'none'}", file=sys.stderr)
+    print(f"  Total: {(time.perf_counter() - _START) * 1000:.1f} ms "
+          f"(use python -X importtime for a full breakdown)", file=sys.stderr)
+
+
+# ----------------------------------------------------------------------
+# Fact table access (pyarrow, falling back to pandas)
+# ----------------------------------------------------------------------
+
+def fact_rows(level, columns=None):
+    """
+    Rows of a level's fact table as a list of dicts
+
+    Materializes the table first (importing pandas) only if the inputs
+    changed since it was last written. Without pyarrow the table is built
+    in memory through pandas instead.
+    """
+    if importlib.util.find_spec('pyarrow') is None:
+        with contextlib.redirect_stdout(sys.stderr):
+            facts = lazy_import('fact_tables').load_fact_table(level)
+        if columns:
+            facts = facts[columns]
+        return facts.astype(object).where(facts.notna(), None).to_dict('records')
+
+    fact_paths = lazy_import('fact_paths')
+    path = fact_paths.fact_table_path(level)
+    if not path.exists():
+        print(f"Fact table for {level} is missing or stale; rebuilding...", file=sys.stderr)
+        with contextlib.redirect_stdout(sys.stderr):
+            lazy_import('fact_tables').materialize(level)
+
+    parquet = lazy_import('pyarrow.parquet')
+    return parquet.ParquetFile(path).read(columns=columns).to_pylist()
+
+
+def vs_top_ticket_rows(level, year=None):
+    """Rows of calculate_vs_top_ticket() for a level (and optional year)"""
+    columns = [c if c != 'district_type' else 'district_level'
+               for c in lazy_import('fact_paths').VS_TOP_TICKET_COLUMNS]
+    rows = []
+    for row in fact_rows(level, columns):
+        if row['top_ticket_pct'] is None or (year and row['year'] != year):
+            continue
+        row['district_type'] = row.pop('district_level')
+        rows.append(row)
+    return rows
+
+
+def is_missing(value):
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def sort_rows(rows, *keys):
+    """Stable descending sort on one or more numeric keys (missing values last)"""
+    for key in reversed(keys):
+        rows.sort(key=lambda r: (1, 0) if is_missing(r[key]) else (0, -r[key]))
+    return rows
+
+
+# ----------------------------------------------------------------------
+# Output
+# ----------------------------------------------------------------------
+
+def write_rows(rows, columns, fmt, output):
+    """Write a list of dicts as CSV, JSON or Parquet"""
+    rows = [{c: (None if is_missing(r[c]) else r[c]) for c in columns} for r in rows]
+
+    if fmt == 'parquet':
+        pa = lazy_import('pyarrow')
+        table = pa.Table.from_pylist(rows) if rows else pa.table({c: [] for c in columns})
+        lazy_import('pyarrow.parquet').write_table(table, output)
+        return
+
+    stream = open(output, 'w', newline='', encoding='utf-8') if output else sys.stdout
+    try:
+        if fmt == 'json':
+            import json
+            json.dump(rows, stream, indent=2)
+            stream.write('\n')
+        else:
+            import csv
+            writer = csv.DictWriter(stream, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(rows)
+    finally:
+        if output:
+            stream.close()
+
+
+def write_frame(frame, fmt, output):
+    """Write a pandas DataFrame as CSV, JSON or Parquet"""
+    if fmt == 'parquet':
+        frame.to_parquet(output, index=False)
+    elif fmt == 'json':
+        text = frame.to_json(orient='records', indent=2)
+        if output:
+            with open(output, 'w', encoding='utf-8') as f:
+                f.write(text + '\n')
+        else:
+            print(text)
+    else:
+        frame.to_csv(output or sys.stdout, index=False)
+
+
+# ----------------------------------------------------------------------
+# Subcommands
+# ----------------------------------------------------------------------
+
+def cmd_strong(args):
+    """Same filters (shared via fact_paths) and order as identify_strong_candidates()"""
+    fact_paths = lazy_import('fact_paths')
+    rows = [
+        r for r in vs_top_ticket_rows(args.level, args.year)
+        if fact_paths.strong_candidate_filter(
+            r, args.min_vs_top_ticket, args.party,
+            require_major_party_opponent=not args.include_unopposed,
+            require_contested=not args.include_uncontested
+        )
+    ]
+    write_rows(sort_rows(rows, 'vs_top_ticket'), fact_paths.VS_TOP_TICKET_COLUMNS,
+               args.format, args.output)
+
+
+def cmd_crossover(args):
+    """Same filters (shared via fact_paths) and order as identify_crossover_appeal_candidates()"""
+    fact_paths = lazy_import('fact_paths')
+    rows = [
+        r for r in vs_top_ticket_rows(args.level, args.year)
+        if fact_paths.crossover_candidate_filter(
+            r, args.party, require_major_party_opponent=not args.include_unopposed
+        )
+    ]
+    write_rows(sort_rows(rows, 'partisan_lean_strength', 'vs_top_ticket'),
+               fact_paths.VS_TOP_TICKET_COLUMNS, args.format, args.output)
+
+
+def cmd_track(args):
+    """Same matching and columns as track_candidate_over_time()"""
+    pattern = re.compile(args.name, re.IGNORECASE)
+    rows = [r for r in vs_top_ticket_rows(args.level)
+            if r['candidate'] and pattern.search(r['candidate'])]
+    if not rows:
+        print(f"No candidates found matching '{args.name}'", file=sys.stderr)
+    rows.sort(key=lambda r: r['year'])
+    write_rows(rows, TRACK_COLUMNS, args.format, args.output)
+
+
+def cmd_war(args):
+    with contextlib.redirect_stdout(sys.stderr):
+        model = lazy_import('political_war_model').PoliticalWARModel(use_rolloff=args.rolloff)
+        try:
+            model.calculate_war_scores()
+        except ValueError as e:
+            sys.exit(f"war: {e}")
+        if args.career:
+            model.calculate_career_war()
+            result = model.get_top_career_performers(
+                party=args.party, district_level=args.level,
+                min_races=args.min_races, top_n=args.top_n
+            )
+        else:
+            result = model.get_top_performers(
+                party=args.party, year=args.year, min_war=args.min_war, top_n=args.top_n
+            )
+    write_frame(result, args.format, args.output)
+
+
+def cmd_compare_years(args):
+    with contextlib.redirect_stdout(sys.stderr):
+        analyzer = lazy_import('district_candidate_analyzer_multiyear').MultiYearDistrictCandidateAnalyzer()
+        result = analyzer.compare_years(args.year1, args.year2, district_level=args.level, party=args.party)
+    write_frame(result, args.format, args.output)
+
+
+def run_script(path):
+    """Run a data_collection script as if invoked directly"""
+    runpy = lazy_import('runpy')
+    sys.path.insert(0, os.path.dirname(path))
+    try:
+        runpy.run_path(path, run_name='__main__')
+    finally:
+        sys.path.remove(os.path.dirname(path))
+
+
+def cmd_parse(args):
+    for target in args.targets:
+        print(f"\n>>> parse {target}")
+        run_script(os.path.join(DATA_COLLECTION, PARSERS[target]))
+
+    if not args.no_materialize:
+        fact_tables = lazy_import('fact_tables')
+        for level in LEVELS:
+            fact_tables.materialize(level)
+
+
+def cmd_verify(args):
+    sys.path.insert(0, DATA_COLLECTION)
+    validate_data = lazy_import('validate_data')
+    datasets = [name for level in (args.levels or LEVELS) for name in validate_data.datasets_for_level(level)]
+    report = validate_data.validate(datasets)
+
+    if args.format == 'json':
+        import json
+        text = json.dumps(report, indent=2)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                f.write(text + '\n')
+        else:
+            print(text)
+    else:
+        validate_data.print_report(report)
+
+    if args.strict and not report['summary']['ok']:
+        sys.exit(1)
+
+
+def name_pattern(value):
+    # Reject a bad regular expression as a usage error, not a traceback
+    try:
+        re.compile(value)
+    except re.error as e:
+        raise argparse.ArgumentTypeError(f"invalid pattern '{value}': {e}")
+    return value
+
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def verify_level(value):
+    # argparse rejects an empty nargs='*' list when choices are given
+    if value not in LEVELS:
+        raise argparse.ArgumentTypeError(f"invalid level '{value}' (choose from {', '.join(LEVELS)})")
+    return value
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='texas-election',
+        description="Texas election analysis: candidate lookups, WAR, parsing and verification"
+    )
+    parser.add_argument('--profile-imports', action='store_true',
+                        help="Print lazy import times and total wall time to stderr")
+    parser.add_argument('--events', metavar='FILE',
+                        help="Append stage timing/memory events to FILE as JSON Lines")
+    parser.add_argument('--stage-summary', action='store_true',
+                        help="Print time, rows and peak memory per stage to stderr")
+    parser.add_argument('--quiet', '-q', action='store_true',
+                        help="Drop per-page and per-district progress messages")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    def add_output(sub):
+        sub.add_argument('--format', choices=FORMATS, default='csv')
+        sub.add_argument('--output', '-o', help="Output file (required for parquet; default stdout)")
+
+    def add_level(sub, default='house'):
+        sub.add_argument('--level', choices=LEVELS, default=default)
+
+    sub = commands.add_parser('strong', help="Candidates outperforming their top of ticket")
+    add_level(sub)
+    sub.add_argument('--year', type=int)
+    sub.add_argument('--party', choices=['D', 'R'])
+    sub.add_argument('--min-vs-top-ticket', type=float, default=2.0)
+    sub.add_argument('--include-unopposed', action='store_true',
+                     help="Keep races without both a D and an R")
+    sub.add_argument('--include-uncontested', action='store_true',
+                     help="Keep single-candidate races")
+    add_output(sub)
+    sub.set_defaults(func=cmd_strong)
+
+    sub = commands.add_parser('crossover', help="Candidates who won or overperformed in unfavorable districts")
+    add_level(sub)
+    sub.add_argument('--year', type=int)
+    sub.add_argument('--party', choices=['D', 'R'])
+    sub.add_argument('--include-unopposed', action='store_true',
+                     help="Keep races without both a D and an R")
+    add_output(sub)
+    sub.set_defaults(func=cmd_crossover)
+
+    sub = commands.add_parser('track', help="One candidate's races across years")
+    sub.add_argument('name', type=name_pattern,
+                     help="Candidate name or pattern (case-insensitive regular expression)")
+    add_level(sub)
+    add_output(sub)
+    sub.set_defaults(func=cmd_track)
+
+    sub = commands.add_parser('war', help="Wins Above Replacement rankings")
+    sub.add_argument('--party', choices=['D', 'R'])
+    sub.add_argument('--year', type=int)
+    sub.add_argument('--min-war', type=float)
+    sub.add_argument('--top-n', type=positive_int, default=20)
+    sub.add_argument('--career', action='store_true', help="Rank career WAR instead of single races")
+    sub.add_argument('--level', choices=LEVELS, help="District level (career rankings only)")
+    sub.add_argument('--min-races', type=int, default=1, help="Minimum races (career rankings only)")
+    sub.add_argument('--rolloff', action='store_true', help="Include race roll-off rate as a WAR feature")
+    add_output(sub)
+    sub.set_defaults(func=cmd_war)
+
+    sub = commands.add_parser('compare-years', help="District-by-district change between two years")
+    sub.add_argument('year1', type=int)
+    sub.add_argument('year2', type=int)
+    add_level(sub)
+    sub.add_argument('--party', choices=['D', 'R'])
+    add_output(sub)
+    sub.set_defaults(func=cmd_compare_years)
+
+    sub = commands.add_parser('parse', help="Re-run data_collection parsers, then refresh fact tables")
+    sub.add_argument('targets', nargs='+', choices=sorted(PARSERS))
+    sub.add_argument('--no-materialize', action='store_true', help="Skip rebuilding fact tables")
+    sub.set_defaults(func=cmd_parse)
+
+    sub = commands.add_parser('verify', help="Validate the results datasets (data_collection/validate_data.py)")
+    sub.add_argument('levels', nargs='*', type=verify_level, metavar='level',
+                     help=f"One or more of {', '.join(LEVELS)} (default: all)")
+    sub.add_argument('--format', choices=['text', 'json'], default='text',
+                     help="Printed summary or the JSON report")
+    sub.add_argument('--output', '-o', help="Write the JSON report to this file instead of stdout")
+    sub.add_argument('--strict', action='store_true', help="Exit with status 1 on any validation error")
+    sub.set_defaults(func=cmd_verify)
+
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if getattr(args, 'format', None) == 'parquet' and not args.output:
+        parser.error("--format parquet requires --output")
+
+    instrumentation = sink = None
+    if args.events or args.stage_summary or args.quiet:
+        instrumentation = lazy_import('instrumentation')
+        if args.quiet:
+            instrumentation.set_quiet(True)
+        if args.events:
+            sink = instrumentation.add_sink(instrumentation.JsonLinesSink(args.events))
+
+    try:
+        if instrumentation:
+            with instrumentation.stage('command', args.command):
+                args.func(args)
+        else:
+            args.func(args)
+    except BrokenPipeError:
+        # Output piped into head etc.: silence the flush at exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    finally:
+        if args.profile_imports:
+            report_imports()
+        if args.stage_summary:
+            instrumentation.print_summary(file=sys.stderr)
+        if sink:
+            instrumentation.remove_sink(sink)
+
+
+if __name__ == "__main__":
+    main()